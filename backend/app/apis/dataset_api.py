@@ -1,9 +1,11 @@
-from fastapi import APIRouter, UploadFile, Depends, Query
+from fastapi import APIRouter, UploadFile, Depends, Query, Response
 from typing import List, Optional
-from app.apis.models import FileValidationRequest
+from app.apis.models import FileValidationRequest, BulkDeleteRequest, BulkStatusRequest
 from app.validation import validate_zip_file
 from app.tasks.main import valid_archive_task
 from app.services.dataset_service import get_dataset_service, DataSetService
+from app.config import LIST_PAGE_SIZE, LIST_PAGE_SIZE_MAX
+from app.util import parse_fields
 
 
 router = APIRouter()
@@ -28,13 +30,37 @@ async def delete_file(
     return {"result": result}
 
 
+# 파일 일괄 삭제
+@router.post("/bulk/delete", response_model=dict)
+async def delete_files(
+    request: BulkDeleteRequest,
+    dataset_service: DataSetService = Depends(get_dataset_service)
+):
+    count = await dataset_service.delete_files(request.ids)
+    return {"result": True, "count": count}
+
+
+# 파일 상태 일괄 변경
+@router.post("/bulk/status", response_model=dict)
+async def update_file_statuses(
+    request: BulkStatusRequest,
+    dataset_service: DataSetService = Depends(get_dataset_service)
+):
+    count = await dataset_service.update_statuses(request.ids, request.status)
+    return {"result": True, "count": count}
+
+
 # 파일 목록
 @router.get("/list", response_model=List[dict])
 async def get_file_list(
+    response: Response,
     last_id: Optional[int] = Query(None),
+    limit: int = Query(LIST_PAGE_SIZE, ge=1, le=LIST_PAGE_SIZE_MAX),
+    fields: Optional[str] = Query(None),  # 콤마로 구분된 필드 목록 (ex. id,file_name,status)
     dataset_service: DataSetService = Depends(get_dataset_service)
 ):
-    return await dataset_service.get_file_list(last_id=last_id)
+    response.headers["X-Total-Count"] = str(await dataset_service.get_file_count())
+    return await dataset_service.get_file_list(last_id=last_id, limit=limit, fields=parse_fields(fields))
 
 
 # 파일 유효성 검사 시작
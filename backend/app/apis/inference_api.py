@@ -1,12 +1,15 @@
-from fastapi import APIRouter, UploadFile, Depends, Query
+from fastapi import APIRouter, UploadFile, Depends, Query, Response
 from typing import List, Optional
-from app.apis.models import InferenceGenerateRequest
+from app.apis.models import InferenceGenerateRequest, BulkDeleteRequest, BulkStatusRequest
 from app.validation import validate_inference_file
 from app.services.inference_service import get_inference_service, InferenceService
 from app.services.ml_service import MlService, get_ml_service
 from app.tasks.main import generate_inference_task
+from app.config import LIST_PAGE_SIZE, LIST_PAGE_SIZE_MAX, INFERENCE_PHOTO_PRIORITY, INFERENCE_VIDEO_PRIORITY
+from app.entity import FileType
+from app.util import parse_fields
+from app.exceptions import NotFoundException
 from fastapi.responses import FileResponse
-import os
 
 
 router = APIRouter()
@@ -28,14 +31,48 @@ async def generate_inference_file(
     inference_service: InferenceService = Depends(get_inference_service),
     ml_service: MlService = Depends(get_ml_service)
 ):
+    model = await ml_service.get_model_meta(request.m_id)  # 캐시 조회
+    if model is None:
+        raise NotFoundException(f"Model with ID '{request.m_id}' not found.")
+
+    # 사진은 비디오보다 먼저 처리되도록 inference 큐 내 우선순위를 높인다.
+    file = await inference_service.get_file_by_id(request.inference_file_id)
+    priority = INFERENCE_PHOTO_PRIORITY if file['file_type'] == FileType.PHOTO.value else INFERENCE_VIDEO_PRIORITY
+
+    # 추론 결과 캐시는 Triton에 배포된 모델 파일 기준 (DB 버전은 재학습 등록 시 먼저 올라가므로 사용하지 않음)
+    # 미배포 상태(재학습 중 포함)이면 캐시를 읽거나 쓰지 않는다.
+    deployment = model.get('deploy_digest') if model['is_deploy'] else None
+
     await inference_service.update_status(request.inference_file_id, 'pending')
-    classes = await ml_service.get_model_classes(request.m_id)
-    model = await ml_service.get_model_by_id(request.m_id)
-    model_name = model['model_name']
-    generate_inference_task.delay(request.inference_file_id, model_name, classes)
+    generate_inference_task.apply_async(
+        args=(request.inference_file_id, model['model_name'], model['classes'], deployment, request.options),
+        priority=priority
+    )
     return {'result': True}
 
 
+# 대기/실행 중인 추론 취소 (부분 결과는 삭제되고 cancelled 상태가 됨)
+@router.post("/{inference_file_id}/cancel", response_model=dict)
+async def cancel_inference(
+    inference_file_id: int,
+    inference_service: InferenceService = Depends(get_inference_service)
+):
+    await inference_service.cancel_inference(inference_file_id)
+    return {'result': True}
+
+
+# 프레임별 검출 결과 조회 (start/end: 초, classes: 클래스 이름 또는 ID 목록, 콤마 구분)
+@router.get("/{inference_file_id}/detections", response_model=dict)
+async def get_detections(
+    inference_file_id: int,
+    start: Optional[float] = Query(None, ge=0),
+    end: Optional[float] = Query(None, ge=0),
+    classes: Optional[str] = None,
+    inference_service: InferenceService = Depends(get_inference_service)
+):
+    return await inference_service.get_detections(inference_file_id, start, end, parse_fields(classes))
+
+
 # 파일 삭제
 @router.delete("/{inference_file_id}", response_model=dict)
 async def delete_file(
@@ -46,13 +83,37 @@ async def delete_file(
     return {'result': True}
 
 
+# 파일 일괄 삭제
+@router.post("/bulk/delete", response_model=dict)
+async def delete_files(
+    request: BulkDeleteRequest,
+    inference_service: InferenceService = Depends(get_inference_service)
+):
+    count = await inference_service.delete_files(request.ids)
+    return {'result': True, 'count': count}
+
+
+# 파일 상태 일괄 변경
+@router.post("/bulk/status", response_model=dict)
+async def update_file_statuses(
+    request: BulkStatusRequest,
+    inference_service: InferenceService = Depends(get_inference_service)
+):
+    count = await inference_service.update_statuses(request.ids, request.status)
+    return {'result': True, 'count': count}
+
+
 # 파일 목록
 @router.get("/list", response_model=List[dict])
 async def get_file_list(
+    response: Response,
     last_id: Optional[int] = Query(None),
+    limit: int = Query(LIST_PAGE_SIZE, ge=1, le=LIST_PAGE_SIZE_MAX),
+    fields: Optional[str] = Query(None),  # 콤마로 구분된 필드 목록 (ex. id,original_file_name,status)
     inference_service: InferenceService = Depends(get_inference_service)
 ):
-    return await inference_service.get_file_list(last_id=last_id)
+    response.headers["X-Total-Count"] = str(await inference_service.get_file_count())
+    return await inference_service.get_file_list(last_id=last_id, limit=limit, fields=parse_fields(fields))
 
 
 # 파일 상태
@@ -67,7 +128,7 @@ async def download_file(
     file_id: int,
     inference_service: InferenceService = Depends(get_inference_service)
 ):
-    file_path = await inference_service.get_file_path(file_id)
+    file_path, file_name = await inference_service.get_download_file(file_id)
 
-    # 파일 응답 반환
-    return FileResponse(path=file_path, filename=os.path.basename(file_path), media_type='application/octet-stream')
+    # 파일 응답 반환 (저장 경로가 아닌 업로드/생성 시의 파일명으로 내려준다)
+    return FileResponse(path=file_path, filename=file_name, media_type='application/octet-stream')
@@ -1,8 +1,10 @@
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Response
 from app.services.ml_service import get_ml_service, MlService
 from app.services.dataset_service import get_dataset_service, DataSetService
-from app.apis.models import ModelCreateRequest, ModelDeployRequest
+from app.apis.models import ModelCreateRequest, ModelDeployRequest, BulkDeleteRequest, BulkStatusRequest, TrainingProfileRequest
 from app.tasks.main import create_model_task, deploy_model_task, undeploy_model_task
+from app.config import LIST_PAGE_SIZE, LIST_PAGE_SIZE_MAX
+from app.util import parse_fields
 from typing import List, Optional
 
 
@@ -11,10 +13,11 @@ router = APIRouter()
 
 @router.post('/create', response_model=dict)
 async def create_ml_model(request: ModelCreateRequest, ml_service: MlService = Depends(get_ml_service), dataset_service: DataSetService = Depends(get_dataset_service)):
+    options = await ml_service.resolve_training_options(request.profile, request.options)  # 학습 설정 (기본값 < 프로필 < 요청 값)
     version = await ml_service.init_model(request.m_name, request.b_m_name)
     zip_files = [await dataset_service.get_dataset_by_id(zip_file_id) for zip_file_id in request.zip_files]
     zip_file_paths = [zip_file['file_meta']['filepath'] for zip_file in zip_files]
-    create_model_task.delay(request.m_name, request.m_ext, version, zip_file_paths)
+    create_model_task.delay(request.m_name, request.m_ext, version, zip_file_paths, options)
 
     return { 'result': True }
     
@@ -35,6 +38,46 @@ async def undeploy_ml_model(request: ModelDeployRequest, ml_service: MlService =
     return { 'result': True }
 
 
+# 대기/실행 중인 학습 취소 (epoch 종료 시점에 중단되고 cancelled 상태가 됨)
+@router.post('/cancel', response_model=dict)
+async def cancel_ml_model(request: ModelDeployRequest, ml_service: MlService = Depends(get_ml_service)):
+    await ml_service.cancel_model(request.m_id)
+
+    return { 'result': True }
+
+
+# 학습 프로필 저장 (같은 이름이면 덮어씀)
+@router.post('/profile', response_model=dict)
+async def save_training_profile(request: TrainingProfileRequest, ml_service: MlService = Depends(get_ml_service)):
+    return await ml_service.save_profile(request.name, request.options)
+
+
+@router.get('/profile/list', response_model=List[dict])
+async def get_training_profile_list(ml_service: MlService = Depends(get_ml_service)):
+    return await ml_service.get_profile_list()
+
+
+@router.delete('/profile/{name}', response_model=dict)
+async def delete_training_profile(name: str, ml_service: MlService = Depends(get_ml_service)):
+    await ml_service.delete_profile(name)
+
+    return { 'result': True }
+
+
+@router.post('/bulk/delete', response_model=dict)
+async def delete_ml_models(request: BulkDeleteRequest, ml_service: MlService = Depends(get_ml_service)):
+    count = await ml_service.delete_models(request.ids)
+
+    return { 'result': True, 'count': count }
+
+
+@router.post('/bulk/status', response_model=dict)
+async def update_ml_statuses(request: BulkStatusRequest, ml_service: MlService = Depends(get_ml_service)):
+    count = await ml_service.update_statuses(request.ids, request.status)
+
+    return { 'result': True, 'count': count }
+
+
 @router.get('/status', response_model=List[dict])
 async def get_ml_status(ml_service: MlService = Depends(get_ml_service)):
     ml_status_list = await ml_service.get_model_status()
@@ -44,9 +87,13 @@ async def get_ml_status(ml_service: MlService = Depends(get_ml_service)):
 
 @router.get('/list', response_model=List[dict])
 async def get_ml_list(
+    response: Response,
     last_id: Optional[int] = Query(None),
+    limit: int = Query(LIST_PAGE_SIZE, ge=1, le=LIST_PAGE_SIZE_MAX),
+    fields: Optional[str] = Query(None),  # 콤마로 구분된 필드 목록 (ex. id,model_name,status)
     ml_service: MlService = Depends(get_ml_service)
 ):
-    ml_list = await ml_service.get_model_list(last_id=last_id)
+    response.headers["X-Total-Count"] = str(await ml_service.get_model_count())
+    ml_list = await ml_service.get_model_list(last_id=last_id, limit=limit, fields=parse_fields(fields))
     
     return ml_list
\ No newline at end of file
@@ -1,5 +1,6 @@
-from pydantic import BaseModel
-from typing import Optional, List
+from pydantic import BaseModel, Field, field_validator
+from typing import Optional, List, Literal, Union
+from app.entity import Status
 
 
 class FileValidationRequest(BaseModel):
@@ -10,11 +11,47 @@ class ModelDeployRequest(BaseModel):
     m_id: int  # 모델 이름
 
 
-class ModelCreateRequest(BaseModel):
+class TrainingOptionsFields(BaseModel):
+    """학습 설정 (지정하지 않은 값은 프로필 또는 기본값 사용)"""
+    epochs: Optional[int] = Field(None, ge=1, le=1000)
+    batch: Optional[Union[int, float]] = None  # -1: auto-batch, 0 ~ 1: 사용할 GPU 메모리 비율, 1 이상: 배치 크기
+    imgsz: Optional[int] = Field(None, ge=32, le=2048)
+    workers: Optional[int] = Field(None, ge=0, le=32)
+    cache: Optional[Literal['ram', 'disk']] = None
+    amp: Optional[bool] = None
+    patience: Optional[int] = Field(None, ge=0)
+    device: Optional[str] = Field(None, pattern=r'^(auto|cpu|cuda(:\d+)?|\d+(,\d+)*)$')  # auto, cpu, cuda:0, 0, 0,1
+    gpus: Optional[int] = Field(None, ge=1, le=16)  # device가 auto일 때 할당할 GPU 수 (2 이상이면 DDP)
+
+    @field_validator('batch')
+    @classmethod
+    def validate_batch(cls, value):
+        if value is None or value == -1 or (isinstance(value, int) and value >= 1) or 0 < value < 1:
+            return value
+        raise ValueError("batch must be -1 (auto-batch), a fraction between 0 and 1, or an integer >= 1")
+
+    @field_validator('imgsz')
+    @classmethod
+    def validate_imgsz(cls, value):
+        if value is not None and value % 32 != 0:
+            raise ValueError("imgsz must be a multiple of 32")
+        return value
+
+    @property
+    def options(self) -> dict:
+        return self.model_dump(include=set(TrainingOptionsFields.model_fields), exclude_none=True)
+
+
+class TrainingProfileRequest(TrainingOptionsFields):
+    name: str = Field(..., min_length=1, max_length=100)
+
+
+class ModelCreateRequest(TrainingOptionsFields):
     m_ext: Optional[str] = 'pt'  # 모델 확장자
     m_name: str
     b_m_name: Optional[str] = None  # 베이스 모델 이름
     zip_files: List[int]
+    profile: Optional[str] = None  # 저장된 학습 프로필 이름
 
     @property
     def file_name(self) -> str:
@@ -23,4 +60,30 @@ class ModelCreateRequest(BaseModel):
 
 class InferenceGenerateRequest(BaseModel):
     inference_file_id: int  # InferenceFile ID
-    m_id: int 
\ No newline at end of file
+    m_id: int
+    conf_threshold: Optional[float] = Field(None, gt=0, lt=1)  # 미지정 시 기본값 사용
+    nms_threshold: Optional[float] = Field(None, gt=0, lt=1)
+    stride: Optional[int] = Field(None, ge=1)  # 비디오: N 프레임마다 추론
+    motion_threshold: Optional[float] = Field(None, ge=0, le=1)  # 비디오: 움직임이 이보다 작은 프레임은 건너뜀
+    max_stride: Optional[int] = Field(None, ge=1)
+    box_mode: Optional[Literal['hold', 'interpolate', 'track']] = None  # 건너뛴 프레임의 박스 처리 방식
+
+    @property
+    def options(self) -> dict:
+        return self.model_dump(exclude={'inference_file_id', 'm_id'}, exclude_none=True)
+
+
+class BulkDeleteRequest(BaseModel):
+    ids: List[int] = Field(..., max_length=1000)
+
+
+class BulkStatusRequest(BaseModel):
+    ids: List[int] = Field(..., max_length=1000)
+    status: str
+
+    @field_validator('status')
+    @classmethod
+    def validate_status(cls, value: str) -> str:
+        if value.upper() not in Status.__members__:
+            raise ValueError(f"status must be one of {[status.value for status in Status]}")
+        return value
@@ -0,0 +1,152 @@
+import json
+import time
+import hashlib
+import asyncio
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Optional
+from app.config import LIST_COUNT_CACHE_TTL, MODEL_META_CACHE_SIZE, MODEL_META_CACHE_TTL, INFERENCE_RESULT_CACHE_TTL
+from app.logger import LOGGER_NAME
+
+
+logger = logging.getLogger(LOGGER_NAME)
+COUNT_CACHE_PREFIX = "count:"
+MODEL_META_PREFIX = "model_meta:"
+MODEL_META_CHANNEL = "model_meta:invalidate"
+INFERENCE_RESULT_PREFIX = "inference_result:"
+
+
+# 목록 전체 개수를 Redis에 캐싱 (쓰기 시 invalidate_count로 무효화)
+async def get_cached_count(redis, name: str, loader: Callable[[], Awaitable[int]], ttl: int = LIST_COUNT_CACHE_TTL) -> int:
+    key = f"{COUNT_CACHE_PREFIX}{name}"
+    cached = await redis.get(key)
+    if cached is not None:
+        return int(cached)
+
+    count = await loader()
+    await redis.set(key, count, ex=ttl)
+    return count
+
+
+async def invalidate_count(redis, *names: str) -> None:
+    if names:
+        await redis.delete(*[f"{COUNT_CACHE_PREFIX}{name}" for name in names])
+
+
+def inference_result_key(digest: str, model_name: str, deployment: str, options: dict) -> str:
+    """입력 파일 digest, 모델 이름, 배포된 모델 파일 digest, 추론 옵션으로 추론 결과 캐시 키를 만듭니다."""
+    payload = json.dumps(
+        {"digest": digest, "model_name": model_name, "deployment": deployment, "options": options},
+        sort_keys=True
+    )
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+# 추론 결과(생성 파일 경로 등)를 Redis에 캐싱, 파일 존재 여부는 사용하는 쪽에서 확인
+async def get_inference_result(redis, key: str) -> Optional[dict]:
+    cached = await redis.get(f"{INFERENCE_RESULT_PREFIX}{key}")
+    return json.loads(cached) if cached is not None else None
+
+
+async def set_inference_result(redis, key: str, result: dict, ttl: int = INFERENCE_RESULT_CACHE_TTL) -> None:
+    await redis.set(f"{INFERENCE_RESULT_PREFIX}{key}", json.dumps(result), ex=ttl)
+
+
+class TTLCache:
+    """프로세스 내 LRU 캐시 (항목별 만료 시간 적용)"""
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._items = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key) -> Optional[Any]:
+        with self._lock:
+            item = self._items.get(key)
+            if item is None:
+                return None
+
+            expires_at, value = item
+            if expires_at < time.monotonic():
+                del self._items[key]
+                return None
+
+            self._items.move_to_end(key)
+            return value
+
+    def set(self, key, value) -> None:
+        with self._lock:
+            self._items[key] = (time.monotonic() + self.ttl, value)
+            self._items.move_to_end(key)
+            while len(self._items) > self.maxsize:
+                self._items.popitem(last=False)
+
+    def pop(self, key) -> None:
+        with self._lock:
+            self._items.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._items.clear()
+
+
+class ModelMetaCache:
+    """
+    모델 메타데이터 read-through 캐시 (프로세스 내 LRU -> Redis -> DB 순으로 조회)
+    무효화는 Redis pub/sub 채널로 전파되어 다른 프로세스의 로컬 캐시도 함께 비워진다.
+    """
+
+    def __init__(self, maxsize: int = MODEL_META_CACHE_SIZE, ttl: int = MODEL_META_CACHE_TTL):
+        self.ttl = ttl
+        self.local = TTLCache(maxsize, ttl)
+
+    async def get(self, redis, model_id: int, loader: Callable[[int], Awaitable[Optional[dict]]]) -> Optional[dict]:
+        meta = self.local.get(model_id)
+        if meta is not None:
+            return meta
+
+        cached = await redis.get(f"{MODEL_META_PREFIX}{model_id}")
+        if cached is not None:
+            meta = json.loads(cached)
+        else:
+            meta = await loader(model_id)
+            if meta is None:
+                return None
+            await redis.set(f"{MODEL_META_PREFIX}{model_id}", json.dumps(meta), ex=self.ttl)
+
+        self.local.set(model_id, meta)
+        return meta
+
+    async def invalidate(self, redis, *model_ids: int) -> None:
+        if not model_ids:
+            return
+
+        for model_id in model_ids:
+            self.local.pop(model_id)
+        await redis.delete(*[f"{MODEL_META_PREFIX}{model_id}" for model_id in model_ids])
+        await redis.publish(MODEL_META_CHANNEL, ','.join(map(str, model_ids)))
+
+    async def listen(self, redis, retry_interval: float = 5) -> None:
+        """무효화 이벤트를 구독하여 로컬 캐시에서 제거합니다. (연결이 끊기면 로컬 캐시를 비우고 재시도)"""
+        while True:
+            pubsub = redis.pubsub()
+            try:
+                await pubsub.subscribe(MODEL_META_CHANNEL)
+                async for message in pubsub.listen():
+                    if message['type'] != 'message':
+                        continue
+                    for model_id in message['data'].decode('utf-8').split(','):
+                        self.local.pop(int(model_id))
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.warning("Model meta cache listener disconnected. retrying.", exc_info=True)
+                self.local.clear()
+                await asyncio.sleep(retry_interval)
+            finally:
+                await pubsub.aclose()
+
+
+model_meta_cache = ModelMetaCache()
@@ -7,12 +7,131 @@ DATASET_DIRECTORY = os.environ.get('DATASET_DIRECTORY', '/src/dataset_archive')
 INFERENCE_DIRECTORY = os.environ.get('INFERENCE_DIRECTORY', '/src/inference_files')
 MODEL_DIRECTORY = os.environ.get('MODEL_DIRECTORY', f"/src/runs/{ML_REPO}")
 MODEL_REPOSITORY = os.environ.get('MODEL_REPOSITORY', f"/src/runs/{TRITON_REPO}") # triton repo
+BLOB_DIRECTORY_NAME = os.environ.get('BLOB_DIRECTORY_NAME', 'blobs')  # 업로드 디렉터리 하위의 내용 주소 기반 저장소
+INFERENCE_SEGMENT_DIRECTORY = os.environ.get('INFERENCE_SEGMENT_DIRECTORY', os.path.join(INFERENCE_DIRECTORY, 'segments'))  # 분할 추론 작업 디렉터리
+INFERENCE_STAGING_DIRECTORY = os.environ.get('INFERENCE_STAGING_DIRECTORY', os.path.join(INFERENCE_DIRECTORY, 'staging'))  # 완료 전 추론 결과 작업 디렉터리
 
 VALID_ARCHIVE_MODULE_PATH = os.getenv('VALID_ARCHIVE_MODULE_PATH', 'app.tasks.valid_archive')
 CELERY_BROKER_URL = os.environ.get('CELERY_BROKER_URL', 'redis://redis:6379/0')
+CELERY_RESULT_BACKEND = os.environ.get('CELERY_RESULT_BACKEND', CELERY_BROKER_URL)  # chord(분할 추론) 결과 저장
 CELERY_ARCHIVE_PATH = os.environ.get('CELERY_ARCHIVE_PATH', '/src/dataset_archive')
 CELERY_ML_RUNS_PATH = os.environ.get('CELERY_ML_RUNS_PATH', '/src/runs')
 
+# Celery 큐 (워커별로 -Q 옵션으로 소비할 큐를 지정)
+CELERY_TRAIN_QUEUE = os.environ.get('CELERY_TRAIN_QUEUE', 'train')  # GPU, 장시간 학습
+CELERY_INFERENCE_QUEUE = os.environ.get('CELERY_INFERENCE_QUEUE', 'inference')  # GPU, 대화형 추론
+CELERY_IO_QUEUE = os.environ.get('CELERY_IO_QUEUE', 'io')  # CPU, 아카이브 검증/병합, 구간 결과 병합, GC
+CELERY_DEPLOY_QUEUE = os.environ.get('CELERY_DEPLOY_QUEUE', 'deploy')  # Triton 배포/해제
+
+# acks_late task(학습)가 워커 종료로 ack되지 않았을 때 다시 전달되기까지의 시간 (Redis broker)
+CELERY_VISIBILITY_TIMEOUT = int(os.environ.get('CELERY_VISIBILITY_TIMEOUT', 6 * 3600))
+# 같은 모델의 학습이 중복 실행되지 않도록 잡는 잠금의 만료 시간 (학습 중 TRAIN_HEARTBEAT_SECONDS마다 연장)
+TRAIN_LOCK_TTL = int(os.environ.get('TRAIN_LOCK_TTL', 3600))
+# 학습 잠금/GPU 임대 연장 간격, DDP 학습에서는 진행률과 취소 요청도 이 간격으로 확인 (TTL보다 충분히 짧아야 함)
+TRAIN_HEARTBEAT_SECONDS = float(os.environ.get('TRAIN_HEARTBEAT_SECONDS', 30))
+# 학습 중 오류가 나면 실행 디렉터리의 마지막 체크포인트에서 이어서 다시 시도하는 횟수와 간격
+TRAIN_MAX_RETRIES = int(os.environ.get('TRAIN_MAX_RETRIES', 2))
+TRAIN_RETRY_SECONDS = int(os.environ.get('TRAIN_RETRY_SECONDS', 60))
+
+# 학습 기본 설정 (요청 값 > 저장된 프로필 > 기본값 순으로 적용)
+TRAIN_EPOCHS = int(os.environ.get('TRAIN_EPOCHS', 100))
+TRAIN_BATCH = int(os.environ.get('TRAIN_BATCH', -1))  # -1: GPU 메모리 기준 자동 배치 (auto-batch)
+TRAIN_IMGSZ = int(os.environ.get('TRAIN_IMGSZ', 640))
+TRAIN_WORKERS = int(os.environ.get('TRAIN_WORKERS', 8))  # 데이터 로더 워커 수
+TRAIN_CACHE = os.environ.get('TRAIN_CACHE') or None  # ram | disk
+TRAIN_AMP = os.environ.get('TRAIN_AMP', 'true').lower() == 'true'
+TRAIN_PATIENCE = int(os.environ.get('TRAIN_PATIENCE', 100))  # 조기 종료 (개선 없는 epoch 수)
+TRAIN_DEVICE = os.environ.get('TRAIN_DEVICE', 'auto')  # auto: GPU 스케줄러가 비어 있는 GPU 할당, GPU를 사용할 수 없으면 cpu로 대체
+TRAIN_GPUS = int(os.environ.get('TRAIN_GPUS', 1))  # device가 auto일 때 학습 하나에 할당할 GPU 수 (2 이상이면 DDP)
+
+# GPU 스케줄러 (장치 점유는 Redis 임대 키 gpu_lease:{pool}:{host}:{device}:{slot}로 관리)
+GPU_DEVICES = os.environ.get('GPU_DEVICES', '')  # 사용할 GPU 인덱스 목록 (예: 0,1,2,3), 비어 있으면 torch로 탐색
+GPU_TRAIN_DEVICES = os.environ.get('GPU_TRAIN_DEVICES', '')  # 학습용 GPU, 비어 있으면 추론용을 제외한 전체
+GPU_INFERENCE_DEVICES = os.environ.get('GPU_INFERENCE_DEVICES', '')  # Triton 모델 인스턴스를 배치할 GPU, 비어 있으면 Triton 기본값
+GPU_TRAIN_JOBS_PER_DEVICE = int(os.environ.get('GPU_TRAIN_JOBS_PER_DEVICE', 1))
+GPU_LEASE_TTL = int(os.environ.get('GPU_LEASE_TTL', 3600))  # 학습 중에는 TRAIN_HEARTBEAT_SECONDS마다 연장
+GPU_RETRY_SECONDS = int(os.environ.get('GPU_RETRY_SECONDS', 60))  # 비어 있는 GPU가 없을 때 학습 task 재시도 간격
+TRITON_INSTANCE_COUNT = int(os.environ.get('TRITON_INSTANCE_COUNT', 1))  # GPU별 모델 인스턴스 수
+
+# 학습 이미지 전처리 캐시 (긴 변을 imgsz로 줄인 이미지를 원본 digest + imgsz 기준으로 저장하여 학습 간 공유)
+TRAIN_IMAGE_CACHE_ENABLED = os.environ.get('TRAIN_IMAGE_CACHE_ENABLED', 'true').lower() == 'true'
+TRAIN_IMAGE_CACHE_DIRECTORY = os.environ.get('TRAIN_IMAGE_CACHE_DIRECTORY', os.path.join(CELERY_ML_RUNS_PATH, 'image_cache'))
+TRAIN_IMAGE_CACHE_WORKERS = int(os.environ.get('TRAIN_IMAGE_CACHE_WORKERS', 4))
+TRAIN_IMAGE_CACHE_TTL = int(os.environ.get('TRAIN_IMAGE_CACHE_TTL', 30 * 24 * 3600))  # 사용되지 않은 캐시 보관 기간
+
+# 데이터셋 병합 방식 (link: 압축 해제 캐시의 이미지를 심볼릭 링크, copy: 이미지 복사)
+TRAIN_MERGE_MODE = os.environ.get('TRAIN_MERGE_MODE', 'link')
+TRAIN_EXTRACT_CACHE_DIRECTORY = os.environ.get('TRAIN_EXTRACT_CACHE_DIRECTORY', os.path.join(CELERY_ML_RUNS_PATH, 'extract_cache'))
+TRAIN_EXTRACT_CACHE_TTL = int(os.environ.get('TRAIN_EXTRACT_CACHE_TTL', 30 * 24 * 3600))  # 사용되지 않은 압축 해제 디렉터리 보관 기간
+
+# test 데이터가 없는 데이터셋의 train/test 분할 (같은 seed와 이미지 내용이면 항상 같은 분할)
+TRAIN_SPLIT_SEED = int(os.environ.get('TRAIN_SPLIT_SEED', 0))
+TRAIN_SPLIT_TEST_RATIO = float(os.environ.get('TRAIN_SPLIT_TEST_RATIO', 0.1))
+TRAIN_SPLIT_STRATIFY = os.environ.get('TRAIN_SPLIT_STRATIFY', 'true').lower() == 'true'  # 클래스별 비율 유지
+
+# 큐 내 우선순위 (Redis broker는 0이 가장 높음, 0 ~ 9)
+CELERY_DEFAULT_PRIORITY = int(os.environ.get('CELERY_DEFAULT_PRIORITY', 5))
+INFERENCE_PHOTO_PRIORITY = int(os.environ.get('INFERENCE_PHOTO_PRIORITY', 0))
+INFERENCE_VIDEO_PRIORITY = int(os.environ.get('INFERENCE_VIDEO_PRIORITY', 3))
+INFERENCE_SEGMENT_PRIORITY = int(os.environ.get('INFERENCE_SEGMENT_PRIORITY', 6))  # 분할 추론 구간은 단건 요청보다 뒤로
+
+# 워커 프로세스 단위로 공유되는 커넥션 풀 크기
+WORKER_DB_POOL_SIZE = int(os.environ.get('WORKER_DB_POOL_SIZE', 5))
+WORKER_DB_MAX_OVERFLOW = int(os.environ.get('WORKER_DB_MAX_OVERFLOW', 5))
+WORKER_REDIS_MAX_CONNECTIONS = int(os.environ.get('WORKER_REDIS_MAX_CONNECTIONS', 20))
+
+# Prometheus 메트릭 (API는 /metrics, 워커는 METRICS_WORKER_PORT에서 노출)
+METRICS_ENABLED = os.environ.get('METRICS_ENABLED', 'true').lower() == 'true'
+METRICS_WORKER_PORT = int(os.environ.get('METRICS_WORKER_PORT', 9101))
+
+# 목록 API 페이지 크기 및 전체 개수 캐시
+LIST_PAGE_SIZE = int(os.environ.get('LIST_PAGE_SIZE', 10))
+LIST_PAGE_SIZE_MAX = int(os.environ.get('LIST_PAGE_SIZE_MAX', 100))
+LIST_COUNT_CACHE_TTL = int(os.environ.get('LIST_COUNT_CACHE_TTL', 60))
+
+# 모델 메타데이터 캐시 (프로세스 내 LRU + Redis)
+MODEL_META_CACHE_SIZE = int(os.environ.get('MODEL_META_CACHE_SIZE', 256))
+MODEL_META_CACHE_TTL = int(os.environ.get('MODEL_META_CACHE_TTL', 300))
+
+# 삭제 표시된 레코드/파일 정리 (GC)
+GC_INTERVAL_SECONDS = int(os.environ.get('GC_INTERVAL_SECONDS', 3600))
+GC_BATCH_SIZE = int(os.environ.get('GC_BATCH_SIZE', 500))
+GC_WORKERS = int(os.environ.get('GC_WORKERS', 8))
+GC_GRACE_SECONDS = int(os.environ.get('GC_GRACE_SECONDS', 3600))  # 이보다 최근에 수정된 파일은 미등록 파일이어도 삭제하지 않음
+GC_LOCK_TIMEOUT = int(os.environ.get('GC_LOCK_TIMEOUT', 1800))
+GC_SCAN_DIRECTORIES = os.environ.get('GC_SCAN_DIRECTORIES', f"{DATASET_DIRECTORY},{INFERENCE_DIRECTORY}").split(',')
+GC_EXCLUDE_DIRECTORIES = os.environ.get('GC_EXCLUDE_DIRECTORIES', f"{INFERENCE_SEGMENT_DIRECTORY},{INFERENCE_STAGING_DIRECTORY}").split(',')  # 작업 중인 파일이 있는 디렉터리
+
+# 추론 기본 옵션 및 결과 캐시 (입력 digest + 모델 이름/버전 + 옵션 기준)
+INFERENCE_CONF_THRESHOLD = float(os.environ.get('INFERENCE_CONF_THRESHOLD', 0.3))
+INFERENCE_NMS_THRESHOLD = float(os.environ.get('INFERENCE_NMS_THRESHOLD', 0.4))
+INFERENCE_STRIDE = int(os.environ.get('INFERENCE_STRIDE', 1))  # 비디오에서 N 프레임마다 추론
+INFERENCE_MOTION_THRESHOLD = float(os.environ.get('INFERENCE_MOTION_THRESHOLD', 0.0))  # 0이면 움직임 기반 건너뛰기 사용 안 함
+INFERENCE_MAX_STRIDE = int(os.environ.get('INFERENCE_MAX_STRIDE', 30))  # 움직임이 없어도 이 간격마다 추론
+INFERENCE_BOX_MODE = os.environ.get('INFERENCE_BOX_MODE', 'hold')  # hold | interpolate | track
+INFERENCE_RESULT_DIRECTORY_NAME = os.environ.get('INFERENCE_RESULT_DIRECTORY_NAME', 'results')
+INFERENCE_RESULT_CACHE_TTL = int(os.environ.get('INFERENCE_RESULT_CACHE_TTL', 7 * 24 * 3600))
+
+# 추론 결과 비디오 디코딩/인코딩 (pyav: H.264 + 오디오 복사, opencv: mp4v)
+VIDEO_BACKEND = os.environ.get('VIDEO_BACKEND', 'pyav')
+VIDEO_CODEC = os.environ.get('VIDEO_CODEC', 'libx264')
+VIDEO_CRF = int(os.environ.get('VIDEO_CRF', 23))
+VIDEO_PRESET = os.environ.get('VIDEO_PRESET', 'veryfast')
+FFMPEG_BINARY = os.environ.get('FFMPEG_BINARY', 'ffmpeg')
+FFPROBE_BINARY = os.environ.get('FFPROBE_BINARY', 'ffprobe')
+
+# 긴 비디오 분할 추론 (INFERENCE_SPLIT_MIN_SECONDS 이상인 비디오를 INFERENCE_SEGMENT_SECONDS 구간으로 나누어 병렬 처리, 0이면 사용 안 함)
+INFERENCE_SEGMENT_SECONDS = int(os.environ.get('INFERENCE_SEGMENT_SECONDS', 60))
+INFERENCE_SPLIT_MIN_SECONDS = int(os.environ.get('INFERENCE_SPLIT_MIN_SECONDS', 180))
+
+# 비디오 추론 진행률 (Redis 기록 주기, 보관 시간)
+INFERENCE_PROGRESS_INTERVAL = float(os.environ.get('INFERENCE_PROGRESS_INTERVAL', 1.0))
+INFERENCE_PROGRESS_TTL = int(os.environ.get('INFERENCE_PROGRESS_TTL', 24 * 3600))
+
+# 학습/추론 task 취소 (워커의 취소 플래그 확인 주기, 플래그 보관 시간)
+CANCEL_CHECK_INTERVAL = float(os.environ.get('CANCEL_CHECK_INTERVAL', 1.0))
+CANCEL_FLAG_TTL = int(os.environ.get('CANCEL_FLAG_TTL', 24 * 3600))
+
 
 DATABASE_USER = os.environ.get('DATABASE_USER', 'mluser')
 DATABASE_PASSWORD = os.environ.get('DATABASE_PASSWORD', 'devpassword')
@@ -1,9 +1,15 @@
+import logging
+from typing import Awaitable, Callable
 from redis.asyncio import from_url
 from app.config import CELERY_BROKER_URL
 from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
 from sqlalchemy.orm import declarative_base
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.config import SQLALCHEMY_DATABASE_URL
+from app.logger import LOGGER_NAME
+
+
+logger = logging.getLogger(LOGGER_NAME)
 
 
 async def get_redis(url=None):
@@ -18,8 +24,36 @@ async def get_redis(url=None):
         await redis.aclose()
 
 
+AFTER_COMMIT = "after_commit"
+
+
+class AppSession(AsyncSession):
+    """
+    커밋이 끝난 뒤 실행할 작업(캐시 무효화 등)을 등록할 수 있는 세션
+    커밋 전에 캐시를 비우면 동시에 조회한 요청이 커밋 전 데이터를 다시 캐싱할 수 있으므로 커밋 후에 실행한다.
+    롤백되면 등록된 작업은 버려진다.
+    """
+
+    def after_commit(self, callback: Callable[[], Awaitable]) -> None:
+        self.info.setdefault(AFTER_COMMIT, []).append(callback)
+
+    async def commit(self) -> None:
+        await super().commit()
+
+        # 이미 커밋되었으므로 실패해도 예외를 올리지 않음 (캐시는 TTL로 만료됨)
+        for callback in self.info.pop(AFTER_COMMIT, []):
+            try:
+                await callback()
+            except Exception:
+                logger.warning("After-commit callback failed.", exc_info=True)
+
+    async def rollback(self) -> None:
+        self.info.pop(AFTER_COMMIT, None)
+        await super().rollback()
+
+
 async_engine = create_async_engine(SQLALCHEMY_DATABASE_URL, echo=False)
-session_factory = async_sessionmaker(async_engine, class_=AsyncSession, expire_on_commit=False)
+session_factory = async_sessionmaker(async_engine, class_=AppSession, expire_on_commit=False)
 
 Base = declarative_base()
 
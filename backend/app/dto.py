@@ -1,5 +1,8 @@
-from dataclasses import dataclass
-from typing import List, Optional
+from dataclasses import dataclass, asdict
+from typing import List, Optional, Union
+from app.config import (INFERENCE_CONF_THRESHOLD, INFERENCE_NMS_THRESHOLD, INFERENCE_STRIDE, INFERENCE_MOTION_THRESHOLD,
+                        INFERENCE_MAX_STRIDE, INFERENCE_BOX_MODE, TRAIN_EPOCHS, TRAIN_BATCH, TRAIN_IMGSZ, TRAIN_WORKERS,
+                        TRAIN_CACHE, TRAIN_AMP, TRAIN_PATIENCE, TRAIN_DEVICE, TRAIN_GPUS)
 
 
 @dataclass
@@ -13,4 +16,33 @@ class AiModelDTO:
     map50_95: Optional[float] = None
     precision: Optional[float] = None
     recall: Optional[float] = None
-    classes: Optional[List[str]] = None
\ No newline at end of file
+    classes: Optional[List[str]] = None
+
+
+@dataclass
+class InferenceOptions:
+    conf_threshold: float = INFERENCE_CONF_THRESHOLD
+    nms_threshold: float = INFERENCE_NMS_THRESHOLD
+    stride: int = INFERENCE_STRIDE
+    motion_threshold: float = INFERENCE_MOTION_THRESHOLD
+    max_stride: int = INFERENCE_MAX_STRIDE
+    box_mode: str = INFERENCE_BOX_MODE
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+@dataclass
+class TrainingOptions:
+    epochs: int = TRAIN_EPOCHS
+    batch: Union[int, float] = TRAIN_BATCH  # -1: auto-batch, 0 ~ 1: 사용할 GPU 메모리 비율, 1 이상: 배치 크기
+    imgsz: int = TRAIN_IMGSZ
+    workers: int = TRAIN_WORKERS
+    cache: Optional[str] = TRAIN_CACHE  # None | ram | disk
+    amp: bool = TRAIN_AMP
+    patience: int = TRAIN_PATIENCE
+    device: str = TRAIN_DEVICE  # auto | cpu | cuda:0 | 0,1
+    gpus: int = TRAIN_GPUS  # device가 auto일 때 할당할 GPU 수
+
+    def to_dict(self) -> dict:
+        return asdict(self)
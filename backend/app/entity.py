@@ -1,7 +1,7 @@
-from sqlalchemy import ForeignKey, UniqueConstraint
+from sqlalchemy import ForeignKey, UniqueConstraint, text
 from sqlalchemy.orm import relationship
 from app.database import Base, async_engine
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, Float, Enum
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, Float, Enum, JSON
 from sqlalchemy.sql import func
 from app.util import format_file_size
 import enum
@@ -13,6 +13,7 @@ class Status(enum.Enum):
     RUNNING = "running"
     COMPLETE = "complete"
     FAILED = "failed"
+    CANCELLED = "cancelled"
 
 
 class FileType(enum.Enum):
@@ -20,12 +21,24 @@ class FileType(enum.Enum):
     VIDEO = "video"
 
 
+class Blob(Base):
+    __tablename__ = 'blob'
+
+    id = Column(Integer, primary_key=True)
+    digest = Column(String(64), unique=True, nullable=False)  # sha256
+    filepath = Column(String, nullable=False)
+    filesize = Column(Integer, nullable=False)
+    ref_count = Column(Integer, nullable=False, default=0)  # blob을 가리키는 FileMeta 수
+    creation_time = Column(DateTime(timezone=True), default=func.now())
+
+
 class FileMeta(Base):
     __tablename__ = 'file_meta'
 
     id = Column(Integer, primary_key=True)
     filepath = Column(String, nullable=False)
     filesize = Column(Integer, nullable=False)
+    digest = Column(String(64), ForeignKey('blob.digest'), nullable=True, index=True)  # 업로드 파일인 경우 blob digest
     creation_time = Column(DateTime(timezone=True), default=func.now())
 
     dataset = relationship("DataSet", uselist=False, back_populates="file_meta")
@@ -33,12 +46,14 @@ class FileMeta(Base):
     ai_deploy_file = relationship("AiModel", foreign_keys="[AiModel.deploy_file_id]", back_populates="deploy_file")
     inference_file_original = relationship("InferenceFile", foreign_keys="[InferenceFile.original_file_id]", back_populates="original_file")
     inference_file_generated = relationship("InferenceFile", foreign_keys="[InferenceFile.generated_file_id]", back_populates="generated_file")
+    inference_file_detections = relationship("InferenceFile", foreign_keys="[InferenceFile.detections_file_id]", back_populates="detections_file")
 
     def serialize(self) -> dict:
         return {
             "id": self.id,
             "filepath": self.filepath,
             "filesize": format_file_size(self.filesize),
+            "digest": self.digest,
             "creation_time": self.creation_time.strftime('%Y-%m-%d %H:%M:%S') if self.creation_time else None,
         }
 
@@ -87,6 +102,11 @@ class AiModel(Base):
 
     deploy_file_id = Column(Integer, ForeignKey('file_meta.id'), nullable=True)
     deploy_file = relationship("FileMeta", foreign_keys=[deploy_file_id], back_populates="ai_deploy_file")
+    deploy_digest = Column(String(64), nullable=True)  # Triton에 배포된 모델 파일의 sha256 (추론 결과 캐시 키)
+
+    # 진행 중인 학습의 실행 디렉터리와 마지막 체크포인트 (워커 재시작/재시도 시 이어서 학습)
+    run_dir = Column(String, nullable=True)
+    checkpoint_path = Column(String, nullable=True)
 
     def serialize(self) -> dict:
         return {
@@ -109,6 +129,26 @@ class AiModel(Base):
             } if self.base_model is not None else None,
             "model_file": self.model_file.serialize() if self.model_file is not None else None,
             "deploy_file": self.deploy_file.serialize() if self.deploy_file is not None else None,
+            "deploy_digest": self.deploy_digest,
+            "run_dir": self.run_dir,
+            "checkpoint_path": self.checkpoint_path,
+        }
+
+
+class TrainingProfile(Base):
+    __tablename__ = 'training_profile'
+
+    id = Column(Integer, primary_key=True)
+    name = Column(String, unique=True, nullable=False)
+    options = Column(JSON, nullable=False, default=dict)  # TrainingOptions 필드 중 지정한 값만 저장
+    creation_time = Column(DateTime(timezone=True), default=func.now())
+
+    def serialize(self) -> dict:
+        return {
+            "id": self.id,
+            "name": self.name,
+            "options": self.options,
+            "creation_time": self.creation_time.strftime('%Y-%m-%d %H:%M:%S') if self.creation_time else None,
         }
 
 
@@ -128,6 +168,10 @@ class InferenceFile(Base):
     generated_file_id = Column(Integer, ForeignKey('file_meta.id'), nullable=True)
     generated_file = relationship("FileMeta", foreign_keys=[generated_file_id], back_populates="inference_file_generated")
 
+    # 프레임별 검출 결과 (NPZ)
+    detections_file_id = Column(Integer, ForeignKey('file_meta.id'), nullable=True)
+    detections_file = relationship("FileMeta", foreign_keys=[detections_file_id], back_populates="inference_file_detections")
+
     status = Column(Enum(Status), nullable=False, default=Status.READY)
 
     def serialize(self) -> dict:
@@ -140,9 +184,34 @@ class InferenceFile(Base):
             "status": self.status.value,
             "original_file": self.original_file.serialize() if self.original_file else None,
             "generated_file": self.generated_file.serialize() if self.generated_file else None,
+            "detections_file": self.detections_file.serialize() if self.detections_file else None,
         }
 
 
+# create_all은 없는 테이블만 만들고 기존 테이블에 컬럼을 추가하지 않으므로,
+# 기존 테이블에 추가한 컬럼/인덱스는 멱등 DDL로 등록하여 기동 시 함께 적용한다.
+SCHEMA_UPGRADES = [
+    # 업로드 파일의 blob digest
+    "ALTER TABLE file_meta ADD COLUMN IF NOT EXISTS digest VARCHAR(64) REFERENCES blob (digest)",
+    "CREATE INDEX IF NOT EXISTS ix_file_meta_digest ON file_meta (digest)",
+    # 배포된 모델 파일 digest
+    "ALTER TABLE ai_model ADD COLUMN IF NOT EXISTS deploy_digest VARCHAR(64)",
+    # 프레임별 검출 결과 파일
+    "ALTER TABLE inference_files ADD COLUMN IF NOT EXISTS detections_file_id INTEGER REFERENCES file_meta (id)",
+    # 중단된 학습 이어서 실행
+    "ALTER TABLE ai_model ADD COLUMN IF NOT EXISTS run_dir VARCHAR",
+    "ALTER TABLE ai_model ADD COLUMN IF NOT EXISTS checkpoint_path VARCHAR",
+    # 취소 상태 (SQLAlchemy Enum은 이름으로 저장)
+    "ALTER TYPE status ADD VALUE IF NOT EXISTS 'CANCELLED'",
+]
+
+
+def upgrade_schema(conn):
+    for statement in SCHEMA_UPGRADES:
+        conn.execute(text(statement))
+
+
 async def create_tables():
     async with async_engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
\ No newline at end of file
+        await conn.run_sync(Base.metadata.create_all)
+        await conn.run_sync(upgrade_schema)
\ No newline at end of file
@@ -0,0 +1,149 @@
+"""
+Prometheus 메트릭
+
+- API: 라우트별 요청 지연 시간 (GET /metrics로 노출)
+- Celery: task별 실행 시간, 큐 대기 시간, 결과(success/failure/retry) 수 (워커는 METRICS_WORKER_PORT로 노출)
+- 추론: 프레임별 단계(decode/preprocess/infer/postprocess/encode) 시간, Triton 호출 지연 시간
+- DB/Redis 연결 풀: 조회 시점의 풀 상태를 읽는 collector로 노출
+"""
+
+import time
+import logging
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterable, Iterator
+from prometheus_client import Counter, Histogram, REGISTRY, start_http_server
+from prometheus_client.core import GaugeMetricFamily
+from app.config import METRICS_ENABLED
+from app.logger import LOGGER_NAME
+
+
+logger = logging.getLogger(LOGGER_NAME)
+NAMESPACE = "watchml"
+FAST_BUCKETS = (.0005, .001, .0025, .005, .01, .025, .05, .1, .25, .5, 1.0)  # 프레임 단계, Triton 호출
+TASK_BUCKETS = (.01, .05, .1, .5, 1, 5, 10, 30, 60, 300, 900, 1800, 3600, 7200, 21600)  # 학습은 수 시간까지
+
+HTTP_REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds", "HTTP request latency by route",
+    ["method", "route", "status"], namespace=NAMESPACE,
+)
+TASK_DURATION = Histogram(
+    "celery_task_duration_seconds", "Celery task run time",
+    ["task", "queue"], namespace=NAMESPACE, buckets=TASK_BUCKETS,
+)
+TASK_QUEUE_WAIT = Histogram(
+    "celery_task_queue_wait_seconds", "Time between task publish and task start",
+    ["task", "queue"], namespace=NAMESPACE, buckets=TASK_BUCKETS,
+)
+TASK_RESULTS = Counter(
+    "celery_task_results", "Celery task results by state (success, failure, retry)",
+    ["task", "state"], namespace=NAMESPACE,
+)
+INFERENCE_STAGE_DURATION = Histogram(
+    "inference_stage_duration_seconds", "Per-frame inference time by stage",
+    ["stage"], namespace=NAMESPACE, buckets=FAST_BUCKETS,
+)
+TRITON_REQUEST_DURATION = Histogram(
+    "triton_request_duration_seconds", "Triton gRPC call latency",
+    ["model", "operation"], namespace=NAMESPACE, buckets=FAST_BUCKETS + (2.5, 5.0, 10.0, 30.0, 60.0),
+)
+
+
+@contextmanager
+def time_stage(stage: str):
+    """추론 단계 시간 측정 (decode, preprocess, infer, postprocess, encode)"""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        INFERENCE_STAGE_DURATION.labels(stage).observe(time.perf_counter() - start)
+
+
+def timed_iter(iterable: Iterable, stage: str) -> Iterator:
+    """반복마다 다음 항목을 가져오는 시간을 stage로 기록 (비디오 프레임 디코딩)"""
+    iterator = iter(iterable)
+    while True:
+        with time_stage(stage):
+            item = next(iterator, StopIteration)
+        if item is StopIteration:
+            return
+        yield item
+
+
+@contextmanager
+def time_triton(model: str, operation: str):
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        TRITON_REQUEST_DURATION.labels(model, operation).observe(time.perf_counter() - start)
+
+
+def sqlalchemy_pool_stats(engine) -> Dict[str, int]:
+    pool = engine.pool
+    return {
+        "size": pool.size(),
+        "checked_out": pool.checkedout(),
+        "checked_in": pool.checkedin(),
+        "overflow": max(pool.overflow(), 0),
+    }
+
+
+def redis_pool_stats(pool) -> Dict[str, int]:
+    in_use = len(getattr(pool, '_in_use_connections', ()))
+    available = len(getattr(pool, '_available_connections', ()))
+    return {
+        "max": pool.max_connections,
+        "in_use": in_use,
+        "available": available,
+    }
+
+
+class PoolCollector:
+    """등록된 연결 풀의 상태를 조회 시점에 읽어 watchml_{kind}_pool_connections{pool, state} 게이지로 노출"""
+
+    def __init__(self):
+        self.pools: Dict[tuple, Callable[[], Dict[str, int]]] = {}
+
+    def register(self, kind: str, name: str, stats: Callable[[], Dict[str, int]]) -> None:
+        self.pools[(kind, name)] = stats
+
+    def unregister(self, kind: str, name: str) -> None:
+        self.pools.pop((kind, name), None)
+
+    def collect(self):
+        families = {}
+        for (kind, name), stats in list(self.pools.items()):
+            if kind not in families:
+                families[kind] = GaugeMetricFamily(f"{NAMESPACE}_{kind}_pool_connections", f"{kind} connection pool state",
+                                                   labels=["pool", "state"])
+            try:
+                for state, value in stats().items():
+                    families[kind].add_metric([name, state], value)
+            except Exception:
+                logger.warning(f"Failed to read {kind} pool stats ({name})", exc_info=True)
+        return list(families.values())
+
+
+pool_collector = PoolCollector()
+REGISTRY.register(pool_collector)
+
+
+def register_db_pool(name: str, engine) -> None:
+    pool_collector.register("db", name, lambda: sqlalchemy_pool_stats(engine))
+
+
+def register_redis_pool(name: str, pool) -> None:
+    pool_collector.register("redis", name, lambda: redis_pool_stats(pool))
+
+
+def start_metrics_server(port: int) -> bool:
+    """워커 프로세스의 메트릭 HTTP 서버 시작 (METRICS_ENABLED가 아니거나 포트를 사용할 수 없으면 False)"""
+    if not METRICS_ENABLED:
+        return False
+    try:
+        start_http_server(port)
+    except OSError:
+        logger.warning(f"Metrics server could not be started on port {port}", exc_info=True)
+        return False
+    logger.info(f"Metrics server started on port {port}")
+    return True
@@ -1,6 +1,6 @@
 from typing import List, Optional
-from sqlalchemy import desc, select
-from sqlalchemy.orm import joinedload
+from sqlalchemy import desc, select, update, func
+from sqlalchemy.orm import joinedload, noload
 from sqlalchemy.ext.asyncio import AsyncSession
 import os
 
@@ -34,21 +34,31 @@ class DatasetRepository:
         return dataset
 
     async def delete_file(self, dataset_id: int) -> None:
-        result = await self.db.execute(select(DataSet).filter_by(id=dataset_id))
-        dataset = result.scalars().first()
+        await self.update_fields(dataset_id, is_delete=True)
 
-        if not dataset:
-            raise NotFoundException(f"DataSet with ID '{dataset_id}' not found in database.")
-        
-        dataset.is_delete = True
-        await self.db.flush()
+    # 여러 데이터셋을 한 번의 UPDATE로 변경하고 변경된 행 수를 반환
+    async def bulk_update_fields(self, dataset_ids: List[int], new_status: Optional[Status] = None, **fields) -> int:
+        if not dataset_ids:
+            return 0
+        if new_status is not None:
+            fields['status'] = new_status
+
+        result = await self.db.execute(
+            update(DataSet)
+            .where(DataSet.id.in_(set(dataset_ids)))
+            .values(**fields)
+        )
+        return result.rowcount
 
     async def list_files_with_filemeta(
         self,
         last_id: Optional[int] = None,
-        limit: int = 10
+        limit: int = 10,
+        with_relations: bool = True
     ) -> List[DataSet]:
-        query = select(DataSet).options(joinedload(DataSet.file_meta)).filter_by(is_delete=False)
+        # with_relations가 False이면 조인 없이 요약 컬럼만 조회
+        relation_loader = joinedload if with_relations else noload
+        query = select(DataSet).options(relation_loader(DataSet.file_meta)).filter_by(is_delete=False)
         
         if last_id is not None:
             query = query.filter(DataSet.id < last_id)
@@ -58,6 +68,10 @@ class DatasetRepository:
         result = await self.db.execute(query)
         return result.scalars().all()
 
+    async def count_files(self) -> int:
+        result = await self.db.execute(select(func.count(DataSet.id)).filter_by(is_delete=False))
+        return result.scalar_one()
+
     async def list_files(self) -> List[DataSet]:
         query = select(DataSet).filter_by(is_delete=False)
 
@@ -68,13 +82,23 @@ class DatasetRepository:
         result = await self.db.execute(select(DataSet).options(joinedload(DataSet.file_meta)).filter_by(id=id))
         return result.scalars().first()
 
-    async def update_status(self, dataset_id: int, new_status: Status) -> None:
-        result = await self.db.execute(select(DataSet).filter_by(id=dataset_id))
-        file_record = result.scalars().first()
+    async def update_status(self, dataset_id: int, new_status: Status) -> DataSet:
+        return await self.update_fields(dataset_id, new_status)
+
+    # 조회 없이 UPDATE ... RETURNING 한 번으로 상태와 필드를 변경
+    async def update_fields(self, dataset_id: int, new_status: Optional[Status] = None, **fields) -> DataSet:
+        if new_status is not None:
+            fields['status'] = new_status
 
-        if not file_record:
+        result = await self.db.execute(
+            update(DataSet)
+            .where(DataSet.id == dataset_id)
+            .values(**fields)
+            .returning(DataSet)
+        )
+        dataset = result.scalars().first()
+
+        if not dataset:
             raise NotFoundException(f"Dataset with ID '{dataset_id}' not found in database.")
-        
-        file_record.status = new_status
-        self.db.add(file_record)
-        await self.db.flush()
+
+        return dataset
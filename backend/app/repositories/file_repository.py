@@ -1,10 +1,14 @@
 import os
+import uuid
+import hashlib
 import aiofiles
 
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from app.entity import FileMeta
+from app.entity import FileMeta, Blob
 from app.exceptions import NotFoundException
+from app.config import BLOB_DIRECTORY_NAME
 
 
 
@@ -13,23 +17,25 @@ class FileRepository:
         self.db = db
 
     async def save_file(self, file_path: str, content: bytes) -> FileMeta:
-        file_meta = await self._get_existing_file_meta(file_path)
-
-        async with aiofiles.open(file_path, 'wb') as f:
-            await f.write(content)
+        """
+        업로드 파일을 내용 해시(sha256) 기반 blob으로 저장합니다.
+        업로드마다 FileMeta를 만들고, 같은 내용의 blob이 이미 있으면 파일을 다시 쓰지 않고 참조 수만 늘립니다.
+        """
+        digest = hashlib.sha256(content).hexdigest()
+        blob_path = get_blob_path(os.path.dirname(file_path), digest, os.path.splitext(file_path)[1])
+        blob_path = await self._acquire_blob(digest, blob_path, len(content))
 
-        file_size = os.path.getsize(file_path)
+        file_meta = FileMeta(
+            filepath=blob_path,
+            filesize=len(content),
+            digest=digest
+        )
+        self.db.add(file_meta)
+        await self.db.flush()
 
-        if file_meta:
-            file_meta.filesize = file_size
-        else:
-            file_meta = FileMeta(
-                filepath=file_path,
-                filesize=file_size
-            )
-            self.db.add(file_meta)
+        if not os.path.exists(blob_path):
+            await write_file_atomic(blob_path, content)
 
-        await self.db.flush()
         return file_meta
 
     async def register_file(self, file_path: str) -> FileMeta:
@@ -59,4 +65,43 @@ class FileRepository:
     
     async def _get_existing_file_meta(self, file_path: str) -> FileMeta:
         result = await self.db.execute(select(FileMeta).filter(FileMeta.filepath == file_path))
-        return result.scalars().first()
\ No newline at end of file
+        return result.scalars().first()
+
+    # blob을 등록하거나 참조 수를 늘리고 실제 blob 경로를 반환 (동시 업로드 시에도 digest당 하나의 blob)
+    async def _acquire_blob(self, digest: str, blob_path: str, file_size: int) -> str:
+        query = insert(Blob).values(digest=digest, filepath=blob_path, filesize=file_size, ref_count=1)
+        query = query.on_conflict_do_update(
+            index_elements=[Blob.digest],
+            set_={'ref_count': Blob.ref_count + 1}
+        ).returning(Blob.filepath)
+
+        result = await self.db.execute(query)
+        return result.scalar_one()
+
+
+def get_file_digest(file_path: str, chunk_size: int = 1024 * 1024) -> str:
+    """파일 내용의 sha256 (큰 파일은 나누어 읽음)"""
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def get_blob_path(directory: str, digest: str, extension: str = '') -> str:
+    """업로드 디렉터리 하위의 blob 경로 (blobs/ab/abcdef...ext)"""
+    return os.path.join(directory, BLOB_DIRECTORY_NAME, digest[:2], f"{digest}{extension}")
+
+
+async def write_file_atomic(file_path: str, content: bytes) -> None:
+    """임시 파일에 쓴 뒤 rename 하여 읽는 쪽이 쓰다 만 파일을 보지 않도록 합니다."""
+    os.makedirs(os.path.dirname(file_path), exist_ok=True)
+    temp_path = f"{file_path}.{uuid.uuid4().hex}.tmp"
+
+    try:
+        async with aiofiles.open(temp_path, 'wb') as f:
+            await f.write(content)
+        os.replace(temp_path, file_path)
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
\ No newline at end of file
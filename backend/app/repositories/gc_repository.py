@@ -0,0 +1,122 @@
+from collections import Counter
+from typing import List, Set, Tuple
+from sqlalchemy import and_, delete, exists, select, union, update
+from sqlalchemy.orm import aliased
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.entity import DataSet, AiModel, InferenceFile, FileMeta, Blob
+
+
+class GarbageRepository:
+    """삭제 표시된 레코드와 참조되지 않는 FileMeta를 배치 단위로 제거합니다."""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def delete_datasets(self, batch_size: int) -> int:
+        ids = (
+            select(DataSet.id)
+            .filter(DataSet.is_delete == True)
+            .order_by(DataSet.id)
+            .limit(batch_size)
+        )
+        return await self._delete_by_ids(DataSet, ids)
+
+    async def delete_models(self, batch_size: int) -> int:
+        """배포 중이거나 다른 모델의 베이스 모델로 참조되는 모델은 제외합니다."""
+        derived_model = aliased(AiModel)
+        ids = (
+            select(AiModel.id)
+            .filter(
+                AiModel.is_delete == True,
+                AiModel.is_deploy == False,
+                ~exists().where(derived_model.base_model_id == AiModel.id)
+            )
+            .order_by(AiModel.id)
+            .limit(batch_size)
+        )
+        return await self._delete_by_ids(AiModel, ids)
+
+    async def delete_inference_files(self, batch_size: int) -> int:
+        ids = (
+            select(InferenceFile.id)
+            .filter(InferenceFile.is_delete == True)
+            .order_by(InferenceFile.id)
+            .limit(batch_size)
+        )
+        return await self._delete_by_ids(InferenceFile, ids)
+
+    async def delete_orphan_file_metas(self, batch_size: int) -> List[Tuple[str, str]]:
+        """어떤 레코드도 참조하지 않는 FileMeta를 삭제하고 (파일 경로, blob digest) 목록을 반환합니다."""
+        ids = (
+            select(FileMeta.id)
+            .filter(orphan_file_meta_criteria())
+            .order_by(FileMeta.id)
+            .limit(batch_size)
+        )
+        result = await self.db.execute(
+            delete(FileMeta)
+            .where(FileMeta.id.in_(ids))
+            .returning(FileMeta.filepath, FileMeta.digest)
+            .execution_options(synchronize_session=False)
+        )
+        return [tuple(row) for row in result.all()]
+
+    async def release_blobs(self, digests: Counter) -> None:
+        """삭제된 FileMeta 수만큼 blob 참조 수를 줄입니다."""
+        for digest, count in digests.items():
+            await self.db.execute(
+                update(Blob)
+                .where(Blob.digest == digest)
+                .values(ref_count=Blob.ref_count - count)
+                .execution_options(synchronize_session=False)
+            )
+
+    async def delete_unreferenced_blobs(self, batch_size: int) -> List[str]:
+        """참조 수가 0이고 어떤 FileMeta도 가리키지 않는 blob을 삭제하고 파일 경로 목록을 반환합니다."""
+        ids = (
+            select(Blob.id)
+            .filter(Blob.ref_count <= 0, ~exists().where(FileMeta.digest == Blob.digest))
+            .order_by(Blob.id)
+            .limit(batch_size)
+        )
+        result = await self.db.execute(
+            delete(Blob)
+            .where(Blob.id.in_(ids))
+            .returning(Blob.filepath)
+            .execution_options(synchronize_session=False)
+        )
+        return list(result.scalars().all())
+
+    async def get_tracked_paths(self, file_paths: List[str]) -> Set[str]:
+        """주어진 경로 중 FileMeta 또는 blob에 등록된 경로를 반환합니다."""
+        if not file_paths:
+            return set()
+
+        file_paths = set(file_paths)
+        result = await self.db.execute(
+            union(
+                select(FileMeta.filepath).where(FileMeta.filepath.in_(file_paths)),
+                select(Blob.filepath).where(Blob.filepath.in_(file_paths)),
+            )
+        )
+        return set(result.scalars().all())
+
+    async def _delete_by_ids(self, entity, ids) -> int:
+        result = await self.db.execute(
+            delete(entity)
+            .where(entity.id.in_(ids))
+            .returning(entity.id)
+            .execution_options(synchronize_session=False)
+        )
+        return len(result.all())
+
+
+def orphan_file_meta_criteria():
+    return and_(
+        ~exists().where(DataSet.file_meta_id == FileMeta.id),
+        ~exists().where(AiModel.model_file_id == FileMeta.id),
+        ~exists().where(AiModel.deploy_file_id == FileMeta.id),
+        ~exists().where(InferenceFile.original_file_id == FileMeta.id),
+        ~exists().where(InferenceFile.generated_file_id == FileMeta.id),
+        ~exists().where(InferenceFile.detections_file_id == FileMeta.id),
+    )
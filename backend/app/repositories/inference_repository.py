@@ -1,9 +1,10 @@
-from typing import List, Union, Optional
-from sqlalchemy import desc
-from sqlalchemy.orm import joinedload
+from typing import List, Union, Optional, Tuple
+from sqlalchemy import desc, update, func
+from sqlalchemy.orm import joinedload, noload
+from sqlalchemy.orm.attributes import set_committed_value
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from app.entity import InferenceFile, Status, FileType
+from app.entity import InferenceFile, AiModel, Status, FileType
 from app.repositories.file_repository import FileRepository
 from app.exceptions import NotFoundException
 from app.config import PHOTO_EXTENSIONS, VIDEO_EXTENSIONS
@@ -30,6 +31,7 @@ class InferenceRepository:
             inference_file.original_file = file_meta
             inference_file.generated_file_name = None
             inference_file.generated_file = None
+            inference_file.detections_file = None
             inference_file.status = Status.READY
         else:
             inference_file = InferenceFile(
@@ -42,39 +44,43 @@ class InferenceRepository:
         await self.db.flush()
         return inference_file
 
-    async def update_generated_file(self, inference_file_id: int, generated_file_path: str) -> InferenceFile:
-        """생성된 파일을 저장하고 InferenceFile 객체를 업데이트합니다."""
-        generated_file_name = os.path.basename(generated_file_path)
-        
-        result = await self.db.execute(
-            select(InferenceFile)
-            .options(
-                joinedload(InferenceFile.original_file),
-                joinedload(InferenceFile.generated_file)
-            )
-            .filter(InferenceFile.id == inference_file_id)
+    async def update_generated_file(self, inference_file_id: int, generated_file_path: str, new_status: Optional[Status] = None,
+                                    generated_file_name: Optional[str] = None, detections_file_path: Optional[str] = None) -> InferenceFile:
+        """
+        생성된 파일(및 검출 결과 파일)을 저장하고 InferenceFile 객체를 업데이트합니다. (new_status가 주어지면 상태도 함께 변경)
+        generated_file_name이 없으면 생성 파일 경로의 파일명을 사용합니다.
+        """
+        generated_file = await self.file_repo.register_file(generated_file_path)
+        detections_file = await self.file_repo.register_file(detections_file_path) if detections_file_path else None
+        inference_file = await self.update_fields(
+            inference_file_id,
+            new_status,
+            generated_file_name=generated_file_name or os.path.basename(generated_file_path),
+            generated_file_id=generated_file.id,
+            detections_file_id=detections_file.id if detections_file else None
         )
-        inference_file = result.scalars().first()
-
-        if not inference_file:
-            raise NotFoundException(f"InferenceFile with ID '{inference_file_id}' not found in database.")
-        
-        inference_file.generated_file_name = generated_file_name
-        inference_file.generated_file = await self.file_repo.register_file(generated_file_path)
-        await self.db.flush()
+        set_committed_value(inference_file, 'generated_file', generated_file)
+        set_committed_value(inference_file, 'detections_file', detections_file)
 
         return inference_file
 
     async def delete_file(self, inference_file_id: int) -> None:
         """InferenceFile 객체를 삭제합니다 (is_delete 플래그 설정)."""
-        result = await self.db.execute(select(InferenceFile).filter(InferenceFile.id == inference_file_id))
-        inference_file = result.scalars().first()
-        
-        if not inference_file:
-            raise NotFoundException(f"InferenceFile with ID '{inference_file_id}' not found in database.")
-        
-        inference_file.is_delete = True
-        await self.db.flush()
+        await self.update_fields(inference_file_id, is_delete=True)
+
+    async def bulk_update_fields(self, inference_file_ids: List[int], new_status: Optional[Status] = None, **fields) -> int:
+        """여러 InferenceFile을 한 번의 UPDATE로 변경하고 변경된 행 수를 반환합니다."""
+        if not inference_file_ids:
+            return 0
+        if new_status is not None:
+            fields['status'] = new_status
+
+        result = await self.db.execute(
+            update(InferenceFile)
+            .where(InferenceFile.id.in_(set(inference_file_ids)))
+            .values(**fields)
+        )
+        return result.rowcount
 
     async def get_inference_file_by_id(self, inference_file_id: int) -> InferenceFile:
         """InferenceFile 객체를 ID로 조회합니다."""
@@ -82,7 +88,8 @@ class InferenceRepository:
             select(InferenceFile)
             .options(
                 joinedload(InferenceFile.original_file),
-                joinedload(InferenceFile.generated_file)
+                joinedload(InferenceFile.generated_file),
+                joinedload(InferenceFile.detections_file)
             )
             .filter(InferenceFile.id == inference_file_id)
         )
@@ -97,13 +104,17 @@ class InferenceRepository:
     async def list_files_with_filemeta(
         self,
         last_id: Optional[int] = None,
-        limit: int = 10
+        limit: int = 10,
+        with_relations: bool = True
     ) -> List[InferenceFile]:
+        # with_relations가 False이면 조인 없이 요약 컬럼만 조회
+        relation_loader = joinedload if with_relations else noload
         query = (
             select(InferenceFile)
             .options(
-                joinedload(InferenceFile.original_file),
-                joinedload(InferenceFile.generated_file)
+                relation_loader(InferenceFile.original_file),
+                relation_loader(InferenceFile.generated_file),
+                relation_loader(InferenceFile.detections_file)
             )
             .filter(InferenceFile.is_delete == False)
         )
@@ -116,6 +127,13 @@ class InferenceRepository:
         result = await self.db.execute(query)
         return result.scalars().all()
     
+    async def count_files(self) -> int:
+        """삭제되지 않은 InferenceFile 개수를 반환합니다."""
+        result = await self.db.execute(
+            select(func.count(InferenceFile.id)).filter(InferenceFile.is_delete == False)
+        )
+        return result.scalar_one()
+
     async def list_files(self) -> List[InferenceFile]:
         """삭제되지 않은 InferenceFile 목록을 반환합니다."""
         result = await self.db.execute(
@@ -125,38 +143,65 @@ class InferenceRepository:
         )
         return result.scalars().all()
 
-    async def update_status(self, inference_file_id: int, new_status: Status) -> None:
+    async def update_status(self, inference_file_id: int, new_status: Status) -> InferenceFile:
         """InferenceFile 객체의 상태를 업데이트합니다."""
-        result = await self.db.execute(select(InferenceFile).filter(InferenceFile.id == inference_file_id))
+        return await self.update_fields(inference_file_id, new_status)
+
+    async def update_fields(self, inference_file_id: int, new_status: Optional[Status] = None, **fields) -> InferenceFile:
+        """조회 없이 UPDATE ... RETURNING 한 번으로 InferenceFile의 상태와 필드를 변경합니다."""
+        if new_status is not None:
+            fields['status'] = new_status
+
+        result = await self.db.execute(
+            update(InferenceFile)
+            .where(InferenceFile.id == inference_file_id)
+            .values(**fields)
+            .returning(InferenceFile)
+        )
         inference_file = result.scalars().first()
 
         if not inference_file:
             raise NotFoundException(f"InferenceFile with ID '{inference_file_id}' not found in database.")
-        
-        inference_file.status = new_status
-        await self.db.flush()
+
+        return inference_file
+
+    async def get_model_deployment(self, model_name: str) -> Optional[str]:
+        """모델이 배포 상태이면 배포된 모델 파일 digest를 반환합니다."""
+        result = await self.db.execute(
+            select(AiModel.deploy_digest).filter(AiModel.modelname == model_name, AiModel.is_deploy == True)
+        )
+        return result.scalars().first()
 
     async def get_file_path(self, file_id: int) -> str:
+        file_path, _ = await self.get_download_file(file_id)
+        return file_path
+
+    async def get_download_file(self, file_id: int) -> Tuple[str, str]:
+        """FileMeta ID로 (저장 경로, 사용자에게 보여줄 파일명)을 반환합니다. (blob 경로는 digest 기반 이름)"""
         result = await self.db.execute(
             select(InferenceFile)
             .options(
                 joinedload(InferenceFile.original_file),
-                joinedload(InferenceFile.generated_file)
+                joinedload(InferenceFile.generated_file),
+                joinedload(InferenceFile.detections_file)
             )
             .where(
                 (InferenceFile.original_file_id == file_id) |
-                (InferenceFile.generated_file_id == file_id)
+                (InferenceFile.generated_file_id == file_id) |
+                (InferenceFile.detections_file_id == file_id)
             )
         )
         inference_file = result.scalars().first()
 
         if inference_file:
             if inference_file.original_file and inference_file.original_file.id == file_id:
-                return inference_file.original_file.filepath
+                return inference_file.original_file.filepath, inference_file.original_file_name
             elif inference_file.generated_file and inference_file.generated_file.id == file_id:
-                return inference_file.generated_file.filepath
+                return inference_file.generated_file.filepath, inference_file.generated_file_name
+            elif inference_file.detections_file and inference_file.detections_file.id == file_id:
+                return inference_file.detections_file.filepath, os.path.basename(inference_file.detections_file.filepath)
 
-        raise NotFoundException(f"File with id {file_id} not found in both original and generated files.")
+        raise NotFoundException(f"File with id {file_id} not found in original, generated or detections files.")
 
 
 
@@ -1,14 +1,17 @@
-from sqlalchemy import desc, and_
-from sqlalchemy.orm import joinedload
+from sqlalchemy import desc, and_, update, func
+from sqlalchemy.orm import joinedload, noload
+from sqlalchemy.orm.attributes import set_committed_value
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 from sqlalchemy.exc import NoResultFound
+from sqlalchemy.dialects.postgresql import insert
 from app.database import get_session
-from app.entity import AiModel, Status, FileMeta
-from app.repositories.file_repository import FileRepository
+from app.entity import AiModel, Status, FileMeta, TrainingProfile
+from app.repositories.file_repository import FileRepository, get_file_digest
 from app.dto import AiModelDTO
 from app.exceptions import NotFoundException
 from typing import Optional, List
+import asyncio
 from app.config import YOLO_CLASS_LIST, MODEL_DIRECTORY, FASHION_MODEL_CLASS_LIST
 
 
@@ -35,7 +38,7 @@ class MlRepository:
         return model
     
     # AI 모델 업데이트
-    async def update_model(self, ai_model_dto: AiModelDTO) -> AiModel:
+    async def update_model(self, ai_model_dto: AiModelDTO, new_status: Status = Status.PENDING) -> AiModel:
         """모델 정보를 업데이트합니다."""
         model = await self.get_model_by_name(ai_model_dto.model_name)
         if model is None:
@@ -47,11 +50,11 @@ class MlRepository:
         model_file = await self.file_repo.register_file(ai_model_dto.model_path) if ai_model_dto.model_path else None
         deploy_file = await self.file_repo.register_file(ai_model_dto.deploy_path) if ai_model_dto.deploy_path else None
 
-        await self._update_model_attributes(model, ai_model_dto, base_model, model_file, deploy_file)
+        await self._update_model_attributes(model, ai_model_dto, base_model, model_file, deploy_file, new_status)
         await self.db.flush()
         return model
     
-    async def _update_model_attributes(self, model: AiModel, ai_model_dto: AiModelDTO, base_model: AiModel = None, model_file: Optional[FileMeta] = None, deploy_file: Optional[FileMeta] = None):
+    async def _update_model_attributes(self, model: AiModel, ai_model_dto: AiModelDTO, base_model: AiModel = None, model_file: Optional[FileMeta] = None, deploy_file: Optional[FileMeta] = None, new_status: Status = Status.PENDING):
         """모델의 속성을 업데이트합니다."""
         model.version = ai_model_dto.version or model.version
         model.map50 = ai_model_dto.map50 or model.map50
@@ -60,8 +63,11 @@ class MlRepository:
         model.recall = ai_model_dto.recall or model.recall
         model.classes = ','.join(ai_model_dto.classes) if ai_model_dto.classes else model.classes
         model.is_deploy = False
+        model.deploy_digest = None
         model.is_delete = False
-        model.status = Status.PENDING
+        model.status = new_status
+        model.run_dir = None  # 새 학습 등록 또는 학습 완료 시 이전 실행 정보 초기화
+        model.checkpoint_path = None
 
         if base_model is not None:
             model.base_model = base_model
@@ -129,15 +135,21 @@ class MlRepository:
     async def get_all_models_with_filemeta(
         self,
         last_id: Optional[int] = None,
-        limit: int = 10
+        limit: int = 10,
+        with_relations: bool = True
     ) -> List[AiModel]:
-        query = (
-            select(AiModel)
-            .options(
+        if with_relations:
+            options = (
                 joinedload(AiModel.model_file),
                 joinedload(AiModel.deploy_file),
                 joinedload(AiModel.base_model).joinedload(AiModel.model_file)
             )
+        else:  # 조인 없이 요약 컬럼만 조회
+            options = (noload(AiModel.model_file), noload(AiModel.deploy_file), noload(AiModel.base_model))
+
+        query = (
+            select(AiModel)
+            .options(*options)
             .filter(AiModel.is_delete == False)
         )
 
@@ -149,42 +161,71 @@ class MlRepository:
         result = await self.db.execute(query)
         return result.scalars().all()
 
+    async def count_models(self) -> int:
+        """삭제되지 않은 모델 개수를 반환합니다."""
+        result = await self.db.execute(select(func.count(AiModel.id)).filter(AiModel.is_delete == False))
+        return result.scalar_one()
+
     # 모델 삭제
     async def delete_model(self, model_id: int) -> None:
         """ID로 모델을 삭제합니다."""
-        model = await self.get_model_by_id(model_id)
-        model.is_delete = True
-        await self.db.flush()
+        await self.update_fields(model_id, is_delete=True)
 
     # 모델을 배포 상태로 변경
-    async def deploy_model(self, model_id: int, deploy_path: str) -> AiModel:
-        """ID로 모델을 배포 상태로 설정합니다."""
-        model = await self.get_model_by_id(model_id)
-
+    async def deploy_model(self, model_id: int, deploy_path: str, new_status: Optional[Status] = None) -> AiModel:
+        """ID로 모델을 배포 상태로 설정합니다. (new_status가 주어지면 상태도 함께 변경)"""
         deploy_file = await self.file_repo.register_file(deploy_path)
-        model.is_deploy = True
-        model.deploy_file = deploy_file
-        await self.db.flush()
-        
+        # 같은 경로에 다시 배포될 수 있으므로 배포된 가중치는 파일 내용으로 식별
+        deploy_digest = await asyncio.to_thread(get_file_digest, deploy_path)
+        model = await self.update_fields(model_id, new_status, is_deploy=True, deploy_file_id=deploy_file.id, deploy_digest=deploy_digest)
+        set_committed_value(model, 'deploy_file', deploy_file)  # 세션에 남아있는 관계도 함께 갱신
         return model
     
     # 모델을 미배포 상태로 변경
-    async def undeploy_model(self, model_id: int) -> AiModel:
-        """ID로 모델을 미배포 상태로 설정합니다."""
-        model = await self.get_model_by_id(model_id)
-
-        model.is_deploy = False
-        model.deploy_file = None
-        await self.db.flush()
-        
+    async def undeploy_model(self, model_id: int, new_status: Optional[Status] = None) -> AiModel:
+        """ID로 모델을 미배포 상태로 설정합니다. (new_status가 주어지면 상태도 함께 변경)"""
+        model = await self.update_fields(model_id, new_status, is_deploy=False, deploy_file_id=None, deploy_digest=None)
+        set_committed_value(model, 'deploy_file', None)
         return model
 
     # 모델 상태 업데이트
-    async def update_status(self, model_id: int, new_status: Status) -> None:
+    async def update_status(self, model_id: int, new_status: Status) -> AiModel:
         """ID로 모델의 상태를 업데이트합니다."""
-        model = await self.get_model_by_id(model_id)
-        model.status = new_status
-        await self.db.flush()
+        return await self.update_fields(model_id, new_status)
+
+    # 모델 상태 및 필드 업데이트 (조회 없이 UPDATE ... RETURNING 한 번으로 처리)
+    async def update_fields(self, model_id: int, new_status: Optional[Status] = None, **fields) -> AiModel:
+        """ID로 모델의 상태와 필드를 한 번에 업데이트합니다."""
+        if new_status is not None:
+            fields['status'] = new_status
+
+        result = await self.db.execute(
+            update(AiModel)
+            .where(AiModel.id == model_id)
+            .values(**fields)
+            .returning(AiModel)
+        )
+        model = result.scalars().first()
+
+        if not model:
+            raise NotFoundException(f"Model with ID '{model_id}' not found in database.")
+
+        return model
+
+    # 여러 모델의 상태 및 필드 업데이트
+    async def bulk_update_fields(self, model_ids: List[int], new_status: Optional[Status] = None, **fields) -> int:
+        """여러 모델을 한 번의 UPDATE로 변경하고 변경된 행 수를 반환합니다."""
+        if not model_ids:
+            return 0
+        if new_status is not None:
+            fields['status'] = new_status
+
+        result = await self.db.execute(
+            update(AiModel)
+            .where(AiModel.id.in_(set(model_ids)))
+            .values(**fields)
+        )
+        return result.rowcount
 
     async def model_exists(self, model_name: str) -> bool:
         """Check if a model with the given name already exists."""
@@ -193,6 +234,39 @@ class MlRepository:
         )
         return result.scalars().first() is not None
 
+    # 학습 프로필 조회
+    async def get_profile_by_name(self, name: str) -> TrainingProfile:
+        """이름으로 학습 프로필을 조회합니다."""
+        result = await self.db.execute(select(TrainingProfile).filter(TrainingProfile.name == name))
+        profile = result.scalars().first()
+
+        if not profile:
+            raise NotFoundException(f"Training profile '{name}' not found in database.")
+
+        return profile
+
+    async def list_profiles(self) -> List[TrainingProfile]:
+        """모든 학습 프로필을 이름순으로 조회합니다."""
+        result = await self.db.execute(select(TrainingProfile).order_by(TrainingProfile.name))
+        return result.scalars().all()
+
+    # 같은 이름의 프로필이 있으면 설정을 덮어씀
+    async def save_profile(self, name: str, options: dict) -> TrainingProfile:
+        """학습 프로필을 등록하거나 갱신합니다."""
+        query = insert(TrainingProfile).values(name=name, options=options)
+        query = query.on_conflict_do_update(
+            index_elements=[TrainingProfile.name],
+            set_={'options': options}
+        ).returning(TrainingProfile)
+
+        result = await self.db.execute(query)
+        return result.scalars().first()
+
+    async def delete_profile(self, name: str) -> None:
+        """이름으로 학습 프로필을 삭제합니다."""
+        profile = await self.get_profile_by_name(name)
+        await self.db.delete(profile)
+
 
 async def create_base_model():
     async for session_instance in get_session():
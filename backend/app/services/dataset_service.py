@@ -1,13 +1,19 @@
+from functools import partial
 from typing import List
 from fastapi import UploadFile, Depends
-from app.config import DATASET_DIRECTORY
+from app.config import DATASET_DIRECTORY, LIST_PAGE_SIZE
 from app.database import get_redis, get_session
 from app.repositories.dataset_repository import DatasetRepository
-from app.util import transactional
+from app.cache import get_cached_count, invalidate_count
+from app.util import transactional, select_fields
 from app.entity import Status
 import os
 
 
+COUNT_CACHE_NAME = "dataset"
+RELATION_FIELDS = {"file_meta"}
+
+
 class DataSetService:
     def __init__(self, redis, session, dir=DATASET_DIRECTORY):
         self.redis = redis
@@ -21,6 +27,7 @@ class DataSetService:
         content = await file.read()
         file_path = os.path.join(self.dir, file.filename)
         dataset = await self.repository.save_file(file_path, content)
+        self.session.after_commit(partial(invalidate_count, self.redis, COUNT_CACHE_NAME))
 
         return { "file_name": dataset.filename, "id": dataset.id }
 
@@ -28,12 +35,25 @@ class DataSetService:
     async def delete_file(self, dataset_id: int) -> bool:
         """파일을 삭제합니다 (is_delete 플래그를 설정)."""
         await self.repository.delete_file(dataset_id=dataset_id)
+        self.session.after_commit(partial(invalidate_count, self.redis, COUNT_CACHE_NAME))
         return True
 
-    async def get_file_list(self, last_id: int = None) -> List[dict]:
-        """디렉터리 내 모든 파일 목록을 반환합니다."""
-        datasets = await self.repository.list_files_with_filemeta(last_id=last_id)
-        return [dataset.serialize() for dataset in datasets]
+    @transactional
+    async def delete_files(self, dataset_ids: List[int]) -> int:
+        """여러 파일을 한 번에 삭제합니다 (is_delete 플래그를 설정)."""
+        count = await self.repository.bulk_update_fields(dataset_ids, is_delete=True)
+        self.session.after_commit(partial(invalidate_count, self.redis, COUNT_CACHE_NAME))
+        return count
+
+    async def get_file_list(self, last_id: int = None, limit: int = LIST_PAGE_SIZE, fields: List[str] = None) -> List[dict]:
+        """디렉터리 내 파일 목록을 반환합니다. (fields가 주어지면 해당 필드만, 관계 필드가 없으면 조인 생략)"""
+        with_relations = fields is None or bool(RELATION_FIELDS & set(fields))
+        datasets = await self.repository.list_files_with_filemeta(last_id=last_id, limit=limit, with_relations=with_relations)
+        return [select_fields(dataset.serialize(), fields) for dataset in datasets]
+
+    async def get_file_count(self) -> int:
+        """삭제되지 않은 파일 개수를 반환합니다. (캐시)"""
+        return await get_cached_count(self.redis, COUNT_CACHE_NAME, self.repository.count_files)
 
     async def get_file_status(self) -> List[dict]:
         """디렉터리 내 파일들의 상태를 반환합니다 (디렉터리 제외)."""
@@ -55,6 +75,13 @@ class DataSetService:
         return True
 
 
+    @transactional
+    async def update_statuses(self, dataset_ids: List[int], status: str) -> int:
+        """여러 파일의 상태를 한 번에 업데이트합니다."""
+        new_status = Status[status.upper()]
+        return await self.repository.bulk_update_fields(dataset_ids, new_status)
+
+
 async def get_dataset_service(redis=Depends(get_redis), session=Depends(get_session)):
     """DataSetService 인스턴스를 반환합니다."""
     yield DataSetService(redis, session)
@@ -0,0 +1,109 @@
+import asyncio
+import logging
+from collections import Counter
+from app.config import (GC_BATCH_SIZE, GC_WORKERS, GC_GRACE_SECONDS, GC_LOCK_TIMEOUT, GC_SCAN_DIRECTORIES,
+                        GC_EXCLUDE_DIRECTORIES)
+from app.repositories.gc_repository import GarbageRepository
+from app.tasks.gc.sweep_files import unlink_files, iter_file_chunks
+from app.logger import LOGGER_NAME
+
+
+logger = logging.getLogger(LOGGER_NAME)
+GC_LOCK_KEY = "gc:lock"
+
+
+class GarbageCollectService:
+    def __init__(self, redis, session, batch_size: int = GC_BATCH_SIZE, max_workers: int = GC_WORKERS,
+                 scan_directories: list[str] = GC_SCAN_DIRECTORIES, grace_seconds: int = GC_GRACE_SECONDS,
+                 exclude_directories: list[str] = GC_EXCLUDE_DIRECTORIES):
+        self.redis = redis
+        self.session = session
+        self.batch_size = batch_size
+        self.max_workers = max_workers
+        self.scan_directories = scan_directories
+        self.grace_seconds = grace_seconds
+        self.exclude_directories = exclude_directories
+        self.repository = GarbageRepository(db=self.session)
+
+    async def collect(self) -> dict:
+        """삭제 표시된 레코드, 참조되지 않는 FileMeta와 파일, 미등록 파일을 배치 단위로 정리합니다."""
+        if not await self.redis.set(GC_LOCK_KEY, 1, nx=True, ex=GC_LOCK_TIMEOUT):
+            logger.info("Garbage collection is already running. skip.")
+            return None
+
+        try:
+            summary = {
+                "datasets": await self._delete_in_batches(self.repository.delete_datasets),
+                "models": await self._delete_in_batches(self.repository.delete_models),
+                "inference_files": await self._delete_in_batches(self.repository.delete_inference_files),
+            }
+            summary["file_metas"], summary["removed_files"] = await self._collect_orphan_file_metas()
+            summary["blobs"], summary["removed_blobs"] = await self._collect_unreferenced_blobs()
+            summary["untracked_files"] = await self._collect_untracked_files()
+
+            logger.info(f"Garbage collection completed: {summary}")
+            return summary
+        finally:
+            await self.redis.delete(GC_LOCK_KEY)
+
+    # 배치 단위로 삭제하고 배치마다 커밋
+    async def _delete_in_batches(self, delete_batch) -> int:
+        total = 0
+        while True:
+            count = await delete_batch(self.batch_size)
+            await self.session.commit()
+            total += count
+
+            if count < self.batch_size:
+                return total
+
+    async def _collect_orphan_file_metas(self) -> tuple[int, int]:
+        total, removed = 0, 0
+        while True:
+            rows = await self.repository.delete_orphan_file_metas(self.batch_size)
+            # blob을 가리키는 FileMeta는 파일을 직접 지우지 않고 참조 수만 줄인다.
+            await self.repository.release_blobs(Counter(digest for _, digest in rows if digest))
+            await self.session.commit()  # 레코드 삭제가 확정된 뒤에만 파일을 지운다.
+            total += len(rows)
+
+            # 동일 경로를 다른 FileMeta가 참조하고 있다면 파일은 남긴다.
+            file_paths = [file_path for file_path, digest in rows if not digest]
+            removed += await self._unlink_untracked(file_paths)
+
+            if len(rows) < self.batch_size:
+                return total, removed
+
+    async def _collect_unreferenced_blobs(self) -> tuple[int, int]:
+        total, removed = 0, 0
+        while True:
+            file_paths = await self.repository.delete_unreferenced_blobs(self.batch_size)
+            await self.session.commit()
+            total += len(file_paths)
+
+            # 삭제 직후 같은 내용이 다시 업로드되어 새 blob이 등록된 경우 파일은 남긴다.
+            removed += await self._unlink_untracked(file_paths)
+
+            if len(file_paths) < self.batch_size:
+                return total, removed
+
+    async def _unlink_untracked(self, file_paths: list[str]) -> int:
+        tracked_paths = await self.repository.get_tracked_paths(file_paths)
+        removable_paths = [file_path for file_path in set(file_paths) if file_path not in tracked_paths]
+        return await asyncio.to_thread(unlink_files, removable_paths, self.max_workers)
+
+    # 어떤 FileMeta도 참조하지 않는 디스크 상의 파일 정리
+    async def _collect_untracked_files(self) -> int:
+        removed = 0
+        chunks = iter_file_chunks(self.scan_directories, self.batch_size, older_than=self.grace_seconds,
+                                  exclude=self.exclude_directories)
+
+        while True:
+            chunk = await asyncio.to_thread(next, chunks, None)
+            if chunk is None:
+                return removed
+
+            tracked_paths = await self.repository.get_tracked_paths(chunk)
+            untracked_paths = [file_path for file_path in chunk if file_path not in tracked_paths]
+            if untracked_paths:
+                logger.info(f"Found {len(untracked_paths)} untracked files")
+                removed += await asyncio.to_thread(unlink_files, untracked_paths, self.max_workers)
@@ -1,11 +1,22 @@
-from typing import List
+from functools import partial
+from typing import List, Tuple
 from fastapi import UploadFile, Depends
-from app.config import INFERENCE_DIRECTORY
+from app.config import INFERENCE_DIRECTORY, LIST_PAGE_SIZE
 from app.database import get_redis, get_session
 from app.repositories.inference_repository import InferenceRepository
-from app.util import transactional
+from app.cache import get_cached_count, invalidate_count
+from app.util import transactional, select_fields
 from app.entity import Status
+from app.exceptions import NotFoundException, BadRequestException
+from app.tasks.cancel import INFERENCE, cancel_key, request_cancel
+from app.tasks.inference.detections import load_detections
+from app.tasks.inference.progress import get_progress
 import os
+import asyncio
+
+
+COUNT_CACHE_NAME = "inference_file"
+RELATION_FIELDS = {"original_file", "generated_file", "detections_file"}
 
 
 class InferenceService:
@@ -21,38 +32,70 @@ class InferenceService:
         content = await file.read()
         file_path = os.path.join(self.dir, file.filename)
         inference_file = await self.repository.save_original_file(file_path, content)
+        self.session.after_commit(partial(invalidate_count, self.redis, COUNT_CACHE_NAME))
         return { "original_file_name": inference_file.original_file_name, "id": inference_file.id }
     
     @transactional
-    async def update_generated_file(self, inference_file_id: int, generated_file_path: str) -> dict:
-        """생성된 파일을 저장하고 업데이트된 InferenceFile 객체를 반환합니다."""
-        inference_file = await self.repository.update_generated_file(inference_file_id, generated_file_path)
-        return inference_file.serialize()
+    async def update_generated_file(self, inference_file_id: int, generated_file_path: str, status: str = None,
+                                    generated_file_name: str = None, detections_file_path: str = None) -> dict:
+        """생성된 파일을 저장하고 업데이트된 InferenceFile 정보를 반환합니다. (status가 주어지면 상태도 함께 변경)"""
+        new_status = Status[status.upper()] if status else None
+        inference_file = await self.repository.update_generated_file(
+            inference_file_id, generated_file_path, new_status, generated_file_name, detections_file_path
+        )
+        return {
+            "id": inference_file.id,
+            "generated_file_name": inference_file.generated_file_name,
+            "status": inference_file.status.value,
+            "generated_file": inference_file.generated_file.serialize(),
+            "detections_file": inference_file.detections_file.serialize() if inference_file.detections_file else None,
+        }
 
     @transactional
     async def delete_file(self, inference_file_id: int) -> bool:
         """InferenceFile 객체를 삭제합니다."""
         await self.repository.delete_file(inference_file_id)
+        self.session.after_commit(partial(invalidate_count, self.redis, COUNT_CACHE_NAME))
         return True
     
+    @transactional
+    async def delete_files(self, inference_file_ids: List[int]) -> int:
+        """여러 InferenceFile 객체를 한 번에 삭제합니다."""
+        count = await self.repository.bulk_update_fields(inference_file_ids, is_delete=True)
+        self.session.after_commit(partial(invalidate_count, self.redis, COUNT_CACHE_NAME))
+        return count
+    
     async def get_file_by_id(self, inference_file_id: int) -> dict:
         """ID로 InferenceFile 객체를 조회합니다."""
         inference_file = await self.repository.get_inference_file_by_id(inference_file_id)
         return inference_file.serialize()
 
-    async def get_file_list(self, last_id: int = None) -> List[dict]:
-        """모든 InferenceFile 목록을 반환합니다."""
-        inference_files = await self.repository.list_files_with_filemeta(last_id=last_id)
-        return [inference_file.serialize() for inference_file in inference_files]
+    async def get_model_deployment(self, model_name: str) -> str:
+        """현재 배포된 모델 파일 digest (미배포이면 None)"""
+        return await self.repository.get_model_deployment(model_name)
+
+    async def get_file_list(self, last_id: int = None, limit: int = LIST_PAGE_SIZE, fields: List[str] = None) -> List[dict]:
+        """InferenceFile 목록을 반환합니다. (fields가 주어지면 해당 필드만, 관계 필드가 없으면 조인 생략)"""
+        with_relations = fields is None or bool(RELATION_FIELDS & set(fields))
+        inference_files = await self.repository.list_files_with_filemeta(last_id=last_id, limit=limit, with_relations=with_relations)
+        return [select_fields(inference_file.serialize(), fields) for inference_file in inference_files]
+
+    async def get_file_count(self) -> int:
+        """삭제되지 않은 InferenceFile 개수를 반환합니다. (캐시)"""
+        return await get_cached_count(self.redis, COUNT_CACHE_NAME, self.repository.count_files)
     
     async def get_file_status(self) -> List[dict]:
-        """모든 InferenceFile의 상태를 반환합니다."""
+        """모든 InferenceFile의 상태를 반환합니다. (실행 중인 비디오는 프레임 진행률 포함)"""
         inference_files = await self.repository.list_files()
+        running_ids = [inference_file.id for inference_file in inference_files if inference_file.status == Status.RUNNING]
+        progress = await get_progress(self.redis, running_ids)
+
         return [
             {
                 "id": inference_file.id,
                 "original_file_name": inference_file.original_file_name,
-                "status": inference_file.status.value
+                "status": inference_file.status.value,
+                "progress": progress.get(inference_file.id)
             }
             for inference_file in inference_files
         ]
@@ -64,9 +107,37 @@ class InferenceService:
         await self.repository.update_status(inference_file_id, new_status)
         return True
     
+    async def cancel_inference(self, inference_file_id: int) -> bool:
+        """대기/실행 중인 추론에 취소를 요청합니다. (워커가 프레임 처리 중 주기적으로 확인하여 중단)"""
+        inference_file = await self.repository.get_inference_file_by_id(inference_file_id)
+        if inference_file.status not in (Status.PENDING, Status.RUNNING):
+            raise BadRequestException(f"InferenceFile with ID '{inference_file_id}' is not pending or running.")
+
+        await request_cancel(self.redis, cancel_key(INFERENCE, inference_file_id))
+        return True
+
+    @transactional
+    async def update_statuses(self, inference_file_ids: List[int], status: str) -> int:
+        """여러 InferenceFile 객체의 상태를 한 번에 업데이트합니다."""
+        new_status = Status[status.upper()]
+        return await self.repository.bulk_update_fields(inference_file_ids, new_status)
+
     async def get_file_path(self, file_id: int) -> str:
         """ID로 InferenceFile의 파일 경로를 반환합니다."""
         return await self.repository.get_file_path(file_id)
+
+    async def get_detections(self, inference_file_id: int, start: float = None, end: float = None, classes: List[str] = None) -> dict:
+        """프레임별 검출 결과를 시간 구간(초)과 클래스로 필터링하여 반환합니다."""
+        inference_file = await self.repository.get_inference_file_by_id(inference_file_id)
+        if inference_file.detections_file is None:
+            raise NotFoundException(f"Detections for InferenceFile with ID '{inference_file_id}' not found.")
+
+        detections = await asyncio.to_thread(load_detections, inference_file.detections_file.filepath, start, end, classes)
+        return {"id": inference_file.id, **detections}
+
+    async def get_download_file(self, file_id: int) -> Tuple[str, str]:
+        """ID로 다운로드할 파일의 경로와 파일명을 반환합니다."""
+        return await self.repository.get_download_file(file_id)
     
 
 async def get_inference_service(redis=Depends(get_redis), session=Depends(get_session)):
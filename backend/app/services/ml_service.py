@@ -1,11 +1,19 @@
+from functools import partial
 from typing import List
 from fastapi import Depends
+from app.config import LIST_PAGE_SIZE
 from app.database import get_redis, get_session
 from app.repositories.ml_repository import MlRepository
-from app.dto import AiModelDTO
-from app.util import transactional
+from app.dto import AiModelDTO, TrainingOptions
+from app.cache import get_cached_count, invalidate_count, model_meta_cache
+from app.util import transactional, select_fields
 from app.entity import Status
-from app.exceptions import ForbiddenException
+from app.exceptions import ForbiddenException, BadRequestException
+from app.tasks.cancel import TRAIN, cancel_key, request_cancel, clear_cancel
+
+
+COUNT_CACHE_NAME = "ai_model"
+RELATION_FIELDS = {"base_model", "model_file", "deploy_file"}
 
 
 class MlService:
@@ -17,10 +25,11 @@ class MlService:
     @transactional
     async def init_model(self, model_name: str, base_model_name: str = None) -> int:
         model = await self.repository.get_model_by_name(model_name)
-        version = 1 if model is None else (model.version if model.status == Status.FAILED else model.version + 1)
+        version = 1 if model is None else (model.version if model.status in (Status.FAILED, Status.CANCELLED) else model.version + 1)
         id = await self.register_model(AiModelDTO(
             model_name=model_name, version=version, base_model_name=base_model_name
         ))
+        await clear_cancel(self.redis, cancel_key(TRAIN, id))  # 이전 학습의 취소 요청이 새 학습에 적용되지 않도록
 
         return version
 
@@ -32,11 +41,16 @@ class MlService:
                 raise ForbiddenException(f"Base model '{ai_model_dto.base_model_name}' is not complete and cannot be used.")
         
         new_model = await self.repository.register_model(ai_model_dto)
+        self.session.after_commit(partial(invalidate_count, self.redis, COUNT_CACHE_NAME))
+        self.session.after_commit(partial(model_meta_cache.invalidate, self.redis, new_model.id))
         return new_model.id
     
     @transactional
-    async def update_model(self, ai_model_dto: AiModelDTO) -> str:
-        update_model = await self.repository.update_model(ai_model_dto)
+    async def update_model(self, ai_model_dto: AiModelDTO, status: str = 'pending') -> str:
+        new_status = Status[status.upper()]
+        update_model = await self.repository.update_model(ai_model_dto, new_status)
+        self.session.after_commit(partial(invalidate_count, self.redis, COUNT_CACHE_NAME))  # 삭제된 모델이 복구될 수 있음
+        self.session.after_commit(partial(model_meta_cache.invalidate, self.redis, update_model.id))
         return update_model.modelname
 
     async def get_model_by_id(self, model_id: int) -> dict:
@@ -47,6 +61,27 @@ class MlService:
 
         return model.serialize()
     
+    async def get_model_meta(self, model_id: int) -> dict:
+        """추론/배포에 필요한 모델 메타데이터를 캐시에서 조회합니다."""
+        return await model_meta_cache.get(self.redis, model_id, self._load_model_meta)
+
+    async def _load_model_meta(self, model_id: int) -> dict:
+        model = await self.repository.get_model_by_id_with_filemeta(model_id)
+
+        if model is None:
+            return None
+
+        return {
+            "id": model.id,
+            "model_name": model.modelname,
+            "version": model.version,
+            "classes": model.classes.split(',') if model.classes else None,
+            "is_deploy": model.is_deploy,
+            "model_path": model.model_file.filepath if model.model_file else None,
+            "deploy_path": model.deploy_file.filepath if model.deploy_file else None,
+            "deploy_digest": model.deploy_digest,
+        }
+    
     async def get_model_by_name(self, model_name: str) -> dict:
         model = await self.repository.get_model_by_name_with_filemeta(model_name)
 
@@ -55,9 +90,13 @@ class MlService:
 
         return model.serialize()
 
-    async def get_model_list(self, last_id: int = None) -> List[dict]:
-        models = await self.repository.get_all_models_with_filemeta(last_id=last_id)
-        return [model.serialize() for model in models]
+    async def get_model_list(self, last_id: int = None, limit: int = LIST_PAGE_SIZE, fields: List[str] = None) -> List[dict]:
+        with_relations = fields is None or bool(RELATION_FIELDS & set(fields))
+        models = await self.repository.get_all_models_with_filemeta(last_id=last_id, limit=limit, with_relations=with_relations)
+        return [select_fields(model.serialize(), fields) for model in models]
+
+    async def get_model_count(self) -> int:
+        return await get_cached_count(self.redis, COUNT_CACHE_NAME, self.repository.count_models)
     
     async def get_model_status(self) -> List[dict]:
         result = []
@@ -78,28 +117,85 @@ class MlService:
         return result
     
     async def get_model_classes(self, model_id: int) -> List[str]:
-        model = await self.repository.get_model_by_id(model_id)
-        return model.classes.split(',') if model and model.classes else None
+        model = await self.get_model_meta(model_id)
+        return model['classes'] if model else None
 
     @transactional
     async def delete_model(self, model_id: int) -> None:
-        return await self.repository.delete_model(model_id=model_id)
+        await self.repository.delete_model(model_id=model_id)
+        self.session.after_commit(partial(invalidate_count, self.redis, COUNT_CACHE_NAME))
+        self.session.after_commit(partial(model_meta_cache.invalidate, self.redis, model_id))
+
+    @transactional
+    async def delete_models(self, model_ids: List[int]) -> int:
+        count = await self.repository.bulk_update_fields(model_ids, is_delete=True)
+        self.session.after_commit(partial(invalidate_count, self.redis, COUNT_CACHE_NAME))
+        self.session.after_commit(partial(model_meta_cache.invalidate, self.redis, *set(model_ids)))
+        return count
 
     @transactional
-    async def deploy_model(self, model_id: int, deploy_path: str) -> str:
-        model = await self.repository.deploy_model(model_id, deploy_path)
+    async def deploy_model(self, model_id: int, deploy_path: str, status: str = None) -> str:
+        new_status = Status[status.upper()] if status else None
+        model = await self.repository.deploy_model(model_id, deploy_path, new_status)
+        self.session.after_commit(partial(model_meta_cache.invalidate, self.redis, model_id))
         return model.modelname
     
     @transactional
-    async def undeploy_model(self, model_id: int) -> str:
-        model = await self.repository.undeploy_model(model_id)
+    async def undeploy_model(self, model_id: int, status: str = None) -> str:
+        new_status = Status[status.upper()] if status else None
+        model = await self.repository.undeploy_model(model_id, new_status)
+        self.session.after_commit(partial(model_meta_cache.invalidate, self.redis, model_id))
         return model.modelname
     
     @transactional
-    async def update_status(self, model_id: str, status: str):
+    async def update_status(self, model_id: str, status: str) -> str:
+        new_status = Status[status.upper()]
+        model = await self.repository.update_status(model_id, new_status)
+        return model.modelname
+
+
+    async def cancel_model(self, model_id: int) -> str:
+        """대기/실행 중인 모델 학습에 취소를 요청합니다. (워커가 epoch 종료 시점에 중단)"""
+        model = await self.repository.get_model_by_id(model_id)
+        if model.status not in (Status.PENDING, Status.RUNNING):
+            raise BadRequestException(f"Model with ID '{model_id}' is not pending or running.")
+
+        await request_cancel(self.redis, cancel_key(TRAIN, model_id))
+        return model.modelname
+
+    @transactional
+    async def update_training_run(self, model_id: int, run_dir: str = None, checkpoint_path: str = None) -> str:
+        """학습 실행 디렉터리와 마지막 체크포인트 경로를 기록합니다. (인자를 생략하면 초기화)"""
+        model = await self.repository.update_fields(model_id, run_dir=run_dir, checkpoint_path=checkpoint_path)
+        return model.modelname
+
+    @transactional
+    async def update_statuses(self, model_ids: List[int], status: str) -> int:
         new_status = Status[status.upper()]
+        return await self.repository.bulk_update_fields(model_ids, new_status)
+
+    async def resolve_training_options(self, profile_name: str = None, overrides: dict = None) -> dict:
+        """기본값 < 저장된 프로필 < 요청 값 순으로 학습 설정을 합칩니다."""
+        options = {}
+        if profile_name:
+            profile = await self.repository.get_profile_by_name(profile_name)
+            options.update(profile.options)
+        options.update(overrides or {})
 
-        return await self.repository.update_status(model_id, new_status)
+        return TrainingOptions(**options).to_dict()
+
+    @transactional
+    async def save_profile(self, name: str, options: dict) -> dict:
+        profile = await self.repository.save_profile(name, options)
+        return profile.serialize()
+
+    async def get_profile_list(self) -> List[dict]:
+        profiles = await self.repository.list_profiles()
+        return [profile.serialize() for profile in profiles]
+
+    @transactional
+    async def delete_profile(self, name: str) -> None:
+        await self.repository.delete_profile(name)
         
 
 async def get_ml_service(redis=Depends(get_redis), session=Depends(get_session)):
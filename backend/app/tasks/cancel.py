@@ -0,0 +1,68 @@
+"""
+학습/추론 task 협조적 취소 (Redis 플래그: cancel:{kind}:{id})
+
+API는 플래그만 설정하고, 워커는 학습 epoch 종료 시점과 비디오 프레임 처리 중 주기적으로 플래그를 확인하여
+TaskCancelled를 발생시킨다. 부분 결과 삭제와 cancelled 상태 기록은 task에서 처리한다.
+"""
+
+import os
+import time
+from contextlib import contextmanager
+from app.config import CANCEL_CHECK_INTERVAL, CANCEL_FLAG_TTL
+
+
+CANCEL_PREFIX = "cancel:"
+TRAIN = "train"
+INFERENCE = "inference"
+
+
+class TaskCancelled(Exception):
+    def __init__(self, key: str):
+        super().__init__(f"Task cancelled ({key})")
+        self.key = key
+
+
+def cancel_key(kind: str, id: int) -> str:
+    return f"{CANCEL_PREFIX}{kind}:{id}"
+
+
+async def request_cancel(redis, key: str, ttl: int = CANCEL_FLAG_TTL) -> None:
+    await redis.set(key, 1, ex=ttl)
+
+
+async def clear_cancel(redis, key: str) -> None:
+    await redis.delete(key)
+
+
+class CancelToken:
+    """sync Redis 클라이언트로 취소 플래그를 확인합니다. (interval 초에 한 번만 조회)"""
+
+    def __init__(self, redis, key: str, interval: float = CANCEL_CHECK_INTERVAL, clock=time.monotonic):
+        self.redis = redis
+        self.key = key
+        self.interval = interval
+        self.clock = clock
+        self.last_check = None
+
+    def is_cancelled(self) -> bool:
+        self.last_check = self.clock()
+        return bool(self.redis.exists(self.key))
+
+    def check(self) -> None:
+        """취소가 요청되었으면 TaskCancelled를 발생시킵니다."""
+        if self.last_check is not None and self.clock() - self.last_check < self.interval:
+            return
+        if self.is_cancelled():
+            raise TaskCancelled(self.key)
+
+
+@contextmanager
+def remove_on_cancel(*paths: str):
+    """블록 실행 중 취소되면 만들던 파일을 삭제합니다."""
+    try:
+        yield
+    except TaskCancelled:
+        for path in paths:
+            if path and os.path.exists(path):
+                os.remove(path)
+        raise
@@ -1,6 +1,9 @@
 import os
 import shutil
 import logging
+from app.config import TRITON_INSTANCE_COUNT
+from app.tasks.gpu import INFERENCE_POOL, pool_devices
+from app.metrics import time_triton
 from app.logger import LOGGER_NAME
 
 
@@ -43,14 +46,31 @@ def deploy_to_triton(model_name: str, version: int, model_path: str, triton_mode
         return False, None
 
 
+# 추론용 GPU 풀에 모델 인스턴스를 배치하는 instance_group (풀이 비어 있으면 Triton 기본값: GPU마다 인스턴스 1개)
+def triton_instance_group(devices: list, count: int = TRITON_INSTANCE_COUNT) -> str:
+    if not devices:
+        return ""
+
+    gpus = ', '.join(map(str, devices))
+    return f"""instance_group [
+  {{
+    count: {count}
+    kind: KIND_GPU
+    gpus: [ {gpus} ]
+  }}
+]
+"""
+
+
 # Triton 서버용 config.pbtxt 파일 생성
-def create_triton_config(model_name: str, model_path: str, output_dims: list):
+def create_triton_config(model_name: str, model_path: str, output_dims: list, devices: list = None):
     config_path = os.path.join(model_path, "config.pbtxt")
 
     if output_dims[0] == -1:
         output_dims = output_dims[1:]
     
     output_dims_str = ', '.join(map(str, output_dims))
+    devices = pool_devices(INFERENCE_POOL) if devices is None else devices
     
     config_content = f"""
 name: "{model_name}"
@@ -70,7 +90,7 @@ output [
     dims: [ {output_dims_str} ]
   }}
 ]
-"""
+{triton_instance_group(devices)}"""
 
     with open(config_path, "w") as f:
         f.write(config_content)
@@ -85,7 +105,8 @@ def load_model_to_triton(triton_server_url: str, model_name: str):
         triton_client = trtgrpc.InferenceServerClient(url=triton_server_url)
 
         # 모델을 명시적으로 로드하기 위한 gRPC 요청
-        triton_client.load_model(model_name)
+        with time_triton(model_name, 'load'):
+            triton_client.load_model(model_name)
         logger.info(f"Requested loading of model {model_name} on Triton server.")
         return True
 
@@ -1,6 +1,7 @@
 import os
 import shutil
 import logging
+from app.metrics import time_triton
 from app.logger import LOGGER_NAME
 
 
@@ -15,7 +16,8 @@ def undeploy_from_triton(model_name: str, triton_model_repo: str, triton_server_
         triton_client = trtgrpc.InferenceServerClient(url=triton_server_url)
 
         # 모델 언로드 요청
-        triton_client.unload_model(model_name)
+        with time_triton(model_name, 'unload'):
+            triton_client.unload_model(model_name)
         logger.info(f"Requested unloading of model {model_name} on Triton server.")
 
         # 모델 디렉터리 제거
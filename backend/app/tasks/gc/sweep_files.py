@@ -0,0 +1,63 @@
+import os
+import time
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, Iterator, List
+from app.logger import LOGGER_NAME
+
+
+logger = logging.getLogger(LOGGER_NAME)
+
+
+def _unlink(file_path: str) -> bool:
+    try:
+        os.remove(file_path)
+        return True
+    except FileNotFoundError:
+        return False
+    except Exception:
+        logger.error(f"Failed to remove file: {file_path}", exc_info=True)
+        return False
+
+
+# 스레드 풀에서 파일들을 동시에 삭제하고 실제로 삭제된 파일 수를 반환
+def unlink_files(file_paths: Iterable[str], max_workers: int = 8) -> int:
+    file_paths = [file_path for file_path in file_paths if file_path]
+    if not file_paths:
+        return 0
+
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(file_paths)))) as executor:
+        removed = sum(executor.map(_unlink, file_paths))
+
+    logger.info(f"Removed {removed}/{len(file_paths)} files")
+    return removed
+
+
+# 디렉터리 하위의 파일 경로를 chunk_size 단위로 반환 (older_than 초 이내에 수정된 파일과 exclude 디렉터리는 제외)
+def iter_file_chunks(directories: Iterable[str], chunk_size: int, older_than: float = 0,
+                     exclude: Iterable[str] = ()) -> Iterator[List[str]]:
+    threshold = time.time() - older_than
+    exclude = {os.path.abspath(directory) for directory in exclude if directory}
+    chunk = []
+
+    for directory in directories:
+        if not directory or not os.path.isdir(directory):
+            continue
+
+        for root, dirs, files in os.walk(directory):
+            dirs[:] = [name for name in dirs if os.path.abspath(os.path.join(root, name)) not in exclude]
+            for file in files:
+                file_path = os.path.join(root, file)
+                try:
+                    if os.path.getmtime(file_path) > threshold:
+                        continue
+                except FileNotFoundError:
+                    continue
+
+                chunk.append(file_path)
+                if len(chunk) >= chunk_size:
+                    yield chunk
+                    chunk = []
+
+    if chunk:
+        yield chunk
@@ -0,0 +1,155 @@
+"""
+GPU 스케줄러 (Redis 임대 키: gpu_lease:{pool}:{host}:{device}:{slot})
+
+워커는 학습을 시작하기 전에 학습용 장치 풀에서 비어 있는 GPU를 임대하고, 임대한 장치로만 학습한다.
+GPU가 여러 개 필요한 학습(DDP)은 필요한 수를 한 번에 모두 임대하거나 하나도 임대하지 않는다.
+임대 키는 TTL을 가지므로 워커가 비정상 종료되어도 일정 시간 뒤 장치가 반환되고, 학습 중에는 주기적으로 연장한다.
+(DDP 학습은 별도 프로세스에서 실행되어 epoch 콜백을 쓸 수 없으므로 부모 프로세스의 heartbeat 스레드에서 연장)
+
+추론은 워커가 아닌 Triton 서버의 GPU를 사용하므로 추론용 장치 풀은 Triton 모델 설정의 instance_group으로 적용한다.
+장치 목록은 GPU_DEVICES로 지정할 수 있어 GPU가 없는 환경에서도 가상의 장치로 스케줄링을 확인할 수 있다.
+"""
+
+import socket
+import logging
+from typing import Dict, List, Optional
+from app.config import (GPU_DEVICES, GPU_TRAIN_DEVICES, GPU_INFERENCE_DEVICES, GPU_TRAIN_JOBS_PER_DEVICE, GPU_LEASE_TTL)
+from app.logger import LOGGER_NAME
+
+
+logger = logging.getLogger(LOGGER_NAME)
+GPU_LEASE_PREFIX = "gpu_lease:"
+TRAIN_POOL = "train"
+INFERENCE_POOL = "inference"
+
+
+class GpuUnavailable(Exception):
+    def __init__(self, pool: str, count: int):
+        super().__init__(f"No free GPU in {pool} pool (requested: {count})")
+        self.pool = pool
+        self.count = count
+
+
+def parse_devices(value: str) -> List[int]:
+    """'0,1, 3' -> [0, 1, 3]"""
+    return sorted({int(device) for device in value.split(',') if device.strip()})
+
+
+def discover_devices(configured: str = GPU_DEVICES) -> List[int]:
+    """사용할 GPU 인덱스 목록 (GPU_DEVICES가 없으면 torch로 탐색, GPU가 없으면 빈 목록)"""
+    if configured:
+        return parse_devices(configured)
+
+    try:
+        import torch
+    except ImportError:
+        return []
+    return list(range(torch.cuda.device_count())) if torch.cuda.is_available() else []
+
+
+def pool_devices(pool: str, inventory: List[int] = None, train_devices: str = GPU_TRAIN_DEVICES,
+                 inference_devices: str = GPU_INFERENCE_DEVICES) -> List[int]:
+    """
+    풀별 장치 목록
+    - inference: GPU_INFERENCE_DEVICES (Triton이 별도 컨테이너에서 사용하므로 inventory와 무관)
+    - train: GPU_TRAIN_DEVICES, 없으면 inventory에서 추론용 장치를 제외 (남는 장치가 없으면 전체 공유)
+    """
+    if pool == INFERENCE_POOL:
+        return parse_devices(inference_devices)
+
+    inventory = discover_devices() if inventory is None else inventory
+    if train_devices:
+        return [device for device in parse_devices(train_devices) if device in inventory]
+
+    reserved = set(parse_devices(inference_devices))
+    return [device for device in inventory if device not in reserved] or list(inventory)
+
+
+class GpuLease:
+    """임대한 장치 목록, device는 ultralytics device 인자 형식 ('0', '0,1', 장치가 없으면 'cpu')"""
+
+    def __init__(self, scheduler: "GpuScheduler", devices: List[int], keys: List[str]):
+        self.scheduler = scheduler
+        self.devices = devices
+        self.keys = keys
+
+    @property
+    def device(self) -> str:
+        return ','.join(map(str, self.devices)) if self.devices else 'cpu'
+
+    def extend(self) -> None:
+        if not self.keys:
+            return
+        pipeline = self.scheduler.redis.pipeline()
+        for key in self.keys:
+            pipeline.expire(key, self.scheduler.ttl)
+        pipeline.execute()
+
+    def release(self) -> None:
+        if self.keys:
+            self.scheduler.redis.delete(*self.keys)
+            logger.info(f"GPU released ({self.scheduler.pool}: {self.device})")
+        self.keys = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.release()
+
+
+class GpuScheduler:
+    """sync Redis 클라이언트로 풀의 GPU를 임대합니다. (장치마다 slots개의 학습까지 동시에 할당)"""
+
+    def __init__(self, redis, pool: str, devices: List[int], slots: int = GPU_TRAIN_JOBS_PER_DEVICE,
+                 ttl: int = GPU_LEASE_TTL, host: str = None):
+        self.redis = redis
+        self.pool = pool
+        self.devices = list(devices)
+        self.slots = slots
+        self.ttl = ttl
+        self.host = host or socket.gethostname()
+
+    def lease_key(self, device: int, slot: int) -> str:
+        return f"{GPU_LEASE_PREFIX}{self.pool}:{self.host}:{device}:{slot}"
+
+    def occupancy(self) -> Dict[int, List[str]]:
+        """장치별 임대 중인 작업 목록"""
+        keys = [(device, self.lease_key(device, slot)) for device in self.devices for slot in range(self.slots)]
+        values = self.redis.mget([key for _, key in keys]) if keys else []
+        occupancy = {device: [] for device in self.devices}
+        for (device, _), owner in zip(keys, values):
+            if owner is not None:
+                occupancy[device].append(owner.decode('utf-8') if isinstance(owner, bytes) else owner)
+        return occupancy
+
+    def acquire(self, owner: str, count: int = 1) -> Optional[GpuLease]:
+        """
+        가장 덜 사용 중인 장치부터 count개의 장치를 임대합니다. 모두 임대할 수 없으면 None
+        풀에 장치가 없으면 (CPU 전용 환경) cpu 임대를 반환합니다.
+        """
+        if not self.devices:
+            return GpuLease(self, [], [])
+
+        count = min(count, len(self.devices))
+        occupancy = self.occupancy()
+        candidates = sorted(self.devices, key=lambda device: (len(occupancy[device]), device))
+
+        devices, keys = [], []
+        for device in candidates:
+            if len(devices) == count:
+                break
+            for slot in range(self.slots):
+                key = self.lease_key(device, slot)
+                if self.redis.set(key, owner, nx=True, ex=self.ttl):
+                    devices.append(device)
+                    keys.append(key)
+                    break
+
+        lease = GpuLease(self, sorted(devices), keys)
+        if len(devices) < count:  # 일부만 임대되었으면 반환
+            lease.release()
+            return None
+
+        logger.info(f"GPU leased ({self.pool}: {lease.device}, owner: {owner})")
+        return lease
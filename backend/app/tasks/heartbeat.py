@@ -0,0 +1,43 @@
+"""
+장시간 task 실행 중 주기적으로 작업(잠금/임대 연장 등)을 실행하는 백그라운드 스레드
+
+작업이 예외를 올려도 스레드는 멈추지 않고 다음 주기에 다시 실행한다.
+"""
+
+import logging
+import threading
+from typing import Callable
+from app.logger import LOGGER_NAME
+
+
+logger = logging.getLogger(LOGGER_NAME)
+
+
+class Heartbeat:
+    def __init__(self, interval: float, beat: Callable[[], None], name: str = "heartbeat"):
+        self.interval = interval
+        self.beat = beat
+        self.stopped = threading.Event()
+        self.thread = threading.Thread(target=self._run, name=name, daemon=True)
+
+    def _run(self) -> None:
+        while not self.stopped.wait(self.interval):
+            try:
+                self.beat()
+            except Exception:
+                logger.warning(f"Heartbeat failed ({self.thread.name})", exc_info=True)
+
+    def start(self) -> "Heartbeat":
+        self.thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.stopped.set()
+        if self.thread.is_alive():
+            self.thread.join()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
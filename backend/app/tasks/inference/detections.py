@@ -0,0 +1,121 @@
+"""
+프레임별 검출 결과를 열 단위 배열(NPZ)로 저장/조회
+
+frame, class_id, score, box(x, y, w, h), track_id(추적 미사용 시 -1) 배열과 fps, 원본 크기, 클래스 목록을 함께 저장하여
+영상을 다시 디코딩하거나 추론하지 않고도 결과를 조회/재렌더링할 수 있도록 한다.
+"""
+
+import numpy as np
+from typing import List, Optional, Union
+
+
+class DetectionWriter:
+    """프레임 단위로 검출 결과를 모아 NPZ 파일로 저장합니다."""
+
+    def __init__(self):
+        self.frames = []
+        self.class_ids = []
+        self.scores = []
+        self.boxes = []
+        self.inferred = []
+        self.track_ids = []
+
+    def add(self, frame_index: int, detections: list, inferred: bool = True, track_ids: list = None) -> None:
+        """detections: [(box(x, y, w, h), score, class_id), ...], inferred가 False이면 유지/보간/예측된 결과"""
+        for i, (box, score, class_id) in enumerate(detections):
+            self.frames.append(frame_index)
+            self.class_ids.append(class_id)
+            self.scores.append(score)
+            self.boxes.append(box)
+            self.inferred.append(inferred)
+            self.track_ids.append(track_ids[i] if track_ids else -1)
+
+    def __len__(self):
+        return len(self.frames)
+
+    def save(self, path: str, classes: List[str], fps: float = 0.0, width: int = 0, height: int = 0, frame_count: int = 1) -> str:
+        with open(path, 'wb') as f:
+            np.savez_compressed(
+                f,
+                frame=np.asarray(self.frames, dtype=np.int32),
+                class_id=np.asarray(self.class_ids, dtype=np.int16),
+                score=np.asarray(self.scores, dtype=np.float32),
+                box=np.asarray(self.boxes, dtype=np.float32).reshape(-1, 4),
+                inferred=np.asarray(self.inferred, dtype=bool),
+                track_id=np.asarray(self.track_ids, dtype=np.int32),
+                fps=np.float64(fps),
+                width=np.int32(width),
+                height=np.int32(height),
+                frame_count=np.int32(frame_count),
+                classes=np.asarray(classes, dtype=str),
+            )
+        return path
+
+
+def load_detections(
+    path: str,
+    start: Optional[float] = None,
+    end: Optional[float] = None,
+    classes: Optional[List[Union[str, int]]] = None
+) -> dict:
+    """
+    NPZ 검출 결과를 조회합니다.
+    start/end는 초 단위 구간(이미지는 0초), classes는 클래스 이름 또는 ID 목록입니다.
+    """
+    with np.load(path, allow_pickle=False) as data:
+        fps = float(data['fps'])
+        class_names = data['classes'].tolist()
+        frames = data['frame']
+        class_ids = data['class_id']
+        scores = data['score']
+        boxes = data['box']
+        inferred = data['inferred'] if 'inferred' in data else np.ones(len(frames), dtype=bool)
+        track_ids = data['track_id'] if 'track_id' in data else np.full(len(frames), -1, dtype=np.int32)
+        width, height = int(data['width']), int(data['height'])
+        frame_count = int(data['frame_count']) if 'frame_count' in data else None
+
+    times = frames / fps if fps > 0 else np.zeros(len(frames))
+    mask = np.ones(len(frames), dtype=bool)
+
+    if start is not None:
+        mask &= times >= start
+    if end is not None:
+        mask &= times <= end
+    if classes:
+        class_filter = [
+            class_names.index(name) if name in class_names else -1
+            for name in map(str, classes)
+        ]
+        class_filter += [int(class_id) for class_id in classes if str(class_id).isdigit()]
+        mask &= np.isin(class_ids, class_filter)
+
+    detections = [
+        {
+            "frame": frame,
+            "time": round(time, 3),
+            "class_id": class_id,
+            "class_name": class_names[class_id] if 0 <= class_id < len(class_names) else None,
+            "score": round(score, 4),
+            "box": box,
+            "inferred": is_inferred,
+            "track_id": track_id if track_id >= 0 else None,
+        }
+        for frame, time, class_id, score, box, is_inferred, track_id in zip(
+            frames[mask].tolist(),
+            times[mask].tolist(),
+            class_ids[mask].tolist(),
+            scores[mask].tolist(),
+            boxes[mask].tolist(),
+            inferred[mask].tolist(),
+            track_ids[mask].tolist(),
+        )
+    ]
+
+    return {
+        "fps": fps,
+        "width": width,
+        "height": height,
+        "frame_count": frame_count,
+        "classes": class_names,
+        "detections": detections,
+    }
@@ -0,0 +1,90 @@
+"""
+비디오 추론 프레임 샘플링
+
+stride마다 추론하고, motion_threshold가 주어지면 마지막 추론 프레임과의 차이가 작은 프레임은 건너뛴다.
+(max_stride 프레임이 지나면 움직임과 관계없이 추론)
+추론하지 않은 프레임의 박스는 직전 결과를 유지(hold)하거나 앞뒤 추론 결과로 보간(interpolate)하거나
+추적기로 예측(track, tracker.py)한다.
+"""
+
+import numpy as np
+
+
+BOX_MODES = ('hold', 'interpolate', 'track')
+THUMBNAIL_STEP = 8  # 움직임 비교용 축소 간격 (픽셀)
+MATCH_IOU_THRESHOLD = 0.3
+
+
+class FrameSampler:
+    def __init__(self, stride: int = 1, motion_threshold: float = 0.0, max_stride: int = 30):
+        self.stride = max(1, stride)
+        self.motion_threshold = motion_threshold
+        self.max_stride = max(self.stride, max_stride)
+        self.last_index = None
+        self.last_thumbnail = None
+
+    def should_infer(self, index: int, frame) -> bool:
+        """index 프레임을 추론해야 하는지 반환합니다. (추론 대상이면 기준 프레임으로 기록)"""
+        if self.last_index is not None:
+            gap = index - self.last_index
+            if gap < self.stride:
+                return False
+
+            if self.motion_threshold > 0 and gap < self.max_stride:
+                if motion_score(self.last_thumbnail, thumbnail(frame)) < self.motion_threshold:
+                    return False
+
+        self.last_index = index
+        self.last_thumbnail = thumbnail(frame) if self.motion_threshold > 0 else None
+        return True
+
+
+def thumbnail(frame) -> np.ndarray:
+    """움직임 비교용 축소 흑백 이미지"""
+    return frame[::THUMBNAIL_STEP, ::THUMBNAIL_STEP].mean(axis=2, dtype=np.float32)
+
+
+def motion_score(previous: np.ndarray, current: np.ndarray) -> float:
+    """두 축소 이미지의 평균 절대 차이 (0 ~ 1)"""
+    return float(np.abs(current - previous).mean() / 255.0)
+
+
+def iou(box_a, box_b) -> float:
+    """(x, y, w, h) 박스의 IoU"""
+    ax, ay, aw, ah = box_a
+    bx, by, bw, bh = box_b
+    inter_w = max(0, min(ax + aw, bx + bw) - max(ax, bx))
+    inter_h = max(0, min(ay + ah, by + bh) - max(ay, by))
+    inter = inter_w * inter_h
+    union = aw * ah + bw * bh - inter
+    return inter / union if union > 0 else 0.0
+
+
+def interpolate_detections(previous: list, following: list, ratio: float) -> list:
+    """
+    두 추론 결과 사이의 검출 결과를 선형 보간합니다. (ratio: 0 = previous, 1 = following)
+    같은 클래스에서 IoU가 가장 큰 박스끼리 짝지으며, 짝이 없는 이전 박스는 그대로 유지합니다.
+    """
+    detections, used = [], set()
+
+    for box, score, class_id in previous:
+        candidates = [
+            (iou(box, next_box), i)
+            for i, (next_box, _, next_class_id) in enumerate(following)
+            if next_class_id == class_id and i not in used
+        ]
+        best_iou, best = max(candidates, default=(0.0, None))
+
+        if best is None or best_iou < MATCH_IOU_THRESHOLD:
+            detections.append((box, score, class_id))
+            continue
+
+        used.add(best)
+        next_box, next_score, _ = following[best]
+        detections.append((
+            [int(round(a + (b - a) * ratio)) for a, b in zip(box, next_box)],
+            score + (next_score - score) * ratio,
+            class_id
+        ))
+
+    return detections
@@ -1,13 +1,59 @@
 import os
 import logging
+from typing import Tuple
+from app.dto import InferenceOptions
+from app.tasks.inference.detections import DetectionWriter
+from app.tasks.inference.frame_sampler import FrameSampler, interpolate_detections
+from app.tasks.inference.tracker import Tracker
+from app.tasks.inference.progress import ProgressReporter
+from app.tasks.cancel import CancelToken, remove_on_cancel
+from app.tasks.inference.video_io import resolve_backend, output_extension, open_video_reader, open_video_writer
+from app.metrics import time_stage, timed_iter, time_triton
 from app.logger import LOGGER_NAME
 
 
 logger = logging.getLogger(LOGGER_NAME)
+MODEL_INPUT_SIZE = 640
 
 
-def generate_inference_file(file_type: str, original_file_path: str, model_name: str, classes: list[str]) -> str:
-    """Inference 파일 생성 (이미지 또는 비디오)"""
+def postprocess_detections(output_data, original_dims, confidence_threshold: float, nms_threshold: float,
+                           input_size: int = MODEL_INPUT_SIZE) -> list:
+    """
+    Triton 출력(검출마다 x_min, y_min, x_max, y_max, confidence, class_id)을 원본 크기 좌표로 변환하고 NMS 적용
+    [([x, y, w, h], score, class_id), ...]를 반환
+    """
+    import cv2
+
+    boxes, scores, class_ids = [], [], []
+    x_scale, y_scale = original_dims[1] / input_size, original_dims[0] / input_size
+
+    for detection in output_data:
+        x_min, y_min, x_max, y_max, confidence, class_id = detection[:6]
+        if confidence >= confidence_threshold:
+            x_min, y_min = int(x_min * x_scale), int(y_min * y_scale)
+            x_max, y_max = int(x_max * x_scale), int(y_max * y_scale)
+            boxes.append([x_min, y_min, x_max - x_min, y_max - y_min])
+            scores.append(float(confidence))
+            class_ids.append(int(class_id))
+
+    indices = cv2.dnn.NMSBoxes(boxes, scores, confidence_threshold, nms_threshold)
+
+    if indices is None or len(indices) == 0:
+        return []
+
+    return [(boxes[i], scores[i], class_ids[i]) for i in indices.flatten()]
+
+
+def generate_inference_file(file_type: str, original_file_path: str, model_name: str, classes: list[str],
+                            output_name: str = None, output_dir: str = None, options: InferenceOptions = None,
+                            progress: ProgressReporter = None, cancel_token: CancelToken = None, triton_url: str = None) -> Tuple[str, str]:
+    """
+    Inference 파일 생성 (이미지 또는 비디오), (렌더링 파일 경로, 검출 결과 NPZ 경로)를 반환
+    output_name은 결과 파일명의 기준 (기본값: 원본 파일명), output_dir 기본값은 INFERENCE_DIRECTORY
+    progress가 주어지면 비디오 프레임 처리 진행률을 기록
+    cancel_token이 주어지면 프레임 처리 중 취소 여부를 확인하고, 취소되면 만들던 결과 파일을 삭제한 뒤 TaskCancelled 발생
+    triton_url 기본값은 TRITON_GRPC_URL
+    """
     # 필요한 모듈을 함수 내에서 로드
     import numpy as np
     import cv2
@@ -15,11 +61,15 @@ def generate_inference_file(file_type: str, original_file_path: str, model_name:
     from tritonclient.grpc import InferInput, InferRequestedOutput
     from app.config import TRITON_GRPC_URL, INFERENCE_DIRECTORY
 
-    confidence_threshold = 0.3
-    nms_threshold = 0.4
-    output_dir = INFERENCE_DIRECTORY
-    output_path = os.path.join(output_dir, f"detection_{os.path.basename(original_file_path)}")
-    triton_client = grpcclient.InferenceServerClient(url=TRITON_GRPC_URL)
+    options = options or InferenceOptions()
+    confidence_threshold = options.conf_threshold
+    nms_threshold = options.nms_threshold
+    output_dir = output_dir or INFERENCE_DIRECTORY
+    os.makedirs(output_dir, exist_ok=True)
+    output_path = os.path.join(output_dir, f"detection_{output_name or os.path.basename(original_file_path)}")
+    detections_path = f"{os.path.splitext(output_path)[0]}.npz"
+    detection_writer = DetectionWriter()
+    triton_client = grpcclient.InferenceServerClient(url=triton_url or TRITON_GRPC_URL)
 
     def _generate_primary_colors(num_colors):
         """기본 원색 계열 색상 생성"""
@@ -36,9 +86,11 @@ def generate_inference_file(file_type: str, original_file_path: str, model_name:
             colors.append(tuple(map(int, color)))
         return colors
     
-    def _draw_bounding_box(img, class_id, confidence, x, y, x_plus_w, y_plus_h, colors):
+    def _draw_bounding_box(img, class_id, confidence, x, y, x_plus_w, y_plus_h, colors, track_id=None):
         """Bounding Box 그리기"""
         label = f"{classes[class_id]} ({confidence:.2f})"
+        if track_id is not None:
+            label = f"#{track_id} {label}"
         color = colors[class_id % len(colors)]
         cv2.rectangle(img, (int(x), int(y)), (int(x_plus_w), int(y_plus_h)), color, 2)
         cv2.putText(img, label, (int(x), int(y) - 10), cv2.FONT_HERSHEY_PLAIN, 1.8, color, 2)
@@ -48,43 +100,39 @@ def generate_inference_file(file_type: str, original_file_path: str, model_name:
         inputs = [InferInput("images", image.shape, "FP32")]
         inputs[0].set_data_from_numpy(image)
         outputs = [InferRequestedOutput("output0")]
-        response = triton_client.infer(model_name=model_name, inputs=inputs, outputs=outputs)
+        with time_stage('infer'), time_triton(model_name, 'infer'):
+            response = triton_client.infer(model_name=model_name, inputs=inputs, outputs=outputs)
         output_data = response.as_numpy("output0")[0]
 
-        boxes, scores, class_ids = [], [], []
-        x_scale, y_scale = original_dims[1] / 640, original_dims[0] / 640
-
-        for detection in output_data:
-            x_min, y_min, x_max, y_max, confidence, class_id = detection[:6]
-            if confidence >= confidence_threshold:
-                x_min, y_min = int(x_min * x_scale), int(y_min * y_scale)
-                x_max, y_max = int(x_max * x_scale), int(y_max * y_scale)
-                boxes.append([x_min, y_min, x_max - x_min, y_max - y_min])
-                scores.append(float(confidence))
-                class_ids.append(int(class_id))
-
-        indices = cv2.dnn.NMSBoxes(boxes, scores, confidence_threshold, nms_threshold)
-
-        if indices is None or len(indices) == 0:
-            return []
-    
-        return [(boxes[i], scores[i], class_ids[i]) for i in indices.flatten()]
+        with time_stage('postprocess'):
+            return postprocess_detections(output_data, original_dims, confidence_threshold, nms_threshold)
     
-    def _process_frame(triton_client, model_name, frame, colors):
-        """개별 비디오 프레임을 처리"""
+    def _infer_frame(triton_client, model_name, frame):
+        """개별 비디오 프레임 추론"""
         original_dims = frame.shape[:2]
-        frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        processed_image = cv2.resize(frame_rgb, (640, 640)).astype(np.float32) / 255.0
-        processed_image = np.transpose(processed_image, (2, 0, 1))
-        processed_image = np.expand_dims(processed_image, axis=0)
+        with time_stage('preprocess'):
+            frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+            processed_image = cv2.resize(frame_rgb, (MODEL_INPUT_SIZE, MODEL_INPUT_SIZE)).astype(np.float32) / 255.0
+            processed_image = np.transpose(processed_image, (2, 0, 1))
+            processed_image = np.expand_dims(processed_image, axis=0)
 
-        detections = _infer_bounding_boxes(triton_client, model_name, processed_image, original_dims)
-        for (box, score, class_id) in detections:
+        return _infer_bounding_boxes(triton_client, model_name, processed_image, original_dims)
+
+    def _render_frame(frame, detections, colors, track_ids=None):
+        """개별 비디오 프레임에 bounding box 렌더링"""
+        frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+        for i, (box, score, class_id) in enumerate(detections):
             x, y, w, h = box
-            _draw_bounding_box(frame_rgb, class_id, score, x, y, x + w, y + h, colors)
+            track_id = track_ids[i] if track_ids else None
+            _draw_bounding_box(frame_rgb, class_id, score, x, y, x + w, y + h, colors, track_id)
 
         return cv2.cvtColor(frame_rgb, cv2.COLOR_RGB2BGR)
 
+    def _write_frame(out, frame_index, frame, detections, inferred, track_ids=None):
+        with time_stage('encode'):  # 박스 렌더링 + 인코딩
+            out.write(_render_frame(frame, detections, colors, track_ids))
+        detection_writer.add(frame_index, detections, inferred=inferred, track_ids=track_ids)
+
     if not os.path.exists(output_dir):
         os.makedirs(output_dir)
 
@@ -92,45 +140,91 @@ def generate_inference_file(file_type: str, original_file_path: str, model_name:
 
     if file_type == 'photo':
         # 사진에 대한 추론 로직
-        original_image = cv2.imread(original_file_path)
+        if cancel_token:
+            cancel_token.check()
+        with time_stage('decode'):
+            original_image = cv2.imread(original_file_path)
         if original_image is None:
             raise ValueError(f"Error: Could not read image {original_file_path}")
-        original_image = cv2.cvtColor(original_image, cv2.COLOR_BGR2RGB)
 
-        original_dims = original_image.shape[:2]
-        processed_image = cv2.resize(original_image, (640, 640)).astype(np.float32) / 255.0
-        processed_image = np.transpose(processed_image, (2, 0, 1))
-        processed_image = np.expand_dims(processed_image, axis=0)
+        with time_stage('preprocess'):
+            original_image = cv2.cvtColor(original_image, cv2.COLOR_BGR2RGB)
+            original_dims = original_image.shape[:2]
+            processed_image = cv2.resize(original_image, (MODEL_INPUT_SIZE, MODEL_INPUT_SIZE)).astype(np.float32) / 255.0
+            processed_image = np.transpose(processed_image, (2, 0, 1))
+            processed_image = np.expand_dims(processed_image, axis=0)
 
         detections = _infer_bounding_boxes(triton_client, model_name, processed_image, original_dims)
-        for (box, score, class_id) in detections:
-            x, y, w, h = box
-            _draw_bounding_box(original_image, class_id, score, x, y, x + w, y + h, colors)
+        with time_stage('encode'):
+            for (box, score, class_id) in detections:
+                x, y, w, h = box
+                _draw_bounding_box(original_image, class_id, score, x, y, x + w, y + h, colors)
+
+            output_image = cv2.cvtColor(original_image, cv2.COLOR_RGB2BGR)
+            cv2.imwrite(output_path, output_image)
 
-        output_image = cv2.cvtColor(original_image, cv2.COLOR_RGB2BGR)
-        cv2.imwrite(output_path, output_image)
-        return output_path
+        detection_writer.add(0, detections)
+        detection_writer.save(detections_path, classes, width=original_dims[1], height=original_dims[0])
+        return output_path, detections_path
 
     elif file_type == 'video':
         # 비디오에 대한 추론 로직
-        cap = cv2.VideoCapture(original_file_path)
-        width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
-        height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
-        fps = cap.get(cv2.CAP_PROP_FPS)
-
-        fourcc = cv2.VideoWriter_fourcc(*'mp4v')
-        out = cv2.VideoWriter(output_path, fourcc, fps, (width, height))
-
-        while True:
-            ret, frame = cap.read()
-            if not ret:
-                break
-            processed_frame = _process_frame(triton_client, model_name, frame, colors)
-            out.write(processed_frame)
-
-        cap.release()
-        out.release()
-        return output_path
+        backend = resolve_backend()
+        output_path = f"{os.path.splitext(output_path)[0]}{output_extension(backend, os.path.splitext(output_path)[1])}"
+        with remove_on_cancel(output_path), open_video_reader(original_file_path, backend) as reader, \
+                open_video_writer(output_path, reader.info, backend, audio_source=original_file_path) as out:
+            width, height, fps = reader.info.width, reader.info.height, reader.info.fps
+            if progress:
+                progress.start(reader.info.frame_count)
+
+            # stride/움직임 기준으로 추론할 프레임을 고르고, 나머지 프레임은 박스를 유지/보간하거나 추적기로 예측
+            sampler = FrameSampler(options.stride, options.motion_threshold, options.max_stride)
+            interpolate = options.box_mode == 'interpolate'
+            tracker = Tracker(max_age=2 * sampler.max_stride) if options.box_mode == 'track' else None
+            last_index, last_detections = None, []
+            pending_frames = []  # interpolate 모드: 다음 추론 프레임을 기다리는 프레임
+            frame_index, inferred_count = 0, 0
+
+            for frame in timed_iter(reader, 'decode'):
+                if sampler.should_infer(frame_index, frame):
+                    detections = _infer_frame(triton_client, model_name, frame)
+                    track_ids = None
+                    if tracker:
+                        detections, track_ids = tracker.update(detections)
+                    inferred_count += 1
+
+                    for pending_index, pending_frame in pending_frames:
+                        ratio = (pending_index - last_index) / (frame_index - last_index)
+                        _write_frame(out, pending_index, pending_frame, interpolate_detections(last_detections, detections, ratio), False)
+                    pending_frames = []
+
+                    _write_frame(out, frame_index, frame, detections, True, track_ids)
+                    last_index, last_detections = frame_index, detections
+                elif tracker:
+                    detections, track_ids = tracker.predict()
+                    _write_frame(out, frame_index, frame, detections, False, track_ids)
+                elif interpolate:
+                    pending_frames.append((frame_index, frame))
+                else:
+                    _write_frame(out, frame_index, frame, last_detections, False)
+
+                frame_index += 1
+                if progress:
+                    progress.advance()
+                if cancel_token:
+                    cancel_token.check()
+
+            # 마지막 추론 이후 프레임은 직전 결과를 유지
+            for pending_index, pending_frame in pending_frames:
+                _write_frame(out, pending_index, pending_frame, last_detections, False)
+
+            if progress:
+                progress.flush()
+
+        logger.info(f"Inferred {inferred_count}/{frame_index} frames (stride: {options.stride}, motion_threshold: {options.motion_threshold})")
+
+        detection_writer.save(detections_path, classes, fps=fps, width=width, height=height, frame_count=frame_index)
+        return output_path, detections_path
 
     else:
         logger.error(f"Unsupported file type: {file_type}")
@@ -0,0 +1,99 @@
+"""
+비디오 추론 진행률 (Redis hash: inference:progress:{inference_file_id})
+
+워커는 처리한 프레임 수를 모아 interval 초마다 한 번만 HINCRBY 하고,
+조회하는 쪽에서 started_at/done/total로 fps와 남은 시간(ETA)을 계산한다.
+분할 추론의 구간 task들도 같은 키의 done을 함께 증가시킨다.
+"""
+
+import time
+from typing import Dict, List, Optional
+from app.config import INFERENCE_PROGRESS_INTERVAL, INFERENCE_PROGRESS_TTL
+
+
+PROGRESS_PREFIX = "inference:progress:"
+
+
+def progress_key(inference_file_id: int) -> str:
+    return f"{PROGRESS_PREFIX}{inference_file_id}"
+
+
+class ProgressReporter:
+    """sync Redis 클라이언트로 진행률을 기록합니다. (owner가 아니면 total/started_at을 초기화하지 않음)"""
+
+    def __init__(self, redis, key: str, owner: bool = True, interval: float = INFERENCE_PROGRESS_INTERVAL,
+                 ttl: int = INFERENCE_PROGRESS_TTL, clock=time.monotonic):
+        self.redis = redis
+        self.key = key
+        self.owner = owner
+        self.interval = interval
+        self.ttl = ttl
+        self.clock = clock
+        self.pending = 0
+        self.last_flush = clock()
+
+    def start(self, total: int) -> None:
+        if self.owner:
+            start_progress(self.redis, self.key, total, self.ttl)
+        self.last_flush = self.clock()
+
+    def advance(self, frames: int = 1) -> None:
+        self.pending += frames
+        if self.clock() - self.last_flush >= self.interval:
+            self.flush()
+
+    def flush(self) -> None:
+        if self.pending:
+            pipeline = self.redis.pipeline()
+            pipeline.hincrby(self.key, 'done', self.pending)
+            pipeline.hset(self.key, 'updated_at', time.time())
+            pipeline.expire(self.key, self.ttl)
+            pipeline.execute()
+            self.pending = 0
+        self.last_flush = self.clock()
+
+
+def start_progress(redis, key: str, total: int, ttl: int = INFERENCE_PROGRESS_TTL) -> None:
+    now = time.time()
+    pipeline = redis.pipeline()
+    pipeline.hset(key, mapping={'done': 0, 'total': total, 'started_at': now, 'updated_at': now})
+    pipeline.expire(key, ttl)
+    pipeline.execute()
+
+
+def summarize_progress(values: Dict[bytes, bytes], now: Optional[float] = None) -> Optional[dict]:
+    """Redis hash 값으로 진행률(완료/전체 프레임, fps, ETA 초, 마지막 갱신 시각)을 계산합니다."""
+    if not values:
+        return None
+
+    values = {key.decode('utf-8'): float(value) for key, value in values.items()}
+    now = now or time.time()
+    done, total = int(values.get('done', 0)), int(values.get('total', 0))
+    elapsed = now - values.get('started_at', now)
+    fps = done / elapsed if elapsed > 0 else 0.0
+
+    return {
+        "done": done,
+        "total": total,
+        "percent": round(min(done / total, 1.0) * 100, 1) if total else None,
+        "fps": round(fps, 2),
+        "eta": round(max(total - done, 0) / fps, 1) if total and fps else None,
+        "updated_at": values.get('updated_at'),
+    }
+
+
+async def get_progress(redis, inference_file_ids: List[int]) -> Dict[int, dict]:
+    """여러 InferenceFile의 진행률을 한 번의 pipeline으로 조회합니다."""
+    if not inference_file_ids:
+        return {}
+
+    pipeline = redis.pipeline()
+    for inference_file_id in inference_file_ids:
+        pipeline.hgetall(progress_key(inference_file_id))
+    results = await pipeline.execute()
+
+    return {
+        inference_file_id: summarize_progress(values)
+        for inference_file_id, values in zip(inference_file_ids, results)
+        if values
+    }
@@ -0,0 +1,25 @@
+import os
+import uuid
+import shutil
+from typing import List
+
+
+# 작업 디렉터리에서 완성된 결과 파일을 결과 디렉터리로 옮기고 옮긴 경로를 반환
+# 결과 디렉터리에는 rename으로만 나타나므로 다른 작업이 만들다 만 파일을 참조하지 않는다.
+# (같은 이름의 파일이 이미 있으면 같은 캐시 키의 결과이므로 원자적으로 교체)
+def publish_files(file_paths: List[str], target_dir: str) -> List[str]:
+    os.makedirs(target_dir, exist_ok=True)
+    published = []
+
+    for file_path in file_paths:
+        target_path = os.path.join(target_dir, os.path.basename(file_path))
+        temp_path = f"{target_path}.{uuid.uuid4().hex}.tmp"
+        try:
+            shutil.move(file_path, temp_path)  # 다른 파일시스템이면 복사 후 교체
+            os.replace(temp_path, target_path)
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+        published.append(target_path)
+
+    return published
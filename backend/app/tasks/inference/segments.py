@@ -0,0 +1,97 @@
+"""
+긴 비디오 분할 추론 (split -> map -> reduce)
+
+원본을 키프레임 기준으로 재인코딩 없이 구간 분할하고, 구간별 추론 결과 영상은 재인코딩 없이 이어 붙이며,
+구간별 검출 결과(NPZ)는 프레임/트랙 ID 오프셋을 더해 하나로 합친다.
+"""
+
+import os
+import glob
+import logging
+import subprocess
+import numpy as np
+from typing import List
+from app.config import FFMPEG_BINARY, FFPROBE_BINARY
+from app.logger import LOGGER_NAME
+
+
+logger = logging.getLogger(LOGGER_NAME)
+SEGMENT_PREFIX = "segment_"
+
+
+def get_duration(path: str) -> float:
+    """비디오 길이(초), 알 수 없으면 0"""
+    result = subprocess.run(
+        [FFPROBE_BINARY, '-v', 'error', '-show_entries', 'format=duration', '-of', 'csv=p=0', path],
+        capture_output=True, text=True
+    )
+    try:
+        return float(result.stdout.strip())
+    except ValueError:
+        return 0.0
+
+
+def split_video(path: str, output_dir: str, segment_seconds: int) -> List[str]:
+    """키프레임 기준으로 segment_seconds 길이 내외의 구간으로 분할하고 구간 파일 경로 목록을 반환합니다."""
+    os.makedirs(output_dir, exist_ok=True)
+    extension = os.path.splitext(path)[1]
+
+    _run_ffmpeg([
+        '-i', path, '-map', '0', '-c', 'copy',
+        '-f', 'segment', '-segment_time', str(segment_seconds), '-reset_timestamps', '1',
+        os.path.join(output_dir, f"{SEGMENT_PREFIX}%04d{extension}")
+    ])
+    return sorted(glob.glob(os.path.join(output_dir, f"{SEGMENT_PREFIX}*{extension}")))
+
+
+def concat_videos(paths: List[str], output_path: str) -> str:
+    """같은 인코딩 설정의 구간 영상들을 재인코딩 없이 이어 붙입니다."""
+    list_path = f"{output_path}.txt"
+    with open(list_path, 'w') as f:
+        for path in paths:
+            escaped_path = os.path.abspath(path).replace("'", "'\\''")
+            f.write(f"file '{escaped_path}'\n")
+
+    try:
+        _run_ffmpeg(['-f', 'concat', '-safe', '0', '-i', list_path, '-c', 'copy', '-movflags', '+faststart', output_path])
+    finally:
+        os.remove(list_path)
+    return output_path
+
+
+def merge_detections(paths: List[str], output_path: str) -> str:
+    """구간별 검출 결과를 프레임 번호와 트랙 ID를 이어지도록 보정하여 합칩니다."""
+    columns = {'frame': [], 'class_id': [], 'score': [], 'box': [], 'inferred': [], 'track_id': []}
+    frame_offset, track_offset = 0, 0
+    meta = None
+
+    for path in paths:
+        with np.load(path, allow_pickle=False) as data:
+            if meta is None:
+                meta = {key: data[key] for key in ('fps', 'width', 'height', 'classes')}
+
+            track_ids = data['track_id']
+            columns['frame'].append(data['frame'] + frame_offset)
+            columns['class_id'].append(data['class_id'])
+            columns['score'].append(data['score'])
+            columns['box'].append(data['box'])
+            columns['inferred'].append(data['inferred'])
+            columns['track_id'].append(np.where(track_ids >= 0, track_ids + track_offset, -1).astype(np.int32))
+
+            frame_offset += int(data['frame_count'])
+            track_offset += int(track_ids.max(initial=0))
+
+    with open(output_path, 'wb') as f:
+        np.savez_compressed(
+            f,
+            **{key: np.concatenate(values) for key, values in columns.items()},
+            **meta,
+            frame_count=np.int32(frame_offset),
+        )
+    return output_path
+
+
+def _run_ffmpeg(args: List[str]) -> None:
+    result = subprocess.run([FFMPEG_BINARY, '-y', '-v', 'error', *args], capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(f"ffmpeg failed ({result.returncode}): {result.stderr.strip()}")
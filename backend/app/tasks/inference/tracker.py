@@ -0,0 +1,126 @@
+"""
+IoU 매칭 + 칼만 필터 기반 경량 다중 객체 추적 (NumPy only)
+
+추론 프레임에서는 검출 결과와 트랙을 IoU로 짝지어 보정(update)하고,
+추론하지 않은 프레임에서는 등속 모델로 박스를 예측(predict)하여 트랙 ID와 함께 전달한다.
+"""
+
+import numpy as np
+from app.tasks.inference.frame_sampler import iou
+
+
+class KalmanBoxTracker:
+    """상태: [cx, cy, w, h, vx, vy, vw, vh] (프레임당 등속 모델)"""
+
+    F = np.eye(8) + np.eye(8, k=4)
+    H = np.eye(4, 8)
+    Q = np.diag([1.0, 1.0, 1.0, 1.0, 0.01, 0.01, 0.01, 0.01])
+    R = np.diag([10.0, 10.0, 10.0, 10.0])
+
+    def __init__(self, track_id: int, box, score: float, class_id: int):
+        self.track_id = track_id
+        self.score = score
+        self.class_id = class_id
+        self.x = np.zeros(8)
+        self.x[:4] = to_center(box)
+        self.P = np.diag([10.0, 10.0, 10.0, 10.0, 1000.0, 1000.0, 1000.0, 1000.0])
+        self.time_since_update = 0
+        self.visible = True  # 마지막 추론 프레임에서 검출되었는지 여부
+
+    def predict(self) -> None:
+        self.x = self.F @ self.x
+        self.x[2:4] = np.maximum(self.x[2:4], 1.0)
+        self.P = self.F @ self.P @ self.F.T + self.Q
+        self.time_since_update += 1
+
+    def update(self, box, score: float) -> None:
+        y = to_center(box) - self.H @ self.x
+        S = self.H @ self.P @ self.H.T + self.R
+        K = self.P @ self.H.T @ np.linalg.inv(S)
+        self.x = self.x + K @ y
+        self.P = (np.eye(8) - K @ self.H) @ self.P
+        self.score = score
+        self.time_since_update = 0
+        self.visible = True
+
+    @property
+    def box(self) -> list:
+        return to_box(self.x[:4])
+
+
+class Tracker:
+    def __init__(self, iou_threshold: float = 0.3, max_age: int = 30):
+        self.iou_threshold = iou_threshold
+        self.max_age = max_age  # 이 프레임 수 동안 매칭되지 않은 트랙은 제거
+        self.tracks = []
+        self.next_id = 1
+
+    def predict(self) -> tuple[list, list]:
+        """추론하지 않은 프레임: 보이는 트랙의 박스를 한 프레임 예측하여 (detections, track_ids)로 반환합니다."""
+        for track in self.tracks:
+            track.predict()
+        self._remove_stale_tracks()
+
+        visible = [track for track in self.tracks if track.visible]
+        return [(track.box, track.score, track.class_id) for track in visible], [track.track_id for track in visible]
+
+    def update(self, detections: list) -> tuple[list, list]:
+        """추론 프레임: 검출 결과를 트랙에 매칭하고 검출 결과별 트랙 ID를 반환합니다."""
+        for track in self.tracks:
+            track.predict()
+
+        track_ids = [None] * len(detections)
+        for track_index, detection_index in self._associate(detections):
+            track = self.tracks[track_index]
+            box, score, _ = detections[detection_index]
+            track.update(box, score)
+            track_ids[detection_index] = track.track_id
+
+        for track in self.tracks:
+            if track.time_since_update > 0:
+                track.visible = False
+
+        for detection_index, (box, score, class_id) in enumerate(detections):
+            if track_ids[detection_index] is None:
+                track = KalmanBoxTracker(self.next_id, box, score, class_id)
+                self.tracks.append(track)
+                track_ids[detection_index] = track.track_id
+                self.next_id += 1
+
+        self._remove_stale_tracks()
+        return detections, track_ids
+
+    # 같은 클래스끼리 IoU가 큰 순서로 탐욕적 매칭
+    def _associate(self, detections: list) -> list:
+        pairs = [
+            (iou(track.box, box), track_index, detection_index)
+            for track_index, track in enumerate(self.tracks)
+            for detection_index, (box, _, class_id) in enumerate(detections)
+            if track.class_id == class_id
+        ]
+        pairs.sort(reverse=True)
+
+        matches, used_tracks, used_detections = [], set(), set()
+        for score, track_index, detection_index in pairs:
+            if score < self.iou_threshold:
+                break
+            if track_index in used_tracks or detection_index in used_detections:
+                continue
+            matches.append((track_index, detection_index))
+            used_tracks.add(track_index)
+            used_detections.add(detection_index)
+
+        return matches
+
+    def _remove_stale_tracks(self) -> None:
+        self.tracks = [track for track in self.tracks if track.time_since_update <= self.max_age]
+
+
+def to_center(box) -> np.ndarray:
+    x, y, w, h = box
+    return np.array([x + w / 2, y + h / 2, w, h], dtype=float)
+
+
+def to_box(center) -> list:
+    cx, cy, w, h = center
+    return [int(round(cx - w / 2)), int(round(cy - h / 2)), int(round(w)), int(round(h))]
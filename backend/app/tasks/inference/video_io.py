@@ -0,0 +1,215 @@
+"""
+비디오 디코딩/인코딩 백엔드
+
+- opencv: cv2.VideoCapture / cv2.VideoWriter(mp4v), 오디오 없음
+- pyav: FFmpeg(PyAV) 멀티스레드 디코딩, H.264(CRF/preset) 인코딩, 오디오 트랙 그대로 복사, faststart mp4
+
+프레임은 두 백엔드 모두 BGR numpy 배열로 주고받는다.
+"""
+
+import logging
+from dataclasses import dataclass
+from fractions import Fraction
+from app.config import VIDEO_BACKEND, VIDEO_CODEC, VIDEO_CRF, VIDEO_PRESET
+from app.logger import LOGGER_NAME
+
+
+logger = logging.getLogger(LOGGER_NAME)
+VIDEO_BACKENDS = ('opencv', 'pyav')
+
+
+@dataclass
+class VideoInfo:
+    fps: float
+    width: int
+    height: int
+    frame_count: int = 0  # 알 수 없으면 0
+
+
+def resolve_backend(backend: str = VIDEO_BACKEND) -> str:
+    """pyav 백엔드를 사용할 수 없으면 opencv로 대체합니다."""
+    if backend not in VIDEO_BACKENDS:
+        raise ValueError(f"Unsupported video backend: {backend}. Supported backends are: {VIDEO_BACKENDS}.")
+
+    if backend == 'pyav':
+        try:
+            import av  # noqa: F401
+        except ImportError:
+            logger.warning("PyAV is not installed. falling back to opencv video backend.")
+            return 'opencv'
+    return backend
+
+
+def output_extension(backend: str, source_extension: str) -> str:
+    """pyav 백엔드는 브라우저에서 바로 재생 가능한 mp4로 저장합니다."""
+    return '.mp4' if backend == 'pyav' else source_extension
+
+
+def probe_video(path: str, backend: str) -> VideoInfo:
+    with open_video_reader(path, backend) as reader:
+        return reader.info
+
+
+def open_video_reader(path: str, backend: str):
+    return PyAVReader(path) if backend == 'pyav' else OpenCVReader(path)
+
+
+def open_video_writer(path: str, info: VideoInfo, backend: str, audio_source: str = None,
+                      codec: str = VIDEO_CODEC, crf: int = VIDEO_CRF, preset: str = VIDEO_PRESET):
+    if backend == 'pyav':
+        return PyAVWriter(path, info, audio_source, codec, crf, preset)
+    return OpenCVWriter(path, info)
+
+
+class OpenCVReader:
+    def __init__(self, path: str):
+        import cv2
+
+        self.capture = cv2.VideoCapture(path)
+        self.info = VideoInfo(
+            fps=self.capture.get(cv2.CAP_PROP_FPS),
+            width=int(self.capture.get(cv2.CAP_PROP_FRAME_WIDTH)),
+            height=int(self.capture.get(cv2.CAP_PROP_FRAME_HEIGHT)),
+            frame_count=max(int(self.capture.get(cv2.CAP_PROP_FRAME_COUNT)), 0),
+        )
+
+    def __iter__(self):
+        while True:
+            ret, frame = self.capture.read()
+            if not ret:
+                return
+            yield frame
+
+    def close(self):
+        self.capture.release()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class OpenCVWriter:
+    def __init__(self, path: str, info: VideoInfo):
+        import cv2
+
+        fourcc = cv2.VideoWriter_fourcc(*'mp4v')
+        self.writer = cv2.VideoWriter(path, fourcc, info.fps, (info.width, info.height))
+
+    def write(self, frame):
+        self.writer.write(frame)
+
+    def close(self):
+        self.writer.release()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class PyAVReader:
+    def __init__(self, path: str):
+        import av
+
+        self.container = av.open(path)
+        self.stream = self.container.streams.video[0]
+        self.stream.thread_type = 'AUTO'  # 프레임/슬라이스 멀티스레드 디코딩
+        fps = float(self.stream.average_rate or self.stream.guessed_rate or 30)
+        duration = float(self.stream.duration * self.stream.time_base) if self.stream.duration else 0.0
+        self.info = VideoInfo(
+            fps=fps,
+            width=self.stream.codec_context.width,
+            height=self.stream.codec_context.height,
+            frame_count=self.stream.frames or int(round(duration * fps)),
+        )
+
+    def __iter__(self):
+        for frame in self.container.decode(self.stream):
+            yield frame.to_ndarray(format='bgr24')
+
+    def close(self):
+        self.container.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class PyAVWriter:
+    def __init__(self, path: str, info: VideoInfo, audio_source: str = None,
+                 codec: str = VIDEO_CODEC, crf: int = VIDEO_CRF, preset: str = VIDEO_PRESET):
+        import av
+
+        self.av = av
+        self.audio_source = audio_source
+        self.container = av.open(path, mode='w', options={'movflags': 'faststart'})
+        self.stream = self.container.add_stream(
+            codec,
+            rate=Fraction(info.fps).limit_denominator(1001) if info.fps else 30,
+            options={'crf': str(crf), 'preset': preset},
+        )
+        # yuv420p는 짝수 크기만 허용
+        self.stream.width = info.width - info.width % 2
+        self.stream.height = info.height - info.height % 2
+        self.stream.pix_fmt = 'yuv420p'
+        self.stream.thread_type = 'AUTO'
+
+        self.audio_input, self.audio_stream = self._add_audio_stream(audio_source)
+
+    def write(self, frame):
+        if frame.shape[1] != self.stream.width or frame.shape[0] != self.stream.height:
+            frame = frame[:self.stream.height, :self.stream.width]
+        video_frame = self.av.VideoFrame.from_ndarray(frame, format='bgr24')
+        for packet in self.stream.encode(video_frame):
+            self.container.mux(packet)
+
+    def close(self):
+        try:
+            for packet in self.stream.encode():  # 인코더 flush
+                self.container.mux(packet)
+            self._copy_audio()
+        finally:
+            if self.audio_input:
+                self.audio_input.close()
+            self.container.close()
+
+    # 원본 오디오 트랙을 재인코딩 없이 복사 (mp4에 담을 수 없는 코덱이면 생략)
+    def _add_audio_stream(self, audio_source: str):
+        if not audio_source:
+            return None, None
+
+        audio_input = self.av.open(audio_source)
+        if not audio_input.streams.audio:
+            audio_input.close()
+            return None, None
+
+        try:
+            return audio_input, self.container.add_stream(template=audio_input.streams.audio[0])
+        except Exception:
+            logger.warning(f"Audio track of {audio_source} can not be copied. skip audio.", exc_info=True)
+            audio_input.close()
+            return None, None
+
+    def _copy_audio(self):
+        if not self.audio_stream:
+            return
+
+        try:
+            for packet in self.audio_input.demux(self.audio_input.streams.audio[0]):
+                if packet.dts is None:
+                    continue
+                packet.stream = self.audio_stream
+                self.container.mux(packet)
+        except Exception:
+            logger.warning(f"Failed to copy audio track of {self.audio_source}.", exc_info=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
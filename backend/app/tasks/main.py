@@ -1,81 +1,115 @@
-from celery import Celery
-from app.config import CELERY_BROKER_URL, CELERY_ML_RUNS_PATH, MODEL_REPOSITORY, TRITON_GRPC_URL
+from celery import Celery, chord
+from app.config import (CELERY_BROKER_URL, CELERY_RESULT_BACKEND, CELERY_ML_RUNS_PATH, MODEL_REPOSITORY, TRITON_GRPC_URL,
+                        CELERY_TRAIN_QUEUE, CELERY_INFERENCE_QUEUE, CELERY_IO_QUEUE, CELERY_DEPLOY_QUEUE,
+                        CELERY_DEFAULT_PRIORITY, INFERENCE_SEGMENT_PRIORITY, CELERY_VISIBILITY_TIMEOUT, TRAIN_LOCK_TTL, TRAIN_HEARTBEAT_SECONDS, TRAIN_MAX_RETRIES, TRAIN_RETRY_SECONDS, GC_INTERVAL_SECONDS,
+                        TRAIN_IMAGE_CACHE_ENABLED, TRAIN_IMAGE_CACHE_DIRECTORY, TRAIN_IMAGE_CACHE_TTL,
+                        TRAIN_EXTRACT_CACHE_DIRECTORY, TRAIN_EXTRACT_CACHE_TTL, GPU_RETRY_SECONDS, INFERENCE_DIRECTORY, INFERENCE_RESULT_DIRECTORY_NAME, INFERENCE_SEGMENT_DIRECTORY, INFERENCE_STAGING_DIRECTORY,
+                        INFERENCE_SEGMENT_SECONDS, INFERENCE_SPLIT_MIN_SECONDS)
 from app.tasks.valid.valid_archive import parse_and_verify_zip
-from app.tasks.train.merge_archive import merge_archive_files
-from app.tasks.train.create_ml_model import create_yolo_model
+from app.tasks.train.merge_archive import merge_archive_files, load_merged_classes
+from app.tasks.train.image_cache import prune_image_cache
+from app.tasks.train.extract_cache import prune_extract_cache
+from app.tasks.train.create_ml_model import create_yolo_model, get_checkpoint_path, TrainingFailed
 from app.tasks.deploy.deploy_ml_model import deploy_to_triton
 from app.tasks.deploy.undeploy_ml_model import undeploy_from_triton
 from app.tasks.inference.generate_inference_file import generate_inference_file
+from app.tasks.inference.segments import get_duration, split_video, concat_videos, merge_detections
+from app.tasks.inference.progress import ProgressReporter, progress_key, start_progress
+from app.tasks.inference.video_io import resolve_backend, probe_video
+from app.tasks.inference.publish import publish_files
+from app.tasks.heartbeat import Heartbeat
+from app.tasks.gpu import GpuScheduler, GpuUnavailable, TRAIN_POOL, pool_devices
+from app.tasks.cancel import TRAIN, INFERENCE, CancelToken, TaskCancelled, cancel_key, clear_cancel
 from app.services.dataset_service import DataSetService
 from app.services.ml_service import MlService
 from app.services.inference_service import InferenceService
-from app.dto import AiModelDTO
-from app.database import get_redis, get_session
+from app.services.gc_service import GarbageCollectService
+from app.dto import AiModelDTO, InferenceOptions, TrainingOptions
+from app.entity import Status
+from app.cache import inference_result_key, get_inference_result, set_inference_result
 from app.repositories.inference_repository import FileType
+from app.tasks.worker import get_worker_context, run_in_worker_loop
+from app.tasks import task_metrics  # noqa: F401 (Celery 신호 처리기 등록)
 from app.logger import init_logger, LOGGER_NAME
 import os
+import uuid
+import shutil
 import asyncio
-import redis
-from datetime import datetime
 import logging
 
 
 redis_url = CELERY_BROKER_URL
-app = Celery('tasks', broker=redis_url)
+app = Celery('tasks', broker=redis_url, backend=CELERY_RESULT_BACKEND)
+app.conf.task_ignore_result = True  # 결과 저장은 chord에 필요한 task만 (ignore_result=False)
+
+# 작업 성격별 큐 분리: 장시간 학습이 추론/검증을 막지 않도록 큐마다 별도 워커가 소비한다. (docker-compose 참고)
+app.conf.task_routes = {
+    'app.tasks.main.train_model_task': {'queue': CELERY_TRAIN_QUEUE},
+    'app.tasks.main.generate_inference_task': {'queue': CELERY_INFERENCE_QUEUE},
+    'app.tasks.main.generate_segment_task': {'queue': CELERY_INFERENCE_QUEUE, 'priority': INFERENCE_SEGMENT_PRIORITY},
+    'app.tasks.main.deploy_model_task': {'queue': CELERY_DEPLOY_QUEUE},
+    'app.tasks.main.undeploy_model_task': {'queue': CELERY_DEPLOY_QUEUE},
+    'app.tasks.main.*': {'queue': CELERY_IO_QUEUE},  # 검증, 데이터셋 병합, 구간 결과 병합, GC
+}
+app.conf.task_default_queue = CELERY_IO_QUEUE
+app.conf.task_default_priority = CELERY_DEFAULT_PRIORITY
+app.conf.broker_transport_options = {
+    'priority_steps': list(range(10)),  # 0 ~ 9 우선순위를 모두 구분
+    'sep': ':',
+    'queue_order_strategy': 'priority',
+    'visibility_timeout': CELERY_VISIBILITY_TIMEOUT,  # 학습 task는 완료 후 ack (acks_late)
+}
+app.conf.worker_prefetch_multiplier = 1  # 미리 가져간 메시지 때문에 높은 우선순위 작업이 밀리지 않도록
+app.conf.beat_schedule = {
+    'collect-garbage': {
+        'task': 'app.tasks.main.collect_garbage_task',
+        'schedule': GC_INTERVAL_SECONDS,
+    },
+}
 
 init_logger()
 logger = logging.getLogger(LOGGER_NAME)
+TRAIN_LOCK_PREFIX = "train_lock:"
 
 
 # set redis key value
 def redis_status_handler(ri_key, status):
-    ri = redis.from_url(redis_url)
-    ri.set(ri_key, status)
-    ri.close()   
+    get_worker_context().sync_redis.set(ri_key, status)
 
 
+# 워커 공유 풀에서 세션과 Redis 연결을 빌려 서비스 실행
 async def with_service(service_class, func, *args, **kwargs):
-    async for redis_instance in get_redis():
-        async for session_instance in get_session():
+    context = get_worker_context()
+    redis_instance = context.redis()
+    try:
+        async with context.session_factory() as session_instance:
             await session_instance.begin()
             service = service_class(redis=redis_instance, session=session_instance)
             try:
                 result = await func(service, *args, **kwargs)
-                await session_instance.commit()  
+                await session_instance.commit()
                 return result
             except Exception as e:
                 await session_instance.rollback()
-                raise e  
-            finally:
-                await session_instance.close()
+                raise e
+    finally:
+        await redis_instance.aclose()
 
 
 # 특정 패턴의 키를 redis 에서 삭제
 def clear_redis_keys_sync(key_pattern: str):
-    ri = redis.from_url(redis_url)
-    
+    ri = get_worker_context().sync_redis
+
     cursor = "0"
     while cursor != 0:
         cursor, keys = ri.scan(cursor=cursor, match=key_pattern, count=100)
         if keys:
             ri.delete(*keys)
 
-    ri.close()
-
-def get_event_loop():
-    try:
-        loop = asyncio.get_event_loop()
-    except RuntimeError:
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-
-    return loop
-
 
 @app.task
 def valid_archive_task(id):
-    loop = get_event_loop()
-    return loop.run_until_complete(with_service(DataSetService, valid_archive, id=id))
+    return run_in_worker_loop(with_service(DataSetService, valid_archive, id=id))
 
 
 # 아카이브 검사 (디렉터리 및 yaml 내용 체크)
@@ -86,7 +120,7 @@ async def valid_archive(dataset_service: DataSetService, id: int):
         await dataset_service.update_status(id, 'running')
         await dataset_service.session.commit()
 
-        result = parse_and_verify_zip(zip_path)
+        result = await asyncio.to_thread(parse_and_verify_zip, zip_path)
         status = "complete" if result else "failed"
 
         await dataset_service.update_status(id, status) 
@@ -97,61 +131,168 @@ async def valid_archive(dataset_service: DataSetService, id: int):
         return False
 
 
-@app.task
-def create_model_task(model_name: str, model_ext: str, version: int, zip_file_paths: list[str]):
-    loop = get_event_loop()
-    return loop.run_until_complete(with_service(MlService, create_model, model_name=model_name, model_ext=model_ext, version=version, zip_file_paths=zip_file_paths))
+# 워커가 학습 도중 종료되면 ack되지 않은 메시지가 다시 전달되어 체크포인트부터 이어서 학습한다.
+@app.task(acks_late=True, reject_on_worker_lost=True)
+def create_model_task(model_name: str, model_ext: str, version: int, zip_file_paths: list[str], options: dict = None):
+    return run_in_worker_loop(with_service(MlService, create_model, model_name=model_name, model_ext=model_ext, version=version, zip_file_paths=zip_file_paths, options=options))
 
 
-# zip_files를 기반으로 학습하고 생성된 모델 저장
-async def create_model(ml_service: MlService, model_name: str, model_ext: str, version: int, zip_file_paths: list[str]):
+# 모델 버전별로 고정된 학습 실행 디렉터리 (재시도 시 같은 디렉터리를 재사용)
+def get_run_dir(model_name: str, version: int) -> str:
+    return os.path.join(CELERY_ML_RUNS_PATH, f"{model_name}_v{version}")
+
+
+# zip_files를 학습 데이터셋으로 병합 (CPU, io 큐)하고 학습 task를 train 큐에 등록
+async def create_model(ml_service: MlService, model_name: str, model_ext: str, version: int, zip_file_paths: list[str], options: dict = None):
+    model_id = None
     try:
-        datetime_str = datetime.now().strftime("%Y%m%d%H%M%S")
-        output_dir = os.path.join(CELERY_ML_RUNS_PATH, f"{model_name}_{datetime_str}")
+        output_dir = get_run_dir(model_name, version)
         model = await ml_service.get_model_by_name(model_name)
         model_id = model['id']
+        if model['status'] not in (Status.PENDING.value, Status.RUNNING.value):  # 이미 끝난 학습의 중복 전달
+            logger.info(f"Skip create_model task (model: {model_name}, status: {model['status']})")
+            return False
+        if await ml_service.redis.exists(cancel_key(TRAIN, model_id)):  # 대기 중 취소됨
+            return await mark_model_cancelled(ml_service, model_id, model_name, output_dir)
+
         await ml_service.update_status(model_id, 'running')
         await ml_service.session.commit()  # 중간 상태 커밋
 
-        if not os.path.exists(output_dir):
+        # 재시도: 이 학습에서 병합을 끝낸 데이터셋이 있으면 재사용
+        total_classes = await asyncio.to_thread(load_merged_classes, output_dir) if model['run_dir'] == output_dir else None
+        if total_classes is None:
+            shutil.rmtree(output_dir, ignore_errors=True)  # 이전 버전 시도나 중단된 병합의 잔여물 제거
             os.makedirs(output_dir, exist_ok=True)
-        else:
-            await ml_service.update_status(model_id, 'failed')
-            return False
-        
-        merged_result, total_classes = merge_archive_files(zip_file_paths, output_dir)
-        if not merged_result:  # 아카이브 병합
-            await ml_service.update_status(model_id, 'failed')
+
+            imgsz = TrainingOptions(**(options or {})).imgsz if TRAIN_IMAGE_CACHE_ENABLED else None  # 학습 크기로 줄인 이미지 캐시 사용
+            merged_result, total_classes = await asyncio.to_thread(merge_archive_files, zip_file_paths, output_dir, imgsz)
+            if not merged_result:  # 아카이브 병합
+                return await mark_model_failed(ml_service, model_id, output_dir)
+
+            await ml_service.update_training_run(model_id, run_dir=output_dir)
+
+        train_model_task.delay(model_name, model_ext, version, output_dir, total_classes, options)  # data.yaml과 같은 순서의 list
+        return True
+    except Exception as e:
+        logger.error(f"Unexpected Error in create_model task", exc_info=True)
+        if model_id is not None:  # running 상태로 남지 않도록
+            return await mark_model_failed(ml_service, model_id, output_dir)
+        return False
+
+
+@app.task(bind=True, acks_late=True, reject_on_worker_lost=True)
+def train_model_task(self, model_name: str, model_ext: str, version: int, output_dir: str, total_classes: list[str], options: dict = None,
+                     attempt: int = 0):
+    try:
+        result = run_in_worker_loop(with_service(MlService, train_model, model_name=model_name, model_ext=model_ext, version=version, output_dir=output_dir, total_classes=total_classes, options=options,
+                                                 retry=attempt < TRAIN_MAX_RETRIES))
+    except GpuUnavailable:  # 학습용 GPU가 모두 사용 중, 잠시 뒤 다시 시도
+        raise self.retry(countdown=GPU_RETRY_SECONDS, max_retries=None)
+    except TrainingFailed:  # 실행 디렉터리의 체크포인트에서 이어서 다시 시도 (GPU 대기 재시도와 따로 횟수를 셈)
+        raise self.retry(kwargs={**self.request.kwargs, 'attempt': attempt + 1}, countdown=TRAIN_RETRY_SECONDS, max_retries=None)
+    if result is None:  # 같은 학습이 아직 실행 중 (메시지 중복 전달), 잠금이 풀린 뒤 다시 확인
+        raise self.retry(countdown=TRAIN_LOCK_TTL, max_retries=None)
+    return result
+
+
+# 병합된 데이터셋으로 학습하고 생성된 모델 저장 (GPU, train 큐), 실행 중인 같은 학습이 있으면 None
+# 학습이 실패하면 retry가 True일 때 실행 디렉터리를 남겨 두고 TrainingFailed를 올림 (성공/취소 시에만 실행 디렉터리 삭제)
+async def train_model(ml_service: MlService, model_name: str, model_ext: str, version: int, output_dir: str, total_classes: list[str],
+                      options: dict = None, retry: bool = False):
+    lock_key, locked, gpu_lease = f"{TRAIN_LOCK_PREFIX}{model_name}", False, None
+    try:
+        model = await ml_service.get_model_by_name(model_name)
+        model_id = model['id']
+        if model['status'] != Status.RUNNING.value or model['run_dir'] != output_dir:  # 이미 끝났거나 새로 등록된 학습
+            logger.info(f"Skip train_model task (model: {model_name}, status: {model['status']})")
             return False
 
+        locked = await ml_service.redis.set(lock_key, output_dir, nx=True, ex=TRAIN_LOCK_TTL)
+        if not locked:
+            return None
+
+        sync_redis = get_worker_context().sync_redis
+        cancel_token = CancelToken(sync_redis, cancel_key(TRAIN, model_id))
+        if await ml_service.redis.exists(cancel_token.key):  # 학습 대기 중 취소됨
+            return await mark_model_cancelled(ml_service, model_id, model_name, output_dir)
+
+        training_options = TrainingOptions(**(options or {}))
+        if training_options.device == 'auto':  # 학습용 풀에서 비어 있는 GPU 임대 (GPU가 없으면 cpu)
+            scheduler = GpuScheduler(sync_redis, TRAIN_POOL, pool_devices(TRAIN_POOL))
+            gpu_lease = scheduler.acquire(output_dir, training_options.gpus)
+            if gpu_lease is None:
+                raise GpuUnavailable(TRAIN_POOL, training_options.gpus)
+            training_options.device = gpu_lease.device
+
+        checkpoint_path = get_checkpoint_path(output_dir)
+        await ml_service.update_training_run(model_id, run_dir=output_dir, checkpoint_path=checkpoint_path)
+        await ml_service.session.commit()  # 중간 상태 커밋
+
+        def keep_alive():  # 학습 잠금, GPU 임대 연장 (DDP 학습은 epoch 콜백이 호출되지 않으므로 epoch과 무관하게 주기적으로)
+            sync_redis.expire(lock_key, TRAIN_LOCK_TTL)
+            if gpu_lease:
+                gpu_lease.extend()
+
         base_model_path = model['base_model']['model_file']['filepath']
-        create_result, model_info = create_yolo_model(  # Yolo 학습 및 모델 생성
-            model_name=model_name,
-            model_ext=model_ext,
-            base_model_path=base_model_path,
-            version=version, 
-            output_dir=output_dir,
-            status_handler=redis_status_handler
-            )
+        with Heartbeat(TRAIN_HEARTBEAT_SECONDS, keep_alive, name=f"train:{model_name}"):
+            create_result, model_info = await asyncio.to_thread(  # Yolo 학습 및 모델 생성 (체크포인트가 있으면 이어서 학습)
+                create_yolo_model,
+                model_name=model_name,
+                model_ext=model_ext,
+                base_model_path=base_model_path,
+                version=version, 
+                output_dir=output_dir,
+                status_handler=redis_status_handler,  # epoch마다 진행률 기록
+                cancel_token=cancel_token,
+                options=training_options
+                )
         if not create_result:
-            await ml_service.update_status(model_id, 'failed')
-            return False
+            if retry:
+                raise TrainingFailed(model_name)
+            return await mark_model_failed(ml_service, model_id)  # 실행 디렉터리는 원인 확인용으로 남김 (재학습 시 create_model에서 정리)
         
         model_info['classes'] = total_classes
-        await ml_service.update_model(AiModelDTO(**model_info))
-        await ml_service.update_status(model_id, 'complete')  # Task 완료 처리 (db)
+        await ml_service.update_model(AiModelDTO(**model_info), status='complete')  # 모델 정보 갱신 및 Task 완료 처리 (db, 실행 정보 초기화)
+        shutil.rmtree(output_dir, ignore_errors=True)  # 학습 산출물(데이터셋, 체크포인트) 정리, best 모델은 레포로 복사됨
         
         clear_redis_keys_sync(f"train:{model_name}")  # Progress 제거 (redis)
         return True
+    except TaskCancelled:
+        return await mark_model_cancelled(ml_service, model_id, model_name, output_dir)
+    except (GpuUnavailable, TrainingFailed):
+        raise
     except Exception as e:
-        logger.error(f"Unexpected Error in create_model task", exc_info=True)
+        logger.error(f"Unexpected Error in train_model task", exc_info=True)
         return False
+    finally:
+        if gpu_lease:
+            gpu_lease.release()
+        if locked:
+            await ml_service.redis.delete(lock_key)
+
+
+async def mark_model_failed(ml_service: MlService, model_id: int, output_dir: str = None):
+    if output_dir:
+        shutil.rmtree(output_dir, ignore_errors=True)
+    await ml_service.update_status(model_id, 'failed')
+    await ml_service.update_training_run(model_id)
+    return False
+
+
+async def mark_model_cancelled(ml_service: MlService, model_id: int, model_name: str, output_dir: str = None):
+    if output_dir:
+        shutil.rmtree(output_dir, ignore_errors=True)
+    await ml_service.update_status(model_id, 'cancelled')
+    await ml_service.update_training_run(model_id)
+    clear_redis_keys_sync(f"train:{model_name}")
+    await clear_cancel(ml_service.redis, cancel_key(TRAIN, model_id))
+    logger.info(f"Model training cancelled (model_id: {model_id})")
+    return False
 
 
 @app.task
 def deploy_model_task(model_id: int):
-    loop = get_event_loop()
-    return loop.run_until_complete(with_service(MlService, deploy_model, model_id=model_id))
+    return run_in_worker_loop(with_service(MlService, deploy_model, model_id=model_id))
 
 
 async def deploy_model(ml_service: MlService, model_id: int):
@@ -159,19 +300,18 @@ async def deploy_model(ml_service: MlService, model_id: int):
         await ml_service.update_status(model_id, 'running')
         await ml_service.session.commit()  # 중간 상태 커밋
 
-        model = await ml_service.get_model_by_id(model_id)
-        model_path = model['model_file']['filepath']
+        model = await ml_service.get_model_meta(model_id)
+        model_path = model['model_path']
         model_name = model['model_name']
         version = model['version']
 
-        deploy_result, deploy_path = deploy_to_triton(model_name, version, model_path, MODEL_REPOSITORY, TRITON_GRPC_URL)
+        deploy_result, deploy_path = await asyncio.to_thread(deploy_to_triton, model_name, version, model_path, MODEL_REPOSITORY, TRITON_GRPC_URL)
         if deploy_result is False:
             await ml_service.update_status(model_id, 'failed')
             return False
         
 
-        await ml_service.deploy_model(model_id, deploy_path)  # deploy 표시
-        await ml_service.update_status(model_id, 'complete')  # 완료 표시
+        await ml_service.deploy_model(model_id, deploy_path, status='complete')  # deploy 및 완료 표시
 
         return True
     except Exception as e:
@@ -181,23 +321,19 @@ async def deploy_model(ml_service: MlService, model_id: int):
 
 @app.task
 def undeploy_model_task(model_id: int):
-    loop = get_event_loop()
-    return loop.run_until_complete(with_service(MlService, undeploy_model, model_id=model_id))
+    return run_in_worker_loop(with_service(MlService, undeploy_model, model_id=model_id))
 
 
 async def undeploy_model(ml_service: MlService, model_id: int):
     try:
-        model = await ml_service.get_model_by_id(model_id)
-        model_name = model['model_name']
-        await ml_service.update_status(model_id, 'running')
+        model_name = await ml_service.update_status(model_id, 'running')
         await ml_service.session.commit()  # 중간 상태 커밋
 
-        if undeploy_from_triton(model_name, MODEL_REPOSITORY, TRITON_GRPC_URL) is False:
+        if await asyncio.to_thread(undeploy_from_triton, model_name, MODEL_REPOSITORY, TRITON_GRPC_URL) is False:
             await ml_service.update_status(model_id, 'failed')
             return False
 
-        await ml_service.undeploy_model(model_id)  # deploy 표시
-        await ml_service.update_status(model_id, 'complete')  # 완료 표시
+        await ml_service.undeploy_model(model_id, status='complete')  # undeploy 및 완료 표시
 
         return True
     except Exception as e:
@@ -206,31 +342,208 @@ async def undeploy_model(ml_service: MlService, model_id: int):
     
 
 @app.task
-def generate_inference_task(inference_file_id: int, model_name: str, classes: list[str]):
-    loop = get_event_loop()
-    return loop.run_until_complete(with_service(InferenceService, generate_inference, inference_file_id=inference_file_id, model_name=model_name, classes=classes))
+def generate_inference_task(inference_file_id: int, model_name: str, classes: list[str], deployment: str = None, options: dict = None):
+    return run_in_worker_loop(with_service(InferenceService, generate_inference, inference_file_id=inference_file_id, model_name=model_name, classes=classes, deployment=deployment, options=options))
 
 
-async def generate_inference(inference_service: InferenceService, inference_file_id: int, model_name: str, classes: list[str]):
+# deployment: 요청 시점에 Triton에 배포되어 있던 모델 파일 digest (미배포이면 None, 결과를 캐싱하지 않음)
+async def generate_inference(inference_service: InferenceService, inference_file_id: int, model_name: str, classes: list[str],
+                             deployment: str = None, options: dict = None):
     try:
+        cancel_token = CancelToken(get_worker_context().sync_redis, cancel_key(INFERENCE, inference_file_id))
+        if await inference_service.redis.exists(cancel_token.key):  # 대기 중 취소됨
+            return await mark_inference_cancelled(inference_service, inference_file_id)
+
         await inference_service.update_status(inference_file_id, 'running')
         await inference_service.session.commit()  # 중간 상태 커밋
 
         file = await inference_service.get_file_by_id(inference_file_id)
-        original_file_path = file['original_file']['filepath']
+        original_file_path = file['original_file']['filepath']  # 내용 해시 기반 blob 경로
+        original_file_name = file['original_file_name']
         file_type = file['file_type']
-        generate_file_path = None
+        generate_file_path, detections_file_path = None, None
 
-        if file_type == FileType.PHOTO.value or file_type == FileType.VIDEO.value:
-            generate_file_path = generate_inference_file(file_type, original_file_path, model_name, classes)
-        else:
+        if file_type != FileType.PHOTO.value and file_type != FileType.VIDEO.value:
             await inference_service.update_status(inference_file_id, 'failed')
             return False
-        
-        await inference_service.update_generated_file(inference_file_id, generate_file_path)
-        await inference_service.update_status(inference_file_id, 'complete')  # 완료 표시
 
+        # 같은 입력/배포 모델/옵션의 결과가 있으면 추론을 생략
+        # (digest가 없는 이전 업로드 파일, 미배포 모델, 대기 중 다시 배포된 모델은 캐싱하지 않음)
+        inference_options = InferenceOptions(**(options or {}))
+        digest = file['original_file']['digest']
+        if deployment and deployment != await inference_service.get_model_deployment(model_name):
+            deployment = None
+        cache_key = inference_result_key(digest, model_name, deployment, inference_options.to_dict()) if digest and deployment else None
+        cached = await get_inference_result(inference_service.redis, cache_key) if cache_key else None
+
+        # 렌더링 파일과 검출 결과 파일이 모두 남아 있을 때만 캐시를 사용
+        if cached and 'detections_file' in cached and all(map(os.path.exists, cached.values())):
+            logger.info(f"Inference result cache hit (inference_file_id: {inference_file_id}, key: {cache_key})")
+            generate_file_path, detections_file_path = cached['generated_file'], cached['detections_file']
+        else:
+            # 결과 파일은 캐시 키별 디렉터리에 생성하여 다른 모델/옵션의 결과가 덮어쓰지 않도록 한다.
+            output_dir = os.path.join(INFERENCE_DIRECTORY, INFERENCE_RESULT_DIRECTORY_NAME, cache_key) if cache_key else INFERENCE_DIRECTORY
+
+            # 긴 비디오는 구간별 subtask로 나누어 처리하고 완료 처리는 병합 task에서 한다.
+            if file_type == FileType.VIDEO.value and await dispatch_segments(
+                inference_file_id, original_file_path, original_file_name, model_name, classes,
+                inference_options, output_dir, cache_key
+            ):
+                return True
+
+            # 작업별 디렉터리에 생성한 뒤 완료된 결과만 결과 디렉터리로 옮긴다.
+            # (결과 디렉터리의 파일은 다른 InferenceFile이 참조할 수 있으므로 취소 시에는 작업 디렉터리만 정리)
+            progress = ProgressReporter(get_worker_context().sync_redis, progress_key(inference_file_id))
+            work_dir = os.path.join(INFERENCE_STAGING_DIRECTORY, f"{inference_file_id}_{uuid.uuid4().hex}")
+            try:
+                generated_files = await asyncio.to_thread(
+                    generate_inference_file, file_type, original_file_path, model_name, classes,
+                    original_file_name, work_dir, inference_options, progress, cancel_token
+                )
+                generate_file_path, detections_file_path = await asyncio.to_thread(publish_files, generated_files, output_dir)
+            finally:
+                shutil.rmtree(work_dir, ignore_errors=True)
+
+        await complete_inference(inference_service, inference_file_id, original_file_name, generate_file_path, detections_file_path, cache_key)
         return True
+    except TaskCancelled:
+        return await mark_inference_cancelled(inference_service, inference_file_id)
     except Exception:
         logger.error(f"Unexpected Error in generate_inference task", exc_info=True)
-        return False
\ No newline at end of file
+        return False
+
+
+# 생성 파일/검출 결과 등록 및 완료 표시 (확장자는 인코딩 결과를 따름, 예: pyav -> .mp4)
+async def complete_inference(inference_service: InferenceService, inference_file_id: int, original_file_name: str,
+                             generate_file_path: str, detections_file_path: str, cache_key: str = None):
+    generated_file_name = f"detection_{os.path.splitext(original_file_name)[0]}{os.path.splitext(generate_file_path)[1]}"
+    await inference_service.update_generated_file(
+        inference_file_id, generate_file_path, status='complete',
+        generated_file_name=generated_file_name, detections_file_path=detections_file_path
+    )
+
+    await inference_service.redis.delete(progress_key(inference_file_id), cancel_key(INFERENCE, inference_file_id))
+
+    if cache_key:
+        await set_inference_result(
+            inference_service.redis, cache_key,
+            {"generated_file": generate_file_path, "detections_file": detections_file_path}
+        )
+
+
+# 긴 비디오를 키프레임 기준으로 나누어 chord(구간 추론 -> 병합)로 실행, 분할 대상이 아니면 False
+async def dispatch_segments(inference_file_id: int, original_file_path: str, original_file_name: str, model_name: str,
+                            classes: list[str], inference_options: InferenceOptions, output_dir: str, cache_key: str = None) -> bool:
+    if INFERENCE_SEGMENT_SECONDS <= 0:
+        return False
+    if await asyncio.to_thread(get_duration, original_file_path) < INFERENCE_SPLIT_MIN_SECONDS:
+        return False
+
+    segment_dir = os.path.join(INFERENCE_SEGMENT_DIRECTORY, f"{inference_file_id}_{uuid.uuid4().hex}")
+    segments = await asyncio.to_thread(split_video, original_file_path, os.path.join(segment_dir, 'input'), INFERENCE_SEGMENT_SECONDS)
+    if len(segments) < 2:
+        shutil.rmtree(segment_dir, ignore_errors=True)
+        return False
+
+    # 전체 프레임 수로 진행률을 초기화하고, 구간 task들은 완료 프레임 수만 더한다.
+    video_info = await asyncio.to_thread(probe_video, original_file_path, resolve_backend())
+    await asyncio.to_thread(start_progress, get_worker_context().sync_redis, progress_key(inference_file_id), video_info.frame_count)
+
+    header = [
+        generate_segment_task.s(
+            segment, model_name, classes, inference_options.to_dict(), os.path.join(segment_dir, 'output'), inference_file_id
+        )
+        for segment in segments
+    ]
+    callback = merge_segments_task.s(inference_file_id, original_file_name, output_dir, segment_dir, cache_key)
+    callback = callback.on_error(inference_failed_task.si(inference_file_id, segment_dir))
+    await asyncio.to_thread(chord(header), callback)
+
+    logger.info(f"Dispatched {len(segments)} segments (inference_file_id: {inference_file_id})")
+    return True
+
+
+@app.task(ignore_result=False)
+def generate_segment_task(segment_path: str, model_name: str, classes: list[str], options: dict, output_dir: str,
+                          inference_file_id: int = None):
+    sync_redis = get_worker_context().sync_redis
+    progress = ProgressReporter(sync_redis, progress_key(inference_file_id), owner=False) if inference_file_id else None
+    cancel_token = CancelToken(sync_redis, cancel_key(INFERENCE, inference_file_id)) if inference_file_id else None
+    return list(generate_inference_file(  # 취소되면 chord 실패로 이어져 inference_failed_task가 cancelled로 기록
+        FileType.VIDEO.value, segment_path, model_name, classes, None, output_dir, InferenceOptions(**options), progress, cancel_token
+    ))
+
+
+@app.task
+def merge_segments_task(results: list, inference_file_id: int, original_file_name: str, output_dir: str, segment_dir: str, cache_key: str = None):
+    return run_in_worker_loop(with_service(
+        InferenceService, merge_segments, results=results, inference_file_id=inference_file_id,
+        original_file_name=original_file_name, output_dir=output_dir, segment_dir=segment_dir, cache_key=cache_key
+    ))
+
+
+# 구간별 결과 영상은 재인코딩 없이 이어 붙이고 검출 결과는 프레임 오프셋을 보정하여 합침
+async def merge_segments(inference_service: InferenceService, results: list, inference_file_id: int, original_file_name: str,
+                         output_dir: str, segment_dir: str, cache_key: str = None):
+    try:
+        video_paths = [video_path for video_path, _ in results]
+        detections_paths = [detections_path for _, detections_path in results]
+        extension = os.path.splitext(video_paths[0])[1]
+        work_dir = os.path.join(segment_dir, 'result')  # 병합이 끝난 결과만 결과 디렉터리로 옮김
+        output_path = os.path.join(work_dir, f"detection_{os.path.splitext(original_file_name)[0]}{extension}")
+        detections_file_path = f"{os.path.splitext(output_path)[0]}.npz"
+
+        os.makedirs(work_dir, exist_ok=True)
+        await asyncio.to_thread(concat_videos, video_paths, output_path)
+        await asyncio.to_thread(merge_detections, detections_paths, detections_file_path)
+        output_path, detections_file_path = await asyncio.to_thread(publish_files, [output_path, detections_file_path], output_dir)
+
+        await complete_inference(inference_service, inference_file_id, original_file_name, output_path, detections_file_path, cache_key)
+        return True
+    except Exception:
+        logger.error(f"Unexpected Error in merge_segments task", exc_info=True)
+        return await mark_inference_failed(inference_service, inference_file_id)
+    finally:
+        shutil.rmtree(segment_dir, ignore_errors=True)
+
+
+@app.task
+def inference_failed_task(inference_file_id: int, segment_dir: str = None):
+    if segment_dir:
+        shutil.rmtree(segment_dir, ignore_errors=True)
+    return run_in_worker_loop(with_service(InferenceService, mark_inference_failed, inference_file_id=inference_file_id))
+
+
+async def mark_inference_failed(inference_service: InferenceService, inference_file_id: int):
+    # 구간 task가 취소 요청으로 중단된 경우에는 cancelled로 기록
+    if await inference_service.redis.exists(cancel_key(INFERENCE, inference_file_id)):
+        return await mark_inference_cancelled(inference_service, inference_file_id)
+
+    await inference_service.update_status(inference_file_id, 'failed')
+    await inference_service.redis.delete(progress_key(inference_file_id))
+    return False
+
+
+async def mark_inference_cancelled(inference_service: InferenceService, inference_file_id: int):
+    await inference_service.update_status(inference_file_id, 'cancelled')
+    await inference_service.redis.delete(progress_key(inference_file_id), cancel_key(INFERENCE, inference_file_id))
+    logger.info(f"generate_inference task cancelled (inference_file_id: {inference_file_id})")
+    return False
+
+
+@app.task
+def collect_garbage_task():
+    return run_in_worker_loop(with_service(GarbageCollectService, collect_garbage))
+
+
+# 삭제 표시된 레코드와 파일 정리 (celery beat로 주기 실행)
+async def collect_garbage(gc_service: GarbageCollectService):
+    try:
+        summary = await gc_service.collect()
+        if summary is not None:  # 병합 데이터셋에서 링크하지 않는 오래된 학습 이미지 캐시와 압축 해제 캐시 정리
+            summary["removed_image_cache"] = await asyncio.to_thread(prune_image_cache, TRAIN_IMAGE_CACHE_DIRECTORY, TRAIN_IMAGE_CACHE_TTL)
+            summary["removed_extract_cache"] = await asyncio.to_thread(prune_extract_cache, TRAIN_EXTRACT_CACHE_DIRECTORY, TRAIN_EXTRACT_CACHE_TTL)
+        return summary
+    except Exception:
+        logger.error(f"Unexpected Error in collect_garbage task", exc_info=True)
+        return False
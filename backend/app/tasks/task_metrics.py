@@ -0,0 +1,55 @@
+"""
+Celery task 메트릭 (실행 시간, 큐 대기 시간, 결과)
+
+- 발행 시 메시지 헤더에 발행 시각을 기록하고, 실행 시작 시 현재 시각과의 차이를 큐 대기 시간으로 기록한다.
+  (발행 측은 API/워커 모두 app.tasks.main을 import하므로 같은 신호 처리기가 연결됨)
+- 이 저장소의 task는 실패를 예외 대신 False 반환으로 알리는 경우가 많아 반환값 False도 failure로 센다.
+"""
+
+import time
+from celery.signals import before_task_publish, task_prerun, task_postrun
+from app.metrics import TASK_DURATION, TASK_QUEUE_WAIT, TASK_RESULTS
+
+
+PUBLISHED_AT_HEADER = "published_at"
+_started = {}  # task_id -> 시작 시각 (perf_counter)
+
+
+def task_queue(task) -> str:
+    delivery_info = getattr(task.request, 'delivery_info', None) or {}
+    return delivery_info.get('routing_key') or 'unknown'
+
+
+def published_at(request):
+    value = getattr(request, PUBLISHED_AT_HEADER, None)
+    if value is None:
+        value = (getattr(request, 'headers', None) or {}).get(PUBLISHED_AT_HEADER)
+    return value
+
+
+def result_state(state: str, retval) -> str:
+    if state == 'SUCCESS' and retval is False:
+        return 'failure'
+    return (state or 'unknown').lower()
+
+
+@before_task_publish.connect
+def on_before_task_publish(headers=None, **kwargs):
+    if headers is not None:
+        headers.setdefault(PUBLISHED_AT_HEADER, time.time())
+
+
+@task_prerun.connect
+def on_task_prerun(task_id=None, task=None, **kwargs):
+    sent = published_at(task.request)
+    if sent is not None:
+        TASK_QUEUE_WAIT.labels(task.name, task_queue(task)).observe(max(time.time() - float(sent), 0))
+    _started[task_id] = time.perf_counter()
+
+
+@task_postrun.connect
+def on_task_postrun(task_id=None, task=None, retval=None, state=None, **kwargs):
+    start = _started.pop(task_id, None)
+    if start is not None:
+        TASK_DURATION.labels(task.name, task_queue(task)).observe(time.perf_counter() - start)
+    TASK_RESULTS.labels(task.name, result_state(state, retval)).inc()
@@ -1,52 +1,119 @@
 import os
 import logging
 import shutil
-from app.config import CELERY_ML_RUNS_PATH, MODEL_DIRECTORY, ML_REPO, TRITON_REPO
+import threading
+from app.config import MODEL_DIRECTORY, TRAIN_HEARTBEAT_SECONDS
+from app.dto import TrainingOptions
+from app.tasks.cancel import CancelToken, TaskCancelled
+from app.tasks.heartbeat import Heartbeat
+from app.tasks.train.ddp import is_ddp, read_last_epoch, stop_ddp
 from app.logger import LOGGER_NAME
 
 
 logger = logging.getLogger(LOGGER_NAME)
+TRAIN_RUN_NAME = 'train'
 
 
-def create_yolo_model(model_name: str, model_ext: str, base_model_path: str, version: int, output_dir: str, status_handler=lambda ri_key, status: None):
+class TrainingFailed(Exception):
+    """학습이 실패했지만 실행 디렉터리의 체크포인트에서 이어서 다시 시도할 수 있음"""
+
+
+# ultralytics가 epoch마다 저장하는 마지막 체크포인트 경로 (output_dir/train/weights/last.pt)
+def get_checkpoint_path(output_dir: str) -> str:
+    return os.path.join(output_dir, TRAIN_RUN_NAME, 'weights', 'last.pt')
+
+
+# GPU를 사용할 수 없는 환경(테스트, CPU 전용 워커)에서는 cpu로 학습
+# auto는 보통 GPU 스케줄러가 임대한 장치로 바뀌어 전달되며, 직접 호출된 경우에는 첫 번째 GPU 사용
+def resolve_device(device: str, cuda_available: bool) -> str:
+    if device == 'auto':
+        return '0' if cuda_available else 'cpu'
+    if device != 'cpu' and not cuda_available:
+        logger.warning(f"CUDA is not available. falling back to cpu (requested device: {device})")
+        return 'cpu'
+    return device
+
+
+def create_yolo_model(model_name: str, model_ext: str, base_model_path: str, version: int, output_dir: str, status_handler=lambda ri_key, status: None,
+                      cancel_token: CancelToken = None, options: TrainingOptions = None):
     logger.info("start create_yolo_model")
     # celery와 fastapi 의존성 분리로 인해 함수내에서 패키지 로딩 (yolo 패키지는 celery에만 존재)
     from ultralytics import YOLO
     import torch
 
     file_name = f"{model_name}.{model_ext}"
-    epochs = 100
-    img_size = 640
+    options = options or TrainingOptions()
+    device = resolve_device(options.device, torch.cuda.is_available())
 
     # data.yaml 파일 경로 설정
     data_yaml = os.path.join(output_dir, "data.yaml")
     
+    # 이전 실행의 체크포인트가 남아 있으면 (워커 재시작/재시도) 이어서 학습
+    checkpoint_path = get_checkpoint_path(output_dir)
+    resume = os.path.exists(checkpoint_path)
+
     # YOLOv8 모델 객체 생성
-    model = YOLO(base_model_path)
+    model = YOLO(checkpoint_path if resume else base_model_path)
 
     def on_train_epoch_end(trainer):
         epoch = trainer.epoch
         total_epochs = trainer.epochs
         logger.info(f"Epoch {epoch + 1}/{total_epochs} completed")
         status_handler(f"train:{model_name}", f"{epoch}")
+        if cancel_token:  # 취소 요청 시 다음 epoch로 넘어가지 않고 학습 중단
+            cancel_token.check()
+
+    cancelled = threading.Event()
 
+    def watch_ddp():  # DDP 학습은 자식 프로세스에서 실행되어 위 콜백이 호출되지 않으므로 주기적으로 확인
+        epoch = read_last_epoch(os.path.join(output_dir, TRAIN_RUN_NAME))
+        if epoch is not None:
+            status_handler(f"train:{model_name}", f"{epoch}")
+        if cancel_token and cancel_token.is_cancelled():
+            cancelled.set()
+            stop_ddp(repr(output_dir))  # 학습 스크립트의 project 설정으로 이 학습의 프로세스를 찾음
+
+    ddp_watcher = Heartbeat(TRAIN_HEARTBEAT_SECONDS, watch_ddp, name=f"ddp:{model_name}") if is_ddp(device) else None
 
     try:
         model.add_callback("on_train_epoch_end", on_train_epoch_end)
-
-        model.train(
-            data=data_yaml, 
-            epochs=epochs,  
-            imgsz=img_size,
-            batch=2,
-            device='cuda:0',
-        )
+        if ddp_watcher:
+            logger.info(f"Training with DDP (device: {device}). progress and cancel are checked every {TRAIN_HEARTBEAT_SECONDS}s")
+            ddp_watcher.start()
+
+        if resume:
+            logger.info(f"Resume training from checkpoint: {checkpoint_path}")
+            model.train(resume=True, device=device)  # 데이터셋, epoch 등은 체크포인트 설정 사용, 장치는 새로 임대한 GPU
+        else:
+            logger.info(f"Training options: {options.to_dict()} (device: {device})")
+            model.train(
+                data=data_yaml, 
+                epochs=options.epochs,  
+                imgsz=options.imgsz,
+                batch=options.batch,
+                workers=options.workers,
+                cache=options.cache or False,
+                amp=options.amp,
+                patience=options.patience,
+                device=device,
+                project=output_dir,  # 학습 결과를 이 학습의 디렉터리 아래에 저장
+                name=TRAIN_RUN_NAME,
+                exist_ok=True,  # 체크포인트 경로가 바뀌지 않도록 (train2, train3 ... 생성 방지)
+            )
+
+        if ddp_watcher:
+            ddp_watcher.stop()
+        if cancelled.is_set():
+            raise TaskCancelled(cancel_token.key)
 
         metrics = model.val(
             data=data_yaml,
-            imgsz=img_size,
-            batch=2,
-            device='cuda:0',
+            imgsz=options.imgsz,
+            batch=model.trainer.batch_size,  # auto-batch로 정해진 배치 크기
+            device=device,
+            project=output_dir,
+            name='val',
+            exist_ok=True,
         )
         map50 = metrics.box.map50
         map50_95 = metrics.box.map
@@ -74,32 +141,22 @@ def create_yolo_model(model_name: str, model_ext: str, base_model_path: str, ver
             "precision": precision,
             "recall": recall
         }
+    except TaskCancelled:
+        logger.info(f"Training of {model_name} (version {version}) has been cancelled")
+        raise
     except Exception:
+        if cancelled.is_set():  # 취소 요청으로 DDP 프로세스를 종료함
+            logger.info(f"Training of {model_name} (version {version}) has been cancelled")
+            raise TaskCancelled(cancel_token.key)
         logger.error(f"An error occurred while creating and saving the model", exc_info=True)
         return False, None
     finally:
+        if ddp_watcher:
+            ddp_watcher.stop()
         # 명시적으로 자원을 전부 해제한다.
         if torch.cuda.is_available():
             torch.cuda.empty_cache()
 
         del model 
         logger.info("Deleted YOLO model object to release memory.")
-        
-        clear_directory_except(CELERY_ML_RUNS_PATH ,[ML_REPO, TRITON_REPO])  # 찌꺼기 제거
-        logger.info("Temporary directories cleaned up.")
-    
-
-# 특정 디렉터리 내에서 제외할 디렉터리를 제외하고 모든 파일과 디렉터리를 삭제
-def clear_directory_except(target_dir: str, exclude_dirs: list):
-    for item in os.listdir(target_dir):
-        item_path = os.path.join(target_dir, item)
-
-        if item in exclude_dirs:
-            continue
-        
-        if os.path.isdir(item_path):
-            shutil.rmtree(item_path)
-            logger.info(f"Directory removed: {item_path}")
-        elif os.path.isfile(item_path):
-            os.remove(item_path)
-            logger.info(f"File removed: {item_path}")
\ No newline at end of file
+        # output_dir(데이터셋, 체크포인트)는 호출한 task가 정리한다. (재시도 시 체크포인트에서 이어서 학습)
@@ -0,0 +1,69 @@
+"""
+여러 GPU 학습(DDP) 보조 함수
+
+ultralytics는 장치가 2개 이상이면 학습을 `python -m torch.distributed.run ... <임시 학습 스크립트>` 자식 프로세스로 실행한다.
+자식 프로세스에는 부모 프로세스에서 등록한 콜백이 전달되지 않으므로, 진행률은 rank 0이 epoch마다 기록하는
+results.csv에서 읽고, 취소는 해당 자식 프로세스를 종료하여 처리한다.
+"""
+
+import os
+import signal
+import logging
+from typing import List, Optional
+from app.logger import LOGGER_NAME
+
+
+logger = logging.getLogger(LOGGER_NAME)
+DDP_LAUNCHER = "torch.distributed.run"
+
+
+def is_ddp(device: str) -> bool:
+    return len([d for d in device.split(',') if d.strip()]) > 1
+
+
+def read_last_epoch(save_dir: str) -> Optional[int]:
+    """results.csv에 기록된 마지막 epoch (0부터 시작), 아직 끝난 epoch이 없으면 None"""
+    try:
+        with open(os.path.join(save_dir, 'results.csv')) as f:
+            rows = sum(1 for line in f if line.strip()) - 1  # 헤더 제외
+    except FileNotFoundError:
+        return None
+    return rows - 1 if rows > 0 else None
+
+
+def find_ddp_processes(marker: str, parent: int = None, proc_dir: str = "/proc") -> List[int]:
+    """parent가 실행한 DDP 런처 중 학습 스크립트에 marker(학습 디렉터리)가 포함된 프로세스 (같은 워커의 다른 학습과 구분)"""
+    parent = os.getpid() if parent is None else parent
+    pids = []
+    for entry in os.listdir(proc_dir):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(os.path.join(proc_dir, entry, 'stat')) as f:
+                ppid = int(f.read().rsplit(')', 1)[1].split()[1])  # "pid (comm) state ppid ..."
+            if ppid != parent:
+                continue
+            with open(os.path.join(proc_dir, entry, 'cmdline'), 'rb') as f:
+                args = [arg.decode() for arg in f.read().split(b'\0') if arg]
+            if DDP_LAUNCHER not in args:
+                continue
+            with open(args[-1]) as f:  # ultralytics가 만든 임시 학습 스크립트 (학습 설정 포함)
+                if marker not in f.read():
+                    continue
+        except (OSError, ValueError, IndexError):  # 조회 중 종료된 프로세스
+            continue
+        pids.append(int(entry))
+    return pids
+
+
+def stop_ddp(marker: str, sig: int = signal.SIGTERM, proc_dir: str = "/proc") -> int:
+    """DDP 런처에 종료 신호를 보냅니다. (런처가 각 rank 프로세스를 정리함)"""
+    pids = find_ddp_processes(marker, proc_dir=proc_dir)
+    for pid in pids:
+        try:
+            os.kill(pid, sig)
+        except ProcessLookupError:
+            pass
+    if pids:
+        logger.info(f"Stopped DDP training processes: {pids}")
+    return len(pids)
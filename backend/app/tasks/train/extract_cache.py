@@ -0,0 +1,73 @@
+"""
+데이터셋 아카이브 압축 해제 캐시
+
+아카이브를 (실제 경로, 크기, 수정 시각) 기준 디렉터리에 한 번만 풀어두고 학습마다 재사용한다.
+병합 데이터셋은 이 디렉터리의 이미지를 심볼릭 링크로 가리키므로 학습마다 이미지를 복사하지 않는다.
+압축 해제는 임시 디렉터리에서 끝낸 뒤 rename하므로 완료된 디렉터리만 캐시로 보인다.
+"""
+
+import os
+import time
+import shutil
+import hashlib
+import zipfile
+import logging
+from app.config import TRAIN_EXTRACT_CACHE_DIRECTORY
+from app.logger import LOGGER_NAME
+
+
+logger = logging.getLogger(LOGGER_NAME)
+COMPLETE_MARKER = '.complete'
+
+
+def archive_cache_key(zip_file: str) -> str:
+    stat = os.stat(zip_file)
+    source = f"{os.path.realpath(zip_file)}:{stat.st_size}:{stat.st_mtime_ns}"
+    return hashlib.sha256(source.encode('utf-8')).hexdigest()
+
+
+def extract_to_cache(zip_file: str, cache_dir: str = TRAIN_EXTRACT_CACHE_DIRECTORY) -> str:
+    """아카이브를 캐시에 풀고 압축 해제 디렉터리 경로를 반환합니다. (이미 있으면 재사용)"""
+    extract_dir = os.path.join(cache_dir, archive_cache_key(zip_file))
+    marker_path = os.path.join(extract_dir, COMPLETE_MARKER)
+    if os.path.exists(marker_path):
+        os.utime(marker_path)  # 최근 사용 시각 갱신 (prune 기준)
+        return extract_dir
+
+    os.makedirs(cache_dir, exist_ok=True)
+    temp_dir = f"{extract_dir}.{os.getpid()}.tmp"
+    shutil.rmtree(temp_dir, ignore_errors=True)
+    with zipfile.ZipFile(zip_file, 'r') as zip_ref:
+        zip_ref.extractall(temp_dir)
+    open(os.path.join(temp_dir, COMPLETE_MARKER), 'w').close()
+
+    try:
+        os.rename(temp_dir, extract_dir)
+    except OSError:  # 다른 워커가 먼저 같은 아카이브를 풀었거나 중단된 잔여물
+        if not os.path.exists(marker_path):
+            shutil.rmtree(extract_dir, ignore_errors=True)
+            os.rename(temp_dir, extract_dir)
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+    logger.info(f"Archive extracted to cache: {zip_file} -> {extract_dir}")
+    return extract_dir
+
+
+def prune_extract_cache(cache_dir: str, max_age: int, now: float = None) -> int:
+    """max_age초 동안 사용되지 않았거나 완료되지 않은 압축 해제 디렉터리를 삭제하고 삭제 수를 반환합니다."""
+    if not os.path.isdir(cache_dir):
+        return 0
+
+    now = now or time.time()
+    removed = 0
+    for name in os.listdir(cache_dir):
+        extract_dir = os.path.join(cache_dir, name)
+        marker_path = os.path.join(extract_dir, COMPLETE_MARKER)
+        try:
+            last_used = os.stat(marker_path if os.path.exists(marker_path) else extract_dir).st_mtime
+        except FileNotFoundError:
+            continue
+        if now - last_used > max_age:
+            shutil.rmtree(extract_dir, ignore_errors=True)
+            removed += 1
+    return removed
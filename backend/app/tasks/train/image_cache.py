@@ -0,0 +1,133 @@
+"""
+학습 이미지 전처리 캐시
+
+원본 이미지를 비율을 유지한 채 긴 변이 imgsz가 되도록 줄여 (원본 digest, imgsz) 기준으로 저장하고,
+병합 데이터셋에는 캐시 파일을 하드 링크하여 같은 데이터를 쓰는 학습끼리 공유한다.
+ultralytics 데이터 로더는 긴 변이 이미 imgsz인 이미지는 다시 리사이즈하지 않으므로 epoch마다 큰 원본을
+디코딩/리사이즈하는 비용이 줄어든다.
+letterbox 패딩은 정규화된 라벨 좌표를 바꾸므로 저장하지 않고 데이터 로더가 배치 단위로 적용한다.
+"""
+
+import os
+import math
+import time
+import shutil
+import hashlib
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, Optional, Tuple
+from app.config import TRAIN_IMAGE_CACHE_DIRECTORY, TRAIN_IMAGE_CACHE_WORKERS
+from app.logger import LOGGER_NAME
+
+
+logger = logging.getLogger(LOGGER_NAME)
+IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.bmp', '.webp')
+CHUNK_SIZE = 1024 * 1024
+
+
+def get_cache_path(cache_dir: str, digest: str, imgsz: int, extension: str) -> str:
+    """<cache_dir>/<imgsz>/ab/abcdef...ext"""
+    return os.path.join(cache_dir, str(imgsz), digest[:2], f"{digest}{extension}")
+
+
+def file_digest(path: str) -> str:
+    sha256 = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b''):
+            sha256.update(chunk)
+    return sha256.hexdigest()
+
+
+def resized_shape(height: int, width: int, imgsz: int) -> Tuple[int, int]:
+    """긴 변이 imgsz가 되는 (height, width), ultralytics의 load_image와 같은 방식으로 반올림"""
+    ratio = imgsz / max(height, width)
+    return min(math.ceil(height * ratio), imgsz), min(math.ceil(width * ratio), imgsz)
+
+
+def resize_to_cache(path: str, imgsz: int, cache_dir: str = TRAIN_IMAGE_CACHE_DIRECTORY) -> Tuple[Optional[str], bool]:
+    """
+    이미지를 캐시에 저장하고 (캐시 경로, 캐시 적중 여부)를 반환합니다.
+    이미 imgsz 이하이거나 읽을 수 없는 이미지는 원본을 그대로 사용하도록 (None, False)를 반환합니다.
+    """
+    extension = os.path.splitext(path)[1].lower()
+    cache_path = get_cache_path(cache_dir, file_digest(path), imgsz, extension)
+    if os.path.exists(cache_path):
+        os.utime(cache_path)  # 최근 사용 시각 갱신 (prune 기준)
+        return cache_path, True
+
+    import cv2
+
+    image = cv2.imread(path)
+    if image is None or max(image.shape[:2]) <= imgsz:
+        return None, False
+
+    height, width = resized_shape(*image.shape[:2], imgsz)
+    resized = cv2.resize(image, (width, height), interpolation=cv2.INTER_AREA)
+    encoded, buffer = cv2.imencode(extension, resized)
+    if not encoded:
+        return None, False
+
+    os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+    temp_path = f"{cache_path}.{os.getpid()}.tmp"
+    with open(temp_path, 'wb') as f:
+        f.write(buffer.tobytes())
+    os.replace(temp_path, cache_path)  # 동시에 같은 이미지를 저장해도 완성된 파일만 보이도록
+    return cache_path, False
+
+
+def link_file(source: str, dest: str) -> None:
+    """dest를 source의 하드 링크로 교체 (다른 파일 시스템이면 복사)"""
+    temp_path = f"{dest}.tmp"
+    try:
+        os.link(source, temp_path)
+    except OSError:
+        shutil.copyfile(source, temp_path)
+    os.replace(temp_path, dest)
+
+
+def apply_image_cache(image_dirs: Iterable[str], imgsz: int, cache_dir: str = TRAIN_IMAGE_CACHE_DIRECTORY,
+                      max_workers: int = TRAIN_IMAGE_CACHE_WORKERS) -> dict:
+    """병합된 이미지 디렉터리의 이미지를 캐시된 리사이즈 이미지로 교체하고 처리 결과를 반환합니다."""
+    image_paths = [
+        os.path.join(image_dir, name)
+        for image_dir in image_dirs
+        for name in os.listdir(image_dir)
+        if name.lower().endswith(IMAGE_EXTENSIONS)
+    ]
+
+    def _apply(path: str) -> Tuple[bool, bool]:
+        cache_path, hit = resize_to_cache(path, imgsz, cache_dir)
+        if cache_path:
+            link_file(cache_path, path)
+        return cache_path is not None, hit
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:  # cv2 디코딩/인코딩은 GIL을 해제
+        results = list(executor.map(_apply, image_paths))
+
+    summary = {
+        "images": len(image_paths),
+        "cached": sum(cached for cached, _ in results),
+        "hits": sum(hit for _, hit in results),
+    }
+    logger.info(f"Training image cache applied (imgsz: {imgsz}): {summary}")
+    return summary
+
+
+def prune_image_cache(cache_dir: str, max_age: int, now: float = None) -> int:
+    """병합 데이터셋에서 링크하지 않고 max_age초 동안 사용되지 않은 캐시 파일을 삭제하고 삭제 수를 반환합니다."""
+    if not os.path.isdir(cache_dir):
+        return 0
+
+    now = now or time.time()
+    removed = 0
+    for root, _, files in os.walk(cache_dir):
+        for name in files:
+            path = os.path.join(root, name)
+            try:
+                stat = os.stat(path)
+                if stat.st_nlink <= 1 and now - stat.st_mtime > max_age:
+                    os.remove(path)
+                    removed += 1
+            except FileNotFoundError:
+                continue
+    return removed
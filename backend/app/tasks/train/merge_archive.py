@@ -3,10 +3,12 @@ import zipfile
 import yaml
 import shutil
 import tempfile
-import random
-import math
 import hashlib
 import logging
+from app.config import TRAIN_IMAGE_CACHE_DIRECTORY, TRAIN_MERGE_MODE, TRAIN_EXTRACT_CACHE_DIRECTORY
+from app.tasks.train.image_cache import apply_image_cache
+from app.tasks.train.extract_cache import extract_to_cache
+from app.tasks.train.split_dataset import split_images, write_split_manifest
 from app.logger import LOGGER_NAME
 
 
@@ -42,6 +44,12 @@ def extract_zip_to_temp(zip_file):
     return temp_dir
 
 
+# zip 멤버 경로별 내용 키 (중앙 디렉터리의 CRC32와 크기, 압축을 다시 읽지 않음)
+def get_member_keys(zip_file):
+    with zipfile.ZipFile(zip_file, 'r') as zip_ref:
+        return {info.filename: f"{info.CRC:08x}:{info.file_size}" for info in zip_ref.infolist() if not info.is_dir()}
+
+
 # data.yaml 경로 찾기
 def find_yaml_path(temp_dir):
     for root, _, files in os.walk(temp_dir):
@@ -80,6 +88,26 @@ def copy_files(source_dir: str, dest_dir: str, file_prefix: str):
         shutil.copy(source_file_path, os.path.join(dest_dir, new_file_name))
 
 
+# 파일 심볼릭 링크 (파일명은 copy_files와 같음)
+def link_files(source_dir: str, dest_dir: str, file_prefix: str):
+    if not os.path.exists(source_dir):
+        return
+
+    for item in os.listdir(source_dir):
+        source_file_path = os.path.join(source_dir, item)
+
+        if not os.path.isfile(source_file_path):
+            continue
+
+        os.symlink(os.path.abspath(source_file_path), os.path.join(dest_dir, f"{file_prefix}_{item}"))
+
+
+# 병합된 split의 이미지 목록 파일 작성
+def write_image_manifest(output_dir, split, images_dir):
+    images = [os.path.join(images_dir, f) for f in os.listdir(images_dir) if os.path.isfile(os.path.join(images_dir, f))]
+    return write_split_manifest(os.path.join(output_dir, f"{split}.txt"), images)
+
+
 # data.yaml로 부터 클래스 정보 얻어오기
 def get_classes_from_yaml(data):
     if 'names' in data:
@@ -87,8 +115,10 @@ def get_classes_from_yaml(data):
     return []
 
 
-# classes.txt 생성 (각각의 train, val, test에 따로 생성)
+# classes.txt 생성 (각각의 train, val, test에 따로 생성), 클래스 인덱스 순서의 목록을 반환
+# (set 순서는 프로세스마다 달라질 수 있으므로 이름순으로 고정, task 인자로 넘길 수 있도록 list)
 def write_merged_classes(output_dir, total_classes):
+    total_classes = sorted(total_classes)
     for split in ['train', 'val', 'test']:
         merged_classes_txt_path = os.path.join(output_dir, 'labels', split, 'classes.txt')
         with open(merged_classes_txt_path, 'w') as f:
@@ -116,32 +146,30 @@ def write_merged_data_yaml(output_dir, merged_data, total_classes):
         f.write(f"names: [{names_list}]\n")
 
 
-# train 데이터에서 일부 추출하여 test 데이터로 생성
-def split_train_to_test(merged_dirs):
+def split_train_to_test(merged_dirs, output_dir, image_keys=None, label_classes=None, **split_options):
+    """
+    train 데이터에서 일부를 test 데이터로 분할하고 (train, test) 이미지 목록 파일 경로를 반환합니다.
+    파일은 images/train에 그대로 두고 output_dir에 train.txt, test.txt만 작성합니다.
+    image_keys: 이미지 파일명 -> 내용 키, label_classes: 라벨 파일명(확장자 제외) -> 클래스 이름 집합
+    """
     train_images_dir = merged_dirs['images']['train']
-    test_images_dir = merged_dirs['images']['test']
-    train_labels_dir = merged_dirs['labels']['train']
-    test_labels_dir = merged_dirs['labels']['test']
-        
-    train_images = [f for f in os.listdir(train_images_dir) if os.path.isfile(os.path.join(train_images_dir, f))]
-    num_test_samples = math.ceil(len(train_images) * 0.1)
-    test_images = random.sample(train_images, num_test_samples)
-
-    for image in test_images:
-        src_image = os.path.join(train_images_dir, image)
-        dest_image = os.path.join(test_images_dir, image)
-        shutil.move(src_image, dest_image)
-
-        label_name = os.path.splitext(image)[0] + '.txt'
-        src_label = os.path.join(train_labels_dir, label_name)
-        dest_label = os.path.join(test_labels_dir, label_name)
-        if os.path.exists(src_label):
-            shutil.move(src_label, dest_label)
+    train_images = sorted(f for f in os.listdir(train_images_dir) if os.path.isfile(os.path.join(train_images_dir, f)))
+    image_classes = None
+    if label_classes is not None:
+        image_classes = {image: label_classes.get(os.path.splitext(image)[0], set()) for image in train_images}
+
+    train_split, test_split = split_images(train_images, image_keys=image_keys, image_classes=image_classes, **split_options)
+    logger.info(f"Split train data into train: {len(train_split)}, test: {len(test_split)}")
+
+    return tuple(
+        write_split_manifest(os.path.join(output_dir, f"{split}.txt"), [os.path.join(train_images_dir, image) for image in images])
+        for split, images in (('train', train_split), ('test', test_split))
+    )
 
 
 def update_label(src_label_file, dest_label_file, class_mapping):
     """
-    라벨 파일의 인덱스를 입력된 class_mapping에 따라 매핑하여 저장
+    라벨 파일의 인덱스를 입력된 class_mapping에 따라 매핑하여 저장하고, 매핑된 값 집합을 반환
     class_mapping: index_to_class || class_to_index
     """
     new_lines = []
@@ -159,12 +187,28 @@ def update_label(src_label_file, dest_label_file, class_mapping):
     with open(dest_label_file, 'w') as f:
         f.write('\n'.join(new_lines))
 
+    return {line.split(' ', 1)[0] for line in new_lines}
+
 
-# 아카이브 파일 병합
-def merge_archive_files(zip_files, output_dir):
+# 병합이 끝난 디렉터리(data.yaml은 마지막에 생성)의 클래스 목록, 병합 전이거나 중단되었으면 None
+def load_merged_classes(output_dir):
+    data_yaml_path = os.path.join(output_dir, 'data.yaml')
+    if not os.path.exists(data_yaml_path):
+        return None
+    return get_classes_from_yaml(load_data_yaml(data_yaml_path))
+
+
+def merge_archive_files(zip_files, output_dir, imgsz=None, cache_dir=TRAIN_IMAGE_CACHE_DIRECTORY,
+                        merge_mode=TRAIN_MERGE_MODE, extract_cache_dir=TRAIN_EXTRACT_CACHE_DIRECTORY):
+    """
+    아카이브 파일 병합, data.yaml은 split별 이미지 목록 파일(train.txt, val.txt, test.txt)을 가리킨다.
+    merge_mode가 link이면 압축 해제 캐시의 이미지를 심볼릭 링크하고 라벨만 클래스 인덱스를 다시 매핑하여 저장한다.
+    imgsz가 주어지면 이미지를 학습 크기로 줄인 캐시 이미지로 교체한다.
+    """
     logging.info("start merge_archive_files")
     result = True
     total_classes = set()
+    image_keys, label_classes = {}, {}  # train 분할용 이미지 내용 키, 라벨 인덱스
 
     try:
         merged_dirs = create_output_dirs(output_dir)
@@ -174,12 +218,17 @@ def merge_archive_files(zip_files, output_dir):
             'test': merged_dirs['images']['test']
         }
 
-        for zip_file in zip_files:
+        for index, zip_file in enumerate(zip_files):
             temp_dir = None
             try:
-                temp_dir = extract_zip_to_temp(zip_file)  # 임시 폴더에 압축 해제
-                yaml_path = find_yaml_path(temp_dir.name)  # data.yaml 경로 얻기
-                hash = hashlib.md5(temp_dir.name.encode()).hexdigest()
+                if merge_mode == 'link':
+                    source_root = extract_to_cache(zip_file, extract_cache_dir)  # 캐시에 압축 해제 (재사용)
+                else:
+                    temp_dir = extract_zip_to_temp(zip_file)  # 임시 폴더에 압축 해제
+                    source_root = temp_dir.name
+                member_keys = get_member_keys(zip_file)
+                yaml_path = find_yaml_path(source_root)  # data.yaml 경로 얻기
+                hash = hashlib.md5(f"{index}:{source_root}".encode()).hexdigest()  # 같은 아카이브가 중복되어도 파일명이 겹치지 않도록
 
                 if yaml_path:
                     data = load_data_yaml(yaml_path)
@@ -193,16 +242,24 @@ def merge_archive_files(zip_files, output_dir):
                         if key not in data:
                             continue
 
-                        # 이미지 복사
-                        source_image_dir = os.path.join(temp_dir.name, data[key])
+                        # 이미지 복사 또는 링크
+                        source_image_dir = os.path.join(source_root, data[key])
 
                         if len(os.listdir(source_image_dir)) == 0:
                             continue
 
-                        logger.info(f"[Copy files] source: {source_image_dir}, dest: {merged_dirs['images'][key]}")
-                        copy_files(source_image_dir, merged_dirs['images'][key], file_prefix=hash)
+                        logger.info(f"[{merge_mode} files] source: {source_image_dir}, dest: {merged_dirs['images'][key]}")
+                        if merge_mode == 'link':
+                            link_files(source_image_dir, merged_dirs['images'][key], file_prefix=hash)
+                        else:
+                            copy_files(source_image_dir, merged_dirs['images'][key], file_prefix=hash)
+                        if key == 'train':
+                            for image in os.listdir(source_image_dir):
+                                member = os.path.relpath(os.path.join(source_image_dir, image), source_root).replace(os.sep, '/')
+                                if member in member_keys:
+                                    image_keys[f"{hash}_{image}"] = member_keys[member]
 
-                        source_label_dir = os.path.join(temp_dir.name, data[key].replace('images', 'labels'))
+                        source_label_dir = os.path.join(source_root, data[key].replace('images', 'labels'))
 
                         # 라벨 파일의 인덱스 정보를 클래스 이름으로 변환하여 dest에 저장
                         for label_file in os.listdir(source_label_dir):
@@ -212,14 +269,17 @@ def merge_archive_files(zip_files, output_dir):
                                 continue
                             
                             dest_label_file = os.path.join(merged_dirs['labels'][key], f"{hash}_{label_file}")
-                            update_label(src_label_file, dest_label_file, index_to_class)  # index to class
+                            classes_in_label = update_label(src_label_file, dest_label_file, index_to_class)  # index to class
+                            if key == 'train':
+                                label_classes[os.path.splitext(f"{hash}_{label_file}")[0]] = classes_in_label
             finally:
                 if temp_dir is not None:
                     temp_dir.cleanup()
 
         if len(os.listdir(merged_data_store_path['test'])) == 0:  # test 데이터가 없다면 train에서 일부를 test로 분리
             logger.warning("Because test data does not exist, part of the train data is extracted.")
-            split_train_to_test(merged_dirs)
+            merged_data_store_path['train'], merged_data_store_path['test'] = split_train_to_test(
+                merged_dirs, output_dir, image_keys=image_keys, label_classes=label_classes)
 
         total_classes = write_merged_classes(output_dir, total_classes)
         logger.info("classes.txt has been created.")
@@ -235,6 +295,13 @@ def merge_archive_files(zip_files, output_dir):
                 dest_label_file = os.path.join(merged_dirs['labels'][key], label_file)
                 update_label(dest_label_file, dest_label_file, class_to_index)  # class to index
 
+        if imgsz:
+            apply_image_cache(merged_dirs['images'].values(), imgsz, cache_dir)
+
+        for split, path in merged_data_store_path.items():  # 분할하지 않은 split의 이미지 목록 파일
+            if os.path.isdir(path):
+                merged_data_store_path[split] = write_image_manifest(output_dir, split, path)
+
         write_merged_data_yaml(output_dir, merged_data_store_path, total_classes) 
         logger.info("data.yaml has been created.")
 
@@ -0,0 +1,71 @@
+"""
+train/test 분할 (seed + 이미지 내용 해시 기반)
+
+이미지마다 sha256(seed:내용 키) 점수를 매기고 점수가 낮은 순서로 test를 고르므로 같은 seed와 같은 이미지면
+병합 순서나 파일명과 관계없이 항상 같은 분할이 만들어진다. 내용 키는 병합 시 zip 중앙 디렉터리의 CRC32와 크기로
+만들기 때문에 이미지를 다시 읽지 않고, 같은 이미지는 항상 같은 쪽에 들어가 train/test 간 중복이 생기지 않는다.
+stratify를 사용하면 이미지를 가장 드문 클래스 기준으로 묶어 묶음마다 같은 비율을 test로 뽑는다.
+
+파일은 옮기지 않고 ultralytics가 읽는 이미지 목록 파일(train.txt, test.txt)만 작성한다.
+"""
+
+import os
+import math
+import heapq
+import hashlib
+from collections import Counter, defaultdict
+from typing import Dict, Iterable, List, Set, Tuple
+from app.config import TRAIN_SPLIT_SEED, TRAIN_SPLIT_TEST_RATIO, TRAIN_SPLIT_STRATIFY
+
+
+def split_score(seed: int, key: str) -> str:
+    return hashlib.sha256(f"{seed}:{key}".encode('utf-8')).hexdigest()
+
+
+def stratum_of(classes: Set[str], class_counts: Counter) -> str:
+    """이미지에 포함된 클래스 중 가장 드문 클래스 (배경 이미지는 '')"""
+    if not classes:
+        return ''
+    return min(classes, key=lambda name: (class_counts[name], name))
+
+
+def select_test_images(images: Iterable[str], image_keys: Dict[str, str] = None, image_classes: Dict[str, Set[str]] = None,
+                       seed: int = TRAIN_SPLIT_SEED, ratio: float = TRAIN_SPLIT_TEST_RATIO,
+                       stratify: bool = TRAIN_SPLIT_STRATIFY) -> Set[str]:
+    """
+    test로 사용할 이미지 집합을 반환합니다.
+    image_keys: 이미지 파일명 -> 내용 키 (없으면 파일명 사용)
+    image_classes: 이미지 파일명 -> 라벨에 포함된 클래스 이름 집합 (없으면 stratify하지 않음)
+    """
+    image_keys = image_keys or {}
+    scored = [(split_score(seed, image_keys.get(image, image)), image) for image in images]
+
+    if not (stratify and image_classes):
+        return {image for _, image in heapq.nsmallest(math.ceil(len(scored) * ratio), scored)}
+
+    class_counts = Counter(name for _, image in scored for name in image_classes.get(image, ()))
+    strata = defaultdict(list)
+    for score, image in scored:
+        strata[stratum_of(image_classes.get(image, set()), class_counts)].append((score, image))
+
+    test_images = set()
+    for members in strata.values():
+        # 이미지가 하나뿐인 클래스는 학습에 남기고, 둘 이상이면 최소 하나는 test에 포함
+        count = max(1, round(len(members) * ratio)) if len(members) > 1 else 0
+        test_images.update(image for _, image in heapq.nsmallest(count, members))
+    return test_images
+
+
+def write_split_manifest(manifest_path: str, image_paths: Iterable[str]) -> str:
+    """manifest 파일 기준 상대 경로(./...)로 이미지 목록을 작성합니다. (ultralytics는 ./를 목록 파일 위치 기준으로 해석)"""
+    base_dir = os.path.dirname(manifest_path)
+    lines = sorted(f"./{os.path.relpath(path, base_dir).replace(os.sep, '/')}" for path in image_paths)
+    with open(manifest_path, 'w', encoding='utf-8') as f:
+        f.write('\n'.join(lines) + '\n')
+    return manifest_path
+
+
+def split_images(images: List[str], **kwargs) -> Tuple[List[str], List[str]]:
+    """(train 이미지 목록, test 이미지 목록)"""
+    test_images = select_test_images(images, **kwargs)
+    return [image for image in images if image not in test_images], [image for image in images if image in test_images]
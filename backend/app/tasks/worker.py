@@ -0,0 +1,140 @@
+"""
+Celery 워커 프로세스 단위로 공유되는 실행 컨텍스트
+
+워커 프로세스마다 하나의 이벤트 루프(전용 스레드에서 실행), 하나의 비동기 DB 엔진 풀,
+하나의 Redis 풀을 만들고 모든 task가 이를 빌려 사용한다.
+"""
+
+import os
+import asyncio
+import threading
+import logging
+import redis
+from redis.asyncio import Redis, ConnectionPool
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from celery.signals import worker_init, worker_process_init, worker_process_shutdown, worker_shutdown
+from app.config import (CELERY_BROKER_URL, SQLALCHEMY_DATABASE_URL, WORKER_DB_POOL_SIZE,
+                        WORKER_DB_MAX_OVERFLOW, WORKER_REDIS_MAX_CONNECTIONS, METRICS_WORKER_PORT)
+from app.cache import model_meta_cache
+from app.database import AppSession
+from app.metrics import pool_collector, register_db_pool, register_redis_pool, start_metrics_server
+from app.logger import LOGGER_NAME
+
+
+logger = logging.getLogger(LOGGER_NAME)
+
+
+class WorkerContext:
+    def __init__(self, database_url: str = SQLALCHEMY_DATABASE_URL, redis_url: str = CELERY_BROKER_URL):
+        self.pid = os.getpid()
+        self.loop = asyncio.new_event_loop()
+        self.engine = create_async_engine(
+            database_url,
+            echo=False,
+            pool_size=WORKER_DB_POOL_SIZE,
+            max_overflow=WORKER_DB_MAX_OVERFLOW,
+            pool_pre_ping=True,
+        )
+        self.session_factory = async_sessionmaker(self.engine, class_=AppSession, expire_on_commit=False)
+        self.redis_pool = ConnectionPool.from_url(redis_url, max_connections=WORKER_REDIS_MAX_CONNECTIONS)
+        self.sync_redis = redis.Redis(
+            connection_pool=redis.ConnectionPool.from_url(redis_url, max_connections=WORKER_REDIS_MAX_CONNECTIONS)
+        )
+        register_db_pool("worker", self.engine)
+        register_redis_pool("worker_async", self.redis_pool)
+        register_redis_pool("worker_sync", self.sync_redis.connection_pool)
+
+        # 이벤트 루프는 전용 스레드에서 계속 실행되고, task 스레드는 코루틴을 제출만 한다.
+        self.thread = threading.Thread(target=self._run_loop, name="worker-event-loop", daemon=True)
+        self.thread.start()
+
+        # 모델 메타데이터 캐시 무효화 이벤트 구독
+        self.listener = asyncio.run_coroutine_threadsafe(model_meta_cache.listen(self.redis()), self.loop)
+
+    def _run_loop(self):
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
+    def run(self, coro):
+        """코루틴을 공유 이벤트 루프에서 실행하고 결과를 기다립니다."""
+        return asyncio.run_coroutine_threadsafe(coro, self.loop).result()
+
+    def redis(self) -> Redis:
+        """공유 풀을 사용하는 Redis 클라이언트를 반환합니다. (aclose 시 풀은 유지됨)"""
+        return Redis(connection_pool=self.redis_pool)
+
+    def close(self):
+        async def _dispose():
+            await self.engine.dispose()
+            await self.redis_pool.disconnect()
+
+        for kind, name in (("db", "worker"), ("redis", "worker_async"), ("redis", "worker_sync")):
+            pool_collector.unregister(kind, name)
+
+        try:
+            self.listener.cancel()
+            self.run(_dispose())
+        finally:
+            self.loop.call_soon_threadsafe(self.loop.stop)
+            self.thread.join(timeout=5)
+            self.loop.close()
+            self.sync_redis.close()
+
+
+_context: WorkerContext = None
+_context_lock = threading.Lock()
+
+
+def get_worker_context() -> WorkerContext:
+    """현재 프로세스의 WorkerContext를 반환합니다. (fork 이후에는 새로 생성)"""
+    global _context
+
+    with _context_lock:
+        if _context is None or _context.pid != os.getpid():
+            _context = WorkerContext()
+            logger.info(f"Worker context initialized (pid: {_context.pid})")
+        return _context
+
+
+def close_worker_context():
+    global _context
+
+    with _context_lock:
+        if _context is None or _context.pid != os.getpid():
+            _context = None
+            return
+
+        try:
+            _context.close()
+            logger.info(f"Worker context closed (pid: {_context.pid})")
+        except Exception:
+            logger.error("Error closing worker context", exc_info=True)
+        finally:
+            _context = None
+
+
+def run_in_worker_loop(coro):
+    return get_worker_context().run(coro)
+
+
+# 메트릭 HTTP 서버는 워커 메인 프로세스에서 시작 (threads/solo 풀은 task가 같은 프로세스에서 실행됨)
+@worker_init.connect
+def on_worker_init(**kwargs):
+    start_metrics_server(METRICS_WORKER_PORT)
+
+
+# prefork 풀: 자식 프로세스마다 컨텍스트 생성/정리
+@worker_process_init.connect
+def on_worker_process_init(**kwargs):
+    get_worker_context()
+
+
+@worker_process_shutdown.connect
+def on_worker_process_shutdown(**kwargs):
+    close_worker_context()
+
+
+# threads/solo 풀: 메인 프로세스 종료 시 정리 (컨텍스트는 첫 task 실행 시 생성됨)
+@worker_shutdown.connect
+def on_worker_shutdown(**kwargs):
+    close_worker_context()
@@ -1,4 +1,5 @@
 from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Optional, List
 import inspect
 
 
@@ -12,7 +13,20 @@ def format_file_size(size_in_bytes: int) -> str:
             return f"{size_in_bytes / (1024 ** 2):.2f} MB"
         else:
             return f"{size_in_bytes / (1024 ** 3):.2f} GB"
-        
+
+
+# 콤마로 구분된 필드 목록 파싱 (없으면 None = 전체 필드)
+def parse_fields(fields: Optional[str]) -> Optional[List[str]]:
+    if not fields:
+        return None
+    return [field.strip() for field in fields.split(',') if field.strip()]
+
+
+# 직렬화된 dict에서 요청한 필드만 남김 (id는 커서로 사용되므로 항상 포함)
+def select_fields(data: dict, fields: Optional[List[str]]) -> dict:
+    if fields is None:
+        return data
+    return {key: value for key, value in data.items() if key == 'id' or key in fields}
 
 
 def transactional(func):
@@ -29,11 +43,15 @@ def transactional(func):
         if session.in_transaction():
             return await func(self, *args, **kwargs)
 
-        async with session.begin():
-            try:
-                return await func(self, *args, **kwargs)
-            except Exception:
-                await session.rollback()
-                raise
+        # session.begin() 컨텍스트는 session.commit()을 거치지 않으므로 직접 커밋 (커밋 후 작업 실행)
+        await session.begin()
+        try:
+            result = await func(self, *args, **kwargs)
+        except Exception:
+            await session.rollback()
+            raise
+
+        await session.commit()
+        return result
 
     return wrapper
\ No newline at end of file
@@ -0,0 +1,125 @@
+"""
+벤치마크 케이스 (아카이브 검증, 데이터셋 병합, 추론 후처리, 비디오 추론 전체 루프)
+비디오 추론은 Triton 주소가 주어지지 않으면 mock Triton 서버(benchmarks.mock_triton)를 띄워 파이프라인 오버헤드를 측정한다.
+
+케이스는 (scale, workdir, **options)를 받아 (run, 실행당 처리 항목 수[, reset])을 반환한다.
+합성 데이터는 workdir에 scale별로 한 번만 만들고 재사용한다.
+"""
+
+import os
+import shutil
+import itertools
+from benchmarks.harness import BenchmarkSkipped
+from benchmarks.synthetic import make_dataset_zip, make_video, make_yolo_output
+
+
+SCALES = {
+    'small': {'images': 100, 'frames': 30, 'detections': 100},
+    'medium': {'images': 1000, 'frames': 150, 'detections': 1000},
+    'large': {'images': 5000, 'frames': 600, 'detections': 8400},
+}
+CLASSES = [f'class_{i}' for i in range(5)]
+mock_servers = []  # 서버 객체가 해제되면 gRPC 서버도 멈추므로 케이스 프로세스가 끝날 때까지 참조 유지
+
+
+def require(module: str):
+    try:
+        return __import__(module)
+    except ImportError:
+        raise BenchmarkSkipped(f"{module} is not installed")
+
+
+def dataset_zip(scale: str, workdir: str, with_test: bool = True) -> str:
+    path = os.path.join(workdir, f"dataset_{scale}{'' if with_test else '_no_test'}.zip")
+    if not os.path.exists(path):
+        make_dataset_zip(path, images=SCALES[scale]['images'], classes=len(CLASSES), with_test=with_test)
+    return path
+
+
+def video_file(scale: str, workdir: str) -> str:
+    path = os.path.join(workdir, f"video_{scale}.mp4")
+    if not os.path.exists(path):
+        make_video(path, frames=SCALES[scale]['frames'])
+    return path
+
+
+def validate_zip(scale: str, workdir: str, **options):
+    from app.tasks.valid.valid_archive import parse_and_verify_zip
+
+    zip_path = dataset_zip(scale, workdir)
+
+    def run():
+        assert parse_and_verify_zip(zip_path)
+
+    return run, SCALES[scale]['images']
+
+
+def merge_archive(merge_mode: str):
+    def case(scale: str, workdir: str, **options):
+        from app.tasks.train.merge_archive import merge_archive_files
+
+        zip_path = dataset_zip(scale, workdir, with_test=False)  # test 분할 포함
+        extract_cache_dir = os.path.join(workdir, 'extract_cache')
+        output_dir = os.path.join(workdir, f'merge_{merge_mode}_{scale}')
+
+        def reset():
+            shutil.rmtree(output_dir, ignore_errors=True)
+
+        def run():
+            result, _ = merge_archive_files([zip_path], output_dir, merge_mode=merge_mode, extract_cache_dir=extract_cache_dir)
+            assert result
+
+        return run, SCALES[scale]['images'], reset
+
+    return case
+
+
+def postprocess(scale: str, workdir: str, **options):
+    require('cv2')
+    from app.tasks.inference.generate_inference_file import postprocess_detections
+
+    output = make_yolo_output(SCALES[scale]['detections'], classes=len(CLASSES))[0]
+
+    def run():
+        postprocess_detections(output, (720, 1280), 0.25, 0.45)
+
+    return run, 1
+
+
+def inference_video(scale: str, workdir: str, triton_url: str = None, model: str = None, mock_latency_ms: float = 0.0, **options):
+    require('cv2')
+    require('tritonclient')
+    require('grpc')
+    from app.tasks.inference.generate_inference_file import generate_inference_file
+
+    if not triton_url:  # mock 서버는 이 케이스의 프로세스가 끝날 때까지 실행
+        from benchmarks.mock_triton import start_mock_server, MockModelConfig
+
+        model = model or 'benchmark_model'
+        server, _, port = start_mock_server(config=MockModelConfig(classes=len(CLASSES), latency_ms=mock_latency_ms), models=[model])
+        mock_servers.append(server)
+        triton_url = f"127.0.0.1:{port}"
+    elif not model:
+        raise BenchmarkSkipped("requires --model (a model deployed on --triton-url)")
+
+    video_path = video_file(scale, workdir)
+    output_dir = os.path.join(workdir, 'inference_output')
+    counter = itertools.count()
+
+    def run():
+        generate_inference_file('video', video_path, model, CLASSES, output_name=f"{scale}_{next(counter)}.mp4",
+                                output_dir=output_dir, triton_url=triton_url)
+
+    def reset():
+        shutil.rmtree(output_dir, ignore_errors=True)
+
+    return run, SCALES[scale]['frames'], reset
+
+
+CASES = {
+    'validate_zip': validate_zip,
+    'merge_archive_link': merge_archive('link'),
+    'merge_archive_copy': merge_archive('copy'),
+    'postprocess': postprocess,
+    'inference_video': inference_video,
+}
@@ -0,0 +1,94 @@
+"""
+벤치마크 실행/통계/기준선 비교
+
+케이스마다 별도 프로세스(spawn)에서 실행하여 최대 RSS가 케이스별로 측정되도록 한다.
+결과는 케이스 이름("{case}[{scale}]")을 키로 하는 JSON이며, 같은 형식의 기준선과 p50/처리량을 비교한다.
+"""
+
+import time
+import resource
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, List
+
+
+class BenchmarkSkipped(Exception):
+    """의존성(cv2, Triton 등)이 없어 실행할 수 없는 케이스"""
+
+
+def percentile(values: List[float], q: float) -> float:
+    """선형 보간 백분위수 (q: 0 ~ 100)"""
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    position = (len(ordered) - 1) * q / 100
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+def peak_rss_mb() -> float:
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024  # Linux: KB
+
+
+def summarize(latencies: List[float], items_per_run: int) -> dict:
+    total = sum(latencies)
+    return {
+        "runs": len(latencies),
+        "items_per_run": items_per_run,
+        "p50_ms": round(percentile(latencies, 50) * 1000, 3),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 3),
+        "mean_ms": round(total / len(latencies) * 1000, 3),
+        "throughput": round(items_per_run * len(latencies) / total, 3) if total else None,  # items/s
+    }
+
+
+def measure(run: Callable[[], None], items_per_run: int, repeat: int = 10, warmup: int = 1,
+            reset: Callable[[], None] = None, clock=time.perf_counter) -> dict:
+    """run을 warmup회 실행한 뒤 repeat회 측정합니다. reset은 매 실행 전에 측정 시간 밖에서 호출합니다."""
+    latencies = []
+    for i in range(warmup + repeat):
+        if reset:
+            reset()
+        start = clock()
+        run()
+        if i >= warmup:
+            latencies.append(clock() - start)
+    return summarize(latencies, items_per_run)
+
+
+def run_case(case_name: str, scale: str, workdir: str, repeat: int, warmup: int, options: dict) -> dict:
+    """케이스 준비 후 측정 (자식 프로세스에서 실행), 케이스는 (run, 실행당 처리 항목 수[, reset])을 반환"""
+    from benchmarks.cases import CASES
+
+    try:
+        run, items_per_run, *reset = CASES[case_name](scale, workdir, **options)
+    except BenchmarkSkipped as e:
+        return {"skipped": str(e)}
+
+    result = measure(run, items_per_run, repeat, warmup, reset=reset[0] if reset else None)
+    result["peak_rss_mb"] = round(peak_rss_mb(), 1)
+    return result
+
+
+def run_isolated(case_name: str, scale: str, workdir: str, repeat: int, warmup: int, options: dict) -> dict:
+    context = multiprocessing.get_context('spawn')
+    with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+        return executor.submit(run_case, case_name, scale, workdir, repeat, warmup, options).result()
+
+
+def compare(results: Dict[str, dict], baseline: Dict[str, dict], tolerance: float = 0.2) -> List[dict]:
+    """기준선 대비 p50이 tolerance 이상 느려졌거나 처리량이 tolerance 이상 줄어든 케이스 목록"""
+    regressions = []
+    for name, result in results.items():
+        base = baseline.get(name)
+        if not base or "skipped" in result or "skipped" in base:
+            continue
+
+        for metric, worse in (("p50_ms", lambda new, old: new > old * (1 + tolerance)),
+                              ("throughput", lambda new, old: new < old * (1 - tolerance))):
+            new, old = result.get(metric), base.get(metric)
+            if new is not None and old and worse(new, old):
+                regressions.append({"case": name, "metric": metric, "baseline": old, "current": new,
+                                    "change": round((new - old) / old, 3)})
+    return regressions
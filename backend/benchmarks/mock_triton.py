@@ -0,0 +1,280 @@
+"""
+Triton 호환 mock gRPC 서버 (GPU, 모델 없이 추론/배포 흐름과 부하 테스트 실행)
+
+- ModelInfer: 입력 배치 크기만큼 합성 YOLO 출력(output0: batch x detections x 6)을 반환
+- RepositoryModelLoad/Unload, RepositoryIndex, ModelMetadata, ModelConfig, ModelReady, ServerLive/Ready/Metadata
+- 지연 시간: 실행마다 latency_ms + 이미지당 per_image_latency_ms, 모델 인스턴스 수(instances)만큼만 동시에 실행
+- batch_window_ms > 0이면 Triton dynamic batching처럼 window 동안 들어온 요청을 모아 한 번에 실행
+
+모델 시간을 0으로 두면 파이프라인 자체의 오버헤드만 측정할 수 있다.
+
+    python -m benchmarks.mock_triton --port 8001 --model example_model --latency-ms 5
+"""
+
+import sys
+import time
+import queue
+import signal
+import logging
+import argparse
+import threading
+from concurrent import futures
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Dict, List
+from benchmarks.synthetic import make_yolo_output
+
+try:
+    import grpc
+    from tritonclient.grpc import service_pb2, service_pb2_grpc, model_config_pb2
+    ServicerBase = service_pb2_grpc.GRPCInferenceServiceServicer
+except ImportError:  # tritonclient[grpc]는 워커 이미지에만 설치됨
+    grpc = None
+    ServicerBase = object
+
+
+logger = logging.getLogger(__name__)
+INPUT_NAME = "images"
+OUTPUT_NAME = "output0"
+
+
+@dataclass
+class MockModelConfig:
+    detections: int = 100  # 이미지당 검출 수
+    classes: int = 5
+    input_size: int = 640
+    max_batch_size: int = 10
+    latency_ms: float = 0.0  # 실행당 고정 지연
+    per_image_latency_ms: float = 0.0  # 배치의 이미지당 추가 지연
+    instances: int = 1  # 동시에 실행할 수 있는 모델 인스턴스 수
+    batch_window_ms: float = 0.0  # dynamic batching 대기 시간 (0이면 요청마다 바로 실행)
+    seed: int = 0
+
+
+@dataclass
+class MockStats:
+    requests: int = 0
+    images: int = 0
+    executions: int = 0
+    batch_sizes: List[int] = field(default_factory=list)
+
+
+class DynamicBatcher:
+    """
+    window 동안 들어온 요청을 max_batch_size까지 모아 execute(전체 배치 크기)를 한 번 호출합니다.
+    묶인 요청은 모두 실행이 끝난 뒤 반환되고, 묶음은 instances개까지 동시에 실행됩니다.
+    """
+
+    def __init__(self, window: float, max_batch_size: int, execute, instances: int = 1):
+        self.window = window
+        self.max_batch_size = max_batch_size
+        self.execute = execute
+        self.requests = queue.Queue()
+        self.pool = futures.ThreadPoolExecutor(max_workers=instances)
+        threading.Thread(target=self._collect, name="mock-triton-batcher", daemon=True).start()
+
+    def submit(self, batch_size: int) -> None:
+        done = threading.Event()
+        self.requests.put((batch_size, done))
+        done.wait()
+
+    def _collect(self) -> None:
+        carry = None
+        while True:
+            group = [carry or self.requests.get()]
+            carry = None
+            size = group[0][0]
+            deadline = time.monotonic() + self.window
+            while size < self.max_batch_size:
+                try:
+                    request = self.requests.get(timeout=max(deadline - time.monotonic(), 0))
+                except queue.Empty:
+                    break
+                if size + request[0] > self.max_batch_size:  # 다음 묶음의 첫 요청
+                    carry = request
+                    break
+                group.append(request)
+                size += request[0]
+            self.pool.submit(self._run, group, size)
+
+    def _run(self, group, size: int) -> None:
+        try:
+            self.execute(size)
+        finally:
+            for _, done in group:
+                done.set()
+
+
+class MockExecutor:
+    """모델 인스턴스 수만큼 동시에 실행하고 설정된 지연 시간만큼 대기합니다."""
+
+    def __init__(self, config: MockModelConfig, stats: MockStats, sleep=time.sleep):
+        self.config = config
+        self.stats = stats
+        self.sleep = sleep
+        self.instances = threading.Semaphore(config.instances)
+        self.lock = threading.Lock()
+        self.batcher = DynamicBatcher(config.batch_window_ms / 1000, config.max_batch_size, self._execute, config.instances) \
+            if config.batch_window_ms > 0 else None
+
+    def run(self, batch_size: int) -> None:
+        with self.lock:
+            self.stats.requests += 1
+            self.stats.images += batch_size
+        if self.batcher:
+            self.batcher.submit(batch_size)
+        else:
+            self._execute(batch_size)
+
+    def _execute(self, batch_size: int) -> None:
+        with self.instances:
+            delay = (self.config.latency_ms + self.config.per_image_latency_ms * batch_size) / 1000
+            if delay > 0:
+                self.sleep(delay)
+        with self.lock:
+            self.stats.executions += 1
+            self.stats.batch_sizes.append(batch_size)
+
+
+class MockTritonServicer(ServicerBase):
+    def __init__(self, config: MockModelConfig = None, models: List[str] = None):
+        self.config = config or MockModelConfig()
+        self.stats = MockStats()
+        self.models: Dict[str, bool] = {name: True for name in models or []}  # 모델 이름 -> 로드 여부
+        self.executor = MockExecutor(self.config, self.stats)
+        self.outputs = {}  # 배치 크기별 합성 출력 (요청마다 새로 만들지 않음)
+
+    def _output(self, batch_size: int):
+        if batch_size not in self.outputs:
+            self.outputs[batch_size] = make_yolo_output(
+                self.config.detections * batch_size, self.config.classes, self.config.input_size, self.config.seed
+            ).reshape(batch_size, self.config.detections, 6)
+        return self.outputs[batch_size]
+
+    def _require_model(self, name: str, context):
+        if not self.models.get(name):
+            context.abort(grpc.StatusCode.UNAVAILABLE, f"Request for unknown model: '{name}' is not found")
+
+    def ServerLive(self, request, context):
+        return service_pb2.ServerLiveResponse(live=True)
+
+    def ServerReady(self, request, context):
+        return service_pb2.ServerReadyResponse(ready=True)
+
+    def ServerMetadata(self, request, context):
+        return service_pb2.ServerMetadataResponse(name="mock_triton", version="mock", extensions=["model_repository"])
+
+    def ModelReady(self, request, context):
+        return service_pb2.ModelReadyResponse(ready=bool(self.models.get(request.name)))
+
+    def ModelMetadata(self, request, context):
+        self._require_model(request.name, context)
+        size = self.config.input_size
+        return service_pb2.ModelMetadataResponse(
+            name=request.name,
+            versions=["1"],
+            platform="onnxruntime_onnx",
+            inputs=[service_pb2.ModelMetadataResponse.TensorMetadata(name=INPUT_NAME, datatype="FP32", shape=[-1, 3, size, size])],
+            outputs=[service_pb2.ModelMetadataResponse.TensorMetadata(name=OUTPUT_NAME, datatype="FP32",
+                                                                      shape=[-1, self.config.detections, 6])],
+        )
+
+    def ModelConfig(self, request, context):
+        self._require_model(request.name, context)
+        return service_pb2.ModelConfigResponse(config=model_config_pb2.ModelConfig(
+            name=request.name, platform="onnxruntime_onnx", max_batch_size=self.config.max_batch_size,
+        ))
+
+    def RepositoryIndex(self, request, context):
+        return service_pb2.RepositoryIndexResponse(models=[
+            service_pb2.RepositoryIndexResponse.ModelIndex(name=name, version="1", state="READY" if loaded else "UNAVAILABLE")
+            for name, loaded in self.models.items()
+            if loaded or not request.ready
+        ])
+
+    def RepositoryModelLoad(self, request, context):
+        self.models[request.model_name] = True
+        logger.info(f"Model loaded: {request.model_name}")
+        return service_pb2.RepositoryModelLoadResponse()
+
+    def RepositoryModelUnload(self, request, context):
+        if request.model_name in self.models:
+            self.models[request.model_name] = False
+        logger.info(f"Model unloaded: {request.model_name}")
+        return service_pb2.RepositoryModelUnloadResponse()
+
+    def ModelInfer(self, request, context):
+        self._require_model(request.model_name, context)
+        batch_size = request.inputs[0].shape[0] if request.inputs and request.inputs[0].shape else 1
+        if batch_size > self.config.max_batch_size:
+            context.abort(grpc.StatusCode.INVALID_ARGUMENT,
+                          f"inference request batch-size must be <= {self.config.max_batch_size} for '{request.model_name}'")
+
+        self.executor.run(batch_size)
+
+        output = self._output(batch_size)
+        response = service_pb2.ModelInferResponse(model_name=request.model_name, model_version="1", id=request.id)
+        response.outputs.add(name=OUTPUT_NAME, datatype="FP32", shape=list(output.shape))
+        response.raw_output_contents.append(output.tobytes())
+        return response
+
+
+def start_mock_server(port: int = 0, config: MockModelConfig = None, models: List[str] = None, max_workers: int = 16):
+    """mock 서버를 시작하고 (server, servicer, port)를 반환합니다. port=0이면 빈 포트 사용"""
+    if grpc is None:
+        raise ImportError("grpcio and tritonclient[grpc] are required for the mock Triton server")
+
+    servicer = MockTritonServicer(config, models)
+    server = grpc.server(futures.ThreadPoolExecutor(max_workers=max_workers))
+    service_pb2_grpc.add_GRPCInferenceServiceServicer_to_server(servicer, server)
+    port = server.add_insecure_port(f"127.0.0.1:{port}")
+    server.start()
+    logger.info(f"Mock Triton server started on 127.0.0.1:{port} (models: {list(servicer.models)})")
+    return server, servicer, port
+
+
+@contextmanager
+def mock_triton_server(config: MockModelConfig = None, models: List[str] = None, port: int = 0):
+    """with mock_triton_server(models=['example_model']) as (url, servicer): ..."""
+    server, servicer, port = start_mock_server(port, config, models)
+    try:
+        yield f"127.0.0.1:{port}", servicer
+    finally:
+        server.stop(grace=None)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Triton compatible mock gRPC server")
+    parser.add_argument('--port', type=int, default=8001)
+    parser.add_argument('--model', action='append', default=[], help="미리 로드할 모델 이름 (여러 번 지정 가능)")
+    parser.add_argument('--detections', type=int, default=MockModelConfig.detections)
+    parser.add_argument('--classes', type=int, default=MockModelConfig.classes)
+    parser.add_argument('--max-batch-size', type=int, default=MockModelConfig.max_batch_size)
+    parser.add_argument('--latency-ms', type=float, default=MockModelConfig.latency_ms)
+    parser.add_argument('--per-image-latency-ms', type=float, default=MockModelConfig.per_image_latency_ms)
+    parser.add_argument('--instances', type=int, default=MockModelConfig.instances)
+    parser.add_argument('--batch-window-ms', type=float, default=MockModelConfig.batch_window_ms)
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO)
+    config = MockModelConfig(
+        detections=args.detections, classes=args.classes, max_batch_size=args.max_batch_size,
+        latency_ms=args.latency_ms, per_image_latency_ms=args.per_image_latency_ms,
+        instances=args.instances, batch_window_ms=args.batch_window_ms,
+    )
+    server, servicer, _ = start_mock_server(args.port, config, args.model)
+
+    stop = threading.Event()
+    signal.signal(signal.SIGTERM, lambda *_: stop.set())
+    try:
+        stop.wait()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stop(grace=1)
+        logger.info(f"Mock Triton server stopped: {servicer.stats}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
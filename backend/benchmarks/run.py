@@ -0,0 +1,85 @@
+"""
+벤치마크 실행 (backend 디렉터리에서)
+
+    python -m benchmarks.run --scales small medium --output results.json
+    python -m benchmarks.run --save-baseline benchmarks/baseline.json
+    python -m benchmarks.run --baseline benchmarks/baseline.json --tolerance 0.2
+
+결과 JSON: {"environment": {...}, "results": {"{case}[{scale}]": {runs, p50_ms, p99_ms, mean_ms, throughput, peak_rss_mb}}}
+기준선과 비교하여 느려진 케이스가 있으면 regressions에 기록하고 종료 코드 1을 반환한다.
+"""
+
+import os
+import sys
+import json
+import argparse
+import platform
+import tempfile
+from datetime import datetime, timezone
+from benchmarks.cases import CASES, SCALES
+from benchmarks.harness import run_isolated, compare
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="watch_ml benchmark suite")
+    parser.add_argument('--cases', nargs='+', choices=list(CASES), default=list(CASES))
+    parser.add_argument('--scales', nargs='+', choices=list(SCALES), default=['small'])
+    parser.add_argument('--repeat', type=int, default=10)
+    parser.add_argument('--warmup', type=int, default=1)
+    parser.add_argument('--workdir', default=None, help="합성 데이터/출력 디렉터리 (기본값: 임시 디렉터리)")
+    parser.add_argument('--triton-url', default=None, help="inference_video 케이스에서 사용할 Triton gRPC 주소 (기본값: mock 서버)")
+    parser.add_argument('--mock-latency-ms', type=float, default=0.0, help="mock Triton 서버의 추론당 지연 시간")
+    parser.add_argument('--model', default=None, help="inference_video 케이스에서 사용할 배포된 모델 이름")
+    parser.add_argument('--output', default=None, help="결과 JSON 경로 (기본값: 표준 출력)")
+    parser.add_argument('--baseline', default=None, help="비교할 기준선 결과 JSON")
+    parser.add_argument('--tolerance', type=float, default=0.2, help="허용 성능 저하 비율 (0.2: 20%%)")
+    parser.add_argument('--save-baseline', default=None, help="이번 결과를 기준선으로 저장할 경로")
+    return parser.parse_args(argv)
+
+
+def environment() -> dict:
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+    }
+
+
+def write_json(path: str, data: dict):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2)
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    options = {"triton_url": args.triton_url, "model": args.model, "mock_latency_ms": args.mock_latency_ms}
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        workdir = args.workdir or temp_dir
+        os.makedirs(workdir, exist_ok=True)
+
+        results = {}
+        for scale in args.scales:
+            for case_name in args.cases:
+                name = f"{case_name}[{scale}]"
+                results[name] = run_isolated(case_name, scale, workdir, args.repeat, args.warmup, options)
+                print(f"{name}: {results[name]}", file=sys.stderr)
+
+    report = {"environment": environment(), "results": results}
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            report["regressions"] = compare(results, json.load(f)["results"], args.tolerance)
+
+    if args.save_baseline:
+        write_json(args.save_baseline, report)
+    if args.output:
+        write_json(args.output, report)
+    else:
+        print(json.dumps(report, indent=2))
+
+    return 1 if report.get("regressions") else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
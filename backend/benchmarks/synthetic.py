@@ -0,0 +1,84 @@
+"""
+벤치마크용 합성 데이터 생성 (데이터셋 zip, 비디오, Triton YOLO 출력)
+
+같은 seed면 항상 같은 데이터를 만든다. 이미지는 cv2가 있으면 실제 JPEG로, 없으면 같은 크기의 임의 바이트로 저장한다.
+(검증/병합은 이미지를 디코딩하지 않으므로 바이트 크기만 맞으면 된다)
+"""
+
+import zipfile
+import yaml
+import numpy as np
+
+
+def encode_image(width: int, height: int, rng: np.random.Generator) -> bytes:
+    try:
+        import cv2
+    except ImportError:
+        return rng.integers(0, 256, size=width * height // 10, dtype=np.uint8).tobytes()  # JPEG 압축률 대략 1/10
+
+    image = rng.integers(0, 256, size=(height, width, 3), dtype=np.uint8)
+    encoded, buffer = cv2.imencode('.jpg', image)
+    return buffer.tobytes()
+
+
+def make_label(boxes: int, classes: int, rng: np.random.Generator) -> str:
+    lines = []
+    for _ in range(boxes):
+        width, height = rng.uniform(0.05, 0.5, size=2)
+        x, y = rng.uniform(width / 2, 1 - width / 2), rng.uniform(height / 2, 1 - height / 2)
+        lines.append(f"{rng.integers(classes)} {x:.6f} {y:.6f} {width:.6f} {height:.6f}")
+    return '\n'.join(lines)
+
+
+def make_dataset_zip(path: str, images: int = 100, classes: int = 5, boxes_per_image: int = 3,
+                     image_size: tuple = (640, 480), with_test: bool = True, seed: int = 0) -> str:
+    """YOLO 형식 데이터셋 zip (train 80%, val 10%, test 10%, with_test가 False면 test 없음)"""
+    rng = np.random.default_rng(seed)
+    splits = {'train': int(images * 0.8), 'val': max(images // 10, 1)}
+    if with_test:
+        splits['test'] = max(images - sum(splits.values()), 1)
+
+    data = {split: f'images/{split}' for split in splits}
+    data.update({'nc': classes, 'names': [f'class_{i}' for i in range(classes)]})
+
+    with zipfile.ZipFile(path, 'w', compression=zipfile.ZIP_STORED) as zipf:
+        zipf.writestr('data.yaml', yaml.dump(data))
+        for split, count in splits.items():
+            for i in range(count):
+                zipf.writestr(f'images/{split}/image_{i:06d}.jpg', encode_image(*image_size, rng))
+                zipf.writestr(f'labels/{split}/image_{i:06d}.txt', make_label(boxes_per_image, classes, rng))
+    return path
+
+
+def make_video(path: str, frames: int = 90, width: int = 640, height: int = 360, fps: float = 30.0, seed: int = 0) -> str:
+    """움직이는 사각형이 있는 mp4 비디오 (cv2 필요)"""
+    import cv2
+
+    rng = np.random.default_rng(seed)
+    background = rng.integers(0, 64, size=(height, width, 3), dtype=np.uint8)
+    writer = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*'mp4v'), fps, (width, height))
+    try:
+        for i in range(frames):
+            frame = background.copy()
+            x = (i * 7) % max(width - 80, 1)
+            y = (i * 3) % max(height - 80, 1)
+            cv2.rectangle(frame, (x, y), (x + 80, y + 80), (0, 200, 255), -1)
+            writer.write(frame)
+    finally:
+        writer.release()
+    return path
+
+
+def make_yolo_output(detections: int = 100, classes: int = 5, input_size: int = 640, seed: int = 0) -> np.ndarray:
+    """Triton output0 형식 (1, detections, 6): x_min, y_min, x_max, y_max, confidence, class_id"""
+    rng = np.random.default_rng(seed)
+    x_min = rng.uniform(0, input_size * 0.8, size=detections)
+    y_min = rng.uniform(0, input_size * 0.8, size=detections)
+    width = rng.uniform(8, input_size * 0.2, size=detections)
+    height = rng.uniform(8, input_size * 0.2, size=detections)
+    output = np.stack([
+        x_min, y_min, x_min + width, y_min + height,
+        rng.uniform(0, 1, size=detections),
+        rng.integers(0, classes, size=detections),
+    ], axis=1).astype(np.float32)
+    return output[np.newaxis]
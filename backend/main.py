@@ -4,10 +4,18 @@ from app.entity import create_tables
 from app.exceptions import ForbiddenException, NotFoundException, BadRequestException
 from app.repositories.ml_repository import create_base_model
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 from contextlib import asynccontextmanager
 from app.logger import init_logger, LOGGER_NAME
+from app.cache import model_meta_cache
+from app.config import CELERY_BROKER_URL, METRICS_ENABLED
+from app.database import async_engine
+from app.metrics import HTTP_REQUEST_DURATION, register_db_pool
+from prometheus_client import generate_latest, CONTENT_TYPE_LATEST
+from redis.asyncio import from_url
+import asyncio
 import logging
+import time
 
 
 logger = logging.getLogger(LOGGER_NAME)
@@ -18,7 +26,13 @@ async def lifespan(app: FastAPI):
     init_logger()
     await create_tables()
     await create_base_model()
+
+    # 다른 프로세스(워커 등)에서 발생한 모델 메타데이터 무효화 이벤트 구독
+    redis = from_url(CELERY_BROKER_URL)
+    listener = asyncio.create_task(model_meta_cache.listen(redis))
     yield
+    listener.cancel()
+    await redis.aclose()
 
 
 app = FastAPI(lifespan=lifespan)
@@ -29,9 +43,37 @@ app.add_middleware(
     allow_credentials=True,  # 자격 증명(쿠키 등) 허용 여부
     allow_methods=["*"],  # 모든 HTTP 메서드 허용 (GET, POST, PUT 등)
     allow_headers=["*"],  # 모든 헤더 허용
+    expose_headers=["X-Total-Count"],  # 목록 API 전체 개수
 )
 
 
+register_db_pool("api", async_engine)
+
+
+# 라우트 경로 템플릿(/ml/{id} 등) 단위로 요청 지연 시간 기록
+@app.middleware("http")
+async def record_request_metrics(request: Request, call_next):
+    if not METRICS_ENABLED or request.url.path == "/metrics":
+        return await call_next(request)
+
+    start = time.perf_counter()
+    status = 500
+    try:
+        response = await call_next(request)
+        status = response.status_code
+        return response
+    finally:
+        route = request.scope.get("route")
+        HTTP_REQUEST_DURATION.labels(
+            request.method, route.path if route else "unmatched", str(status)
+        ).observe(time.perf_counter() - start)
+
+
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    return Response(generate_latest(), media_type=CONTENT_TYPE_LATEST)
+
+
 @app.exception_handler(Exception)
 async def global_exception_handler(request: Request, exc: Exception):
     if isinstance(exc, NotFoundException):
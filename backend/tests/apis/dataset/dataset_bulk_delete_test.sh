@@ -0,0 +1,7 @@
+#!/bin/bash
+
+DATASET_IDS=$1  # ex) 1,2,3
+
+curl -X POST "http://localhost:5000/dataset/bulk/delete" \
+-H "Content-Type: application/json" \
+-d "{\"ids\": [$DATASET_IDS]}"
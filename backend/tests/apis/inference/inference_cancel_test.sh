@@ -0,0 +1 @@
+curl -X POST "http://localhost:5000/inference/1/cancel"
\ No newline at end of file
@@ -0,0 +1 @@
+curl -X GET "http://localhost:5000/inference/1/detections?start=0&end=5&classes=person,car"
\ No newline at end of file
@@ -0,0 +1,14 @@
+#!/bin/bash
+
+ZIP_FILE_ID=$1
+
+# 저장된 프로필(gpu_fast)을 사용하고 epochs만 요청 값으로 변경
+curl -X POST "http://localhost:5000/ml/create" \
+-H "Content-Type: application/json" \
+-d "{
+    \"m_name\": \"profile_model\",
+    \"b_m_name\": \"yolov10n\",
+    \"zip_files\": [$ZIP_FILE_ID],
+    \"profile\": \"gpu_fast\",
+    \"epochs\": 10
+}"
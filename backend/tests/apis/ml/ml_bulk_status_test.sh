@@ -0,0 +1,8 @@
+#!/bin/bash
+
+MODEL_IDS=$1  # ex) 1,2,3
+STATUS=${2:-failed}
+
+curl -X POST "http://localhost:5000/ml/bulk/status" \
+-H "Content-Type: application/json" \
+-d "{\"ids\": [$MODEL_IDS], \"status\": \"$STATUS\"}"
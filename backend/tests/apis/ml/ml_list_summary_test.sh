@@ -0,0 +1 @@
+curl -i -X GET "http://localhost:5000/ml/list?limit=50&fields=model_name,version,status"
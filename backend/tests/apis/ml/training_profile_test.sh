@@ -0,0 +1,12 @@
+#!/bin/bash
+
+API_URL="http://localhost:5000/ml/profile"
+
+# 프로필 저장 (같은 이름이면 덮어씀)
+curl -X POST "$API_URL" \
+     -H "Content-Type: application/json" \
+     -d '{"name": "gpu_fast", "epochs": 50, "batch": -1, "imgsz": 640, "workers": 8, "cache": "ram", "amp": true, "patience": 20}' \
+     -w "\n"
+
+# 프로필 목록
+curl -X GET "$API_URL/list" -w "\n"
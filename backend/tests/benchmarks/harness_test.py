@@ -0,0 +1,52 @@
+import itertools
+from benchmarks.harness import percentile, measure, compare
+from benchmarks.synthetic import make_dataset_zip, make_yolo_output
+from app.tasks.valid.valid_archive import parse_and_verify_zip
+
+
+def test_percentile():
+    values = [float(i) for i in range(1, 101)]
+    assert percentile(values, 50) == 50.5
+    assert percentile(values, 99) == 99.01
+    assert percentile([3.0], 99) == 3.0
+
+
+def test_measure_excludes_warmup_and_reset():
+    ticks = itertools.count()
+    calls = []
+
+    result = measure(lambda: calls.append('run'), items_per_run=10, repeat=4, warmup=2,
+                     reset=lambda: calls.append('reset'), clock=lambda: next(ticks))
+
+    assert calls == ['reset', 'run'] * 6
+    assert result['runs'] == 4
+    assert result['p50_ms'] == 1000.0 and result['throughput'] == 10.0
+
+
+def test_compare_reports_regressions():
+    baseline = {
+        'merge[small]': {'p50_ms': 10.0, 'throughput': 100.0},
+        'validate[small]': {'p50_ms': 10.0, 'throughput': 100.0},
+        'postprocess[small]': {'skipped': 'cv2 is not installed'},
+    }
+    results = {
+        'merge[small]': {'p50_ms': 13.0, 'throughput': 70.0},
+        'validate[small]': {'p50_ms': 11.0, 'throughput': 95.0},
+        'postprocess[small]': {'p50_ms': 1.0, 'throughput': 1000.0},
+        'new[small]': {'p50_ms': 1.0, 'throughput': 1.0},
+    }
+
+    regressions = compare(results, baseline, tolerance=0.2)
+
+    assert [(r['case'], r['metric']) for r in regressions] == [('merge[small]', 'p50_ms'), ('merge[small]', 'throughput')]
+
+
+def test_synthetic_dataset_zip_is_valid(tmp_path):
+    zip_path = make_dataset_zip(str(tmp_path / 'dataset.zip'), images=20, classes=3)
+    assert parse_and_verify_zip(zip_path)
+
+
+def test_synthetic_yolo_output_shape():
+    output = make_yolo_output(detections=50, classes=3)
+    assert output.shape == (1, 50, 6)
+    assert (output[0, :, 2] > output[0, :, 0]).all() and (output[0, :, 5] < 3).all()
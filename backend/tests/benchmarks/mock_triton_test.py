@@ -0,0 +1,62 @@
+import time
+import threading
+import pytest
+from benchmarks.mock_triton import DynamicBatcher, MockExecutor, MockModelConfig, MockStats
+
+
+def test_executor_applies_latency_per_batch():
+    delays = []
+    stats = MockStats()
+    executor = MockExecutor(MockModelConfig(latency_ms=5, per_image_latency_ms=2), stats, sleep=delays.append)
+
+    executor.run(1)
+    executor.run(4)
+
+    assert delays == pytest.approx([0.007, 0.013])
+    assert (stats.requests, stats.images, stats.executions) == (2, 5, 2)
+
+
+def test_dynamic_batcher_groups_concurrent_requests():
+    executed = []
+    batcher = DynamicBatcher(window=0.2, max_batch_size=4, execute=executed.append)
+
+    threads = [threading.Thread(target=batcher.submit, args=(1,)) for _ in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=5)
+
+    assert sum(executed) == 6
+    assert max(executed) == 4 and len(executed) < 6, "동시에 들어온 요청이 묶여서 실행되지 않았습니다."
+
+
+def test_dynamic_batcher_runs_single_request_after_window():
+    executed = []
+    batcher = DynamicBatcher(window=0.01, max_batch_size=8, execute=executed.append)
+
+    start = time.monotonic()
+    batcher.submit(2)
+
+    assert executed == [2]
+    assert time.monotonic() - start < 1
+
+
+def test_mock_server_infer_and_repository():
+    grpcclient = pytest.importorskip('tritonclient.grpc')
+    np = pytest.importorskip('numpy')
+    from benchmarks.mock_triton import mock_triton_server
+
+    with mock_triton_server(MockModelConfig(detections=7), models=['example_model']) as (url, servicer):
+        client = grpcclient.InferenceServerClient(url=url)
+        assert client.is_server_live() and client.is_model_ready('example_model')
+
+        inputs = [grpcclient.InferInput('images', [2, 3, 640, 640], 'FP32')]
+        inputs[0].set_data_from_numpy(np.zeros((2, 3, 640, 640), dtype=np.float32))
+        response = client.infer('example_model', inputs, outputs=[grpcclient.InferRequestedOutput('output0')])
+        assert response.as_numpy('output0').shape == (2, 7, 6)
+
+        client.unload_model('example_model')
+        assert not client.is_model_ready('example_model')
+        client.load_model('deployed_model')
+        assert client.is_model_ready('deployed_model')
+        assert servicer.stats.images == 2
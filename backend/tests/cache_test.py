@@ -0,0 +1,62 @@
+import time
+import pytest
+import pytest_asyncio
+from app.cache import TTLCache, ModelMetaCache, inference_result_key
+from app.dto import InferenceOptions
+from app.database import get_redis
+
+
+@pytest_asyncio.fixture
+async def redis():
+    async for ri in get_redis('redis://localhost:6379/0'):
+        yield ri
+
+
+def test_ttl_cache_evicts_least_recently_used():
+    cache = TTLCache(maxsize=2, ttl=60)
+    cache.set(1, 'a')
+    cache.set(2, 'b')
+    cache.get(1)  # 1을 최근 사용으로 갱신
+    cache.set(3, 'c')
+
+    assert cache.get(1) == 'a'
+    assert cache.get(2) is None, "가장 오래 사용되지 않은 항목이 제거되지 않았습니다."
+    assert cache.get(3) == 'c'
+
+
+def test_ttl_cache_expires():
+    cache = TTLCache(maxsize=2, ttl=0.01)
+    cache.set(1, 'a')
+    time.sleep(0.02)
+
+    assert cache.get(1) is None, "만료된 항목이 조회되었습니다."
+
+
+def test_inference_result_key():
+    options = InferenceOptions().to_dict()
+    key = inference_result_key("digest", "model", "deploy_a", options)
+
+    assert key == inference_result_key("digest", "model", "deploy_a", dict(reversed(list(options.items()))))
+    assert key != inference_result_key("digest", "model", "deploy_b", options), "배포된 모델 파일이 키에 반영되지 않았습니다."
+    assert key != inference_result_key("digest", "model", "deploy_a", InferenceOptions(conf_threshold=0.5).to_dict())
+
+
+@pytest.mark.asyncio
+async def test_model_meta_cache_read_through(redis):
+    cache = ModelMetaCache(maxsize=10, ttl=60)
+    calls = []
+
+    async def loader(model_id):
+        calls.append(model_id)
+        return {"id": model_id, "model_name": "cached_model"}
+
+    await cache.invalidate(redis, -1)
+    assert await cache.get(redis, -1, loader) == {"id": -1, "model_name": "cached_model"}
+    assert await cache.get(redis, -1, loader) == {"id": -1, "model_name": "cached_model"}
+    assert calls == [-1], "캐시된 메타데이터를 다시 로드했습니다."
+
+    await cache.invalidate(redis, -1)
+    await cache.get(redis, -1, loader)
+    assert calls == [-1, -1], "무효화 이후 메타데이터를 다시 로드하지 않았습니다."
+
+    await cache.invalidate(redis, -1)
@@ -1,6 +1,9 @@
 import pytest
 import pytest_asyncio
-from app.database import get_redis
+from sqlalchemy import inspect, text
+from app.database import Base, get_redis, async_engine, session_factory
+from app.entity import upgrade_schema
+from app.util import transactional
 
 
 
@@ -20,4 +23,111 @@ async def test_get_redis(redis):
 
     await redis.delete('test_key')
 
-    assert await redis.exists('test_key') == 0
\ No newline at end of file
+    assert await redis.exists('test_key') == 0
+
+
+# 기존 테이블에 추가된 컬럼 (SCHEMA_UPGRADES로 추가되어야 함)
+ADDED_COLUMNS = [
+    ("file_meta", "digest"),
+    ("ai_model", "deploy_digest"),
+    ("inference_files", "detections_file_id"),
+    ("ai_model", "run_dir"),
+    ("ai_model", "checkpoint_path"),
+]
+
+
+def get_columns(conn, table_name):
+    return {column['name'] for column in inspect(conn).get_columns(table_name)}
+
+
+@pytest.mark.asyncio
+async def test_upgrade_schema_adds_missing_columns():
+    # create_all 이전 버전 스키마를 흉내내기 위해 컬럼을 지운 뒤 복구 (트랜잭션은 롤백)
+    async with async_engine.connect() as conn:
+        await conn.begin()
+        try:
+            for table_name, column_name in ADDED_COLUMNS:
+                await conn.execute(text(f"ALTER TABLE {table_name} DROP COLUMN {column_name} CASCADE"))
+                assert column_name not in await conn.run_sync(get_columns, table_name)
+
+            await conn.run_sync(upgrade_schema)
+            await conn.run_sync(upgrade_schema)  # 여러 번 실행해도 안전
+
+            for table_name, column_name in ADDED_COLUMNS:
+                assert column_name in await conn.run_sync(get_columns, table_name), f"{table_name}.{column_name}이 추가되지 않았습니다."
+        finally:
+            await conn.rollback()
+
+    await async_engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_create_all_adds_missing_tables():
+    # 새로 추가된 테이블은 기존 데이터베이스에서도 create_all로 생성됨 (트랜잭션은 롤백)
+    async with async_engine.connect() as conn:
+        await conn.begin()
+        try:
+            await conn.execute(text("DROP TABLE training_profile"))
+
+            await conn.run_sync(Base.metadata.create_all)
+            await conn.run_sync(upgrade_schema)
+
+            assert await conn.run_sync(lambda sync_conn: inspect(sync_conn).has_table("training_profile"))
+        finally:
+            await conn.rollback()
+
+    await async_engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_after_commit_runs_only_after_commit():
+    calls = []
+
+    async def callback():
+        calls.append("called")
+
+    async with session_factory() as session:
+        await session.begin()
+        session.after_commit(callback)
+        assert calls == [], "커밋 전에 실행되었습니다."
+
+        await session.commit()
+        assert calls == ["called"]
+
+        # 롤백되면 등록된 작업은 버려짐
+        await session.begin()
+        session.after_commit(callback)
+        await session.rollback()
+        await session.commit()
+        assert calls == ["called"], "롤백된 트랜잭션의 작업이 실행되었습니다."
+
+
+@pytest.mark.asyncio
+async def test_after_commit_failure_does_not_raise():
+    async def broken():
+        raise ConnectionError()
+
+    async with session_factory() as session:
+        await session.begin()
+        session.after_commit(broken)
+        await session.commit()  # 커밋은 이미 완료되었으므로 예외를 올리지 않음
+
+
+@pytest.mark.asyncio
+async def test_transactional_runs_after_commit_callbacks():
+    calls = []
+
+    class Service:
+        def __init__(self, session):
+            self.session = session
+
+        @transactional
+        async def write(self):
+            async def callback():
+                calls.append(self.session.in_transaction())
+            self.session.after_commit(callback)
+
+    async with session_factory() as session:
+        await Service(session).write()
+
+    assert calls == [False], "커밋된 뒤에 실행되어야 합니다."
@@ -0,0 +1,141 @@
+import time
+import redis
+from types import SimpleNamespace
+from prometheus_client import REGISTRY, generate_latest
+from sqlalchemy import create_engine
+from sqlalchemy.pool import QueuePool
+from app.metrics import (time_stage, timed_iter, time_triton, PoolCollector,
+                         redis_pool_stats, sqlalchemy_pool_stats, register_redis_pool, pool_collector)
+from app.tasks.task_metrics import (PUBLISHED_AT_HEADER, on_before_task_publish, published_at, result_state,
+                                    on_task_prerun, on_task_postrun, task_queue)
+
+
+def sample(name, **labels):
+    return REGISTRY.get_sample_value(name, labels) or 0
+
+
+def test_time_stage_records_duration():
+    before = sample("watchml_inference_stage_duration_seconds_count", stage="test_stage")
+
+    with time_stage("test_stage"):
+        pass
+
+    assert sample("watchml_inference_stage_duration_seconds_count", stage="test_stage") == before + 1
+
+
+def test_time_stage_records_on_exception():
+    before = sample("watchml_inference_stage_duration_seconds_count", stage="test_error")
+
+    try:
+        with time_stage("test_error"):
+            raise ValueError()
+    except ValueError:
+        pass
+
+    assert sample("watchml_inference_stage_duration_seconds_count", stage="test_error") == before + 1
+
+
+def test_timed_iter_records_each_item():
+    before = sample("watchml_inference_stage_duration_seconds_count", stage="test_decode")
+
+    assert list(timed_iter(iter([1, 2, 3]), "test_decode")) == [1, 2, 3]
+    # 마지막(StopIteration) 조회까지 기록
+    assert sample("watchml_inference_stage_duration_seconds_count", stage="test_decode") == before + 4
+
+
+def test_time_triton():
+    with time_triton("test_model", "infer"):
+        pass
+
+    assert sample("watchml_triton_request_duration_seconds_count", model="test_model", operation="infer") >= 1
+
+
+def test_sqlalchemy_pool_stats():
+    engine = create_engine("sqlite://", poolclass=QueuePool, pool_size=3)
+    with engine.connect():
+        stats = sqlalchemy_pool_stats(engine)
+
+    assert stats == {"size": 3, "checked_out": 1, "checked_in": 0, "overflow": 0}
+    engine.dispose()
+
+
+def test_redis_pool_stats():
+    pool = redis.ConnectionPool.from_url("redis://localhost:6379/0", max_connections=7)
+    assert redis_pool_stats(pool) == {"max": 7, "in_use": 0, "available": 0}
+
+    # 서버 없이 연결 상태만 흉내
+    pool._in_use_connections.add(object())
+    pool._available_connections.extend([object(), object()])
+    assert redis_pool_stats(pool) == {"max": 7, "in_use": 1, "available": 2}
+
+
+def test_pool_collector_groups_by_kind():
+    collector = PoolCollector()
+    collector.register("db", "api", lambda: {"size": 5, "checked_out": 2})
+    collector.register("db", "worker", lambda: {"size": 5, "checked_out": 0})
+    collector.register("redis", "broken", lambda: 1 / 0)  # 실패한 풀은 건너뜀
+
+    families = {family.name: family for family in collector.collect()}
+
+    assert set(families) == {"watchml_db_pool_connections", "watchml_redis_pool_connections"}
+    samples = {(s.labels["pool"], s.labels["state"]): s.value for s in families["watchml_db_pool_connections"].samples}
+    assert samples == {("api", "size"): 5, ("api", "checked_out"): 2, ("worker", "size"): 5, ("worker", "checked_out"): 0}
+    assert families["watchml_redis_pool_connections"].samples == []
+
+    collector.unregister("db", "api")
+    assert ("db", "api") not in collector.pools
+
+
+def test_generate_latest_includes_registered_pools():
+    register_redis_pool("test_pool", redis.ConnectionPool.from_url("redis://localhost:6379/0", max_connections=3))
+    try:
+        output = generate_latest().decode()
+    finally:
+        pool_collector.unregister("redis", "test_pool")
+
+    assert 'watchml_redis_pool_connections{pool="test_pool",state="max"} 3.0' in output
+    assert "watchml_inference_stage_duration_seconds" in output
+    assert "watchml_celery_task_duration_seconds" in output
+
+
+def make_task(name="app.tasks.main.test_task", queue="io", **request):
+    return SimpleNamespace(name=name, request=SimpleNamespace(delivery_info={"routing_key": queue}, **request))
+
+
+def test_before_task_publish_sets_header():
+    headers = {}
+    on_before_task_publish(headers=headers)
+
+    assert isinstance(headers[PUBLISHED_AT_HEADER], float)
+
+
+def test_published_at_reads_attribute_or_headers():
+    assert published_at(SimpleNamespace(published_at=1.0)) == 1.0
+    assert published_at(SimpleNamespace(headers={PUBLISHED_AT_HEADER: 2.0})) == 2.0
+    assert published_at(SimpleNamespace(headers=None)) is None
+
+
+def test_task_queue():
+    assert task_queue(make_task(queue="train")) == "train"
+    assert task_queue(SimpleNamespace(request=SimpleNamespace(delivery_info=None))) == "unknown"
+
+
+def test_result_state():
+    assert result_state("SUCCESS", True) == "success"
+    assert result_state("SUCCESS", None) == "success"
+    assert result_state("SUCCESS", False) == "failure"  # 실패를 False 반환으로 알리는 task
+    assert result_state("RETRY", None) == "retry"
+    assert result_state("FAILURE", None) == "failure"
+
+
+def test_task_signals_record_duration_wait_and_result():
+    name, queue = "app.tasks.main.metrics_test_task", "io"
+    task = make_task(name, queue, published_at=time.time() - 5)
+
+    on_task_prerun(task_id="task-1", task=task)
+    on_task_postrun(task_id="task-1", task=task, retval=False, state="SUCCESS")
+
+    assert sample("watchml_celery_task_duration_seconds_count", task=name, queue=queue) == 1
+    assert sample("watchml_celery_task_queue_wait_seconds_count", task=name, queue=queue) == 1
+    assert sample("watchml_celery_task_queue_wait_seconds_sum", task=name, queue=queue) >= 5
+    assert sample("watchml_celery_task_results_total", task=name, state="failure") == 1
@@ -3,8 +3,11 @@ import pytest
 import tempfile
 import pytest_asyncio
 from fastapi import UploadFile
+from sqlalchemy import select
 from app.database import get_redis, get_session, async_engine
-from app.services.dataset_service import DataSetService
+from app.services.dataset_service import DataSetService, COUNT_CACHE_NAME
+from app.cache import invalidate_count
+from app.entity import Blob
 
 
 @pytest_asyncio.fixture
@@ -55,14 +58,43 @@ async def test_upload_file(dataset_service: DataSetService, temp_directory, temp
 
         await dataset_service.upload_file(upload_file)
 
-    uploaded_file_path = os.path.join(temp_directory, "temp_test_file.txt")
-    assert os.path.exists(uploaded_file_path)  # 파일 존재 여부
-
     file_list = await dataset_service.get_file_list()
     file_names = [file['file_name'] for file in file_list]
 
     assert "temp_test_file.txt" in file_names, "데이터베이스에 등록 되지않았습니다."
 
+    uploaded_file = next(file for file in file_list if file['file_name'] == "temp_test_file.txt")
+    uploaded_file_path = uploaded_file['file_meta']['filepath']
+    assert os.path.exists(uploaded_file_path)  # 파일 존재 여부
+    assert uploaded_file_path.startswith(os.path.join(temp_directory, "blobs")), "blob 경로에 저장되지 않았습니다."
+
+
+@pytest.mark.asyncio
+async def test_upload_file_deduplicated(dataset_service: DataSetService, temp_directory):
+    file_names = ["same1.txt", "same2.txt"]
+    for file_name in file_names:
+        temp_file_path = os.path.join(temp_directory, file_name)
+
+        with open(temp_file_path, "w") as f:
+            f.write("same content")
+
+        with open(temp_file_path, "rb") as temp_file_for_upload:
+            upload_file = UploadFile(filename=file_name, file=temp_file_for_upload)
+            await dataset_service.upload_file(upload_file)
+
+    file_list = await dataset_service.get_file_list()
+    file_metas = [file['file_meta'] for file in file_list if file['file_name'] in file_names]
+
+    assert len(file_metas) == 2
+    assert file_metas[0]['id'] != file_metas[1]['id'], "업로드마다 FileMeta가 생성되지 않았습니다."
+    assert file_metas[0]['filepath'] == file_metas[1]['filepath'], "같은 내용의 파일이 중복 저장되었습니다."
+    assert file_metas[0]['digest'] is not None
+
+    result = await dataset_service.session.execute(select(Blob).filter(Blob.digest == file_metas[0]['digest']))
+    blob = result.scalar_one()
+    assert blob.filepath == file_metas[0]['filepath']
+    assert blob.ref_count == 2, "blob 참조 수가 FileMeta 수와 다릅니다."
+
 
 
 @pytest.mark.asyncio
@@ -144,3 +176,52 @@ async def test_get_file_status(dataset_service: DataSetService, temp_directory):
         file_status = next((file for file in file_status_list if file['file_name'] == file_name), None)
         assert file_status is not None, f"{file_name}의 상태가 조회되지 않습니다."
         assert file_status["status"] == status, f"{file_name}의 상태가 {status}로 업데이트되지 않았습니다."
+
+
+@pytest.mark.asyncio
+async def test_delete_files(dataset_service: DataSetService, temp_directory):
+    file_names = ["file1.txt", "file2.txt", "file3.txt"]
+    dataset_ids = []
+    for file_name in file_names:
+        temp_file_path = os.path.join(temp_directory, file_name)
+
+        with open(temp_file_path, "w") as f:
+            f.write("test content")
+
+        with open(temp_file_path, "rb") as temp_file_for_upload:
+            upload_file = UploadFile(filename=file_name, file=temp_file_for_upload)
+            dataset = await dataset_service.upload_file(upload_file)
+            dataset_ids.append(dataset['id'])
+
+    count = await dataset_service.delete_files(dataset_ids[:2])
+
+    file_list = await dataset_service.get_file_list()
+    listed_names = [file['file_name'] for file in file_list]
+
+    assert count == 2, f"Expected 2 deleted rows, got {count}."
+    assert "file1.txt" not in listed_names and "file2.txt" not in listed_names, "삭제된 파일이 목록에 표시됩니다."
+    assert "file3.txt" in listed_names, "삭제되지 않은 파일이 목록에 없습니다."
+
+
+@pytest.mark.asyncio
+async def test_get_file_list_with_fields(dataset_service: DataSetService, temp_directory):
+    file_names = ["file1.txt", "file2.txt", "file3.txt"]
+    for file_name in file_names:
+        temp_file_path = os.path.join(temp_directory, file_name)
+
+        with open(temp_file_path, "w") as f:
+            f.write("test content")
+
+        with open(temp_file_path, "rb") as temp_file_for_upload:
+            upload_file = UploadFile(filename=file_name, file=temp_file_for_upload)
+            await dataset_service.upload_file(upload_file)
+
+    file_list = await dataset_service.get_file_list(limit=2, fields=["file_name", "status"])
+
+    assert len(file_list) == 2, "limit 만큼의 파일만 조회되어야 합니다."
+    assert all(set(file.keys()) == {"id", "file_name", "status"} for file in file_list), "요청하지 않은 필드가 포함되었습니다."
+
+    next_list = await dataset_service.get_file_list(last_id=file_list[-1]['id'], limit=2, fields=["file_name"])
+    assert all(file['id'] < file_list[-1]['id'] for file in next_list), "커서 이후의 파일만 조회되어야 합니다."
+    await invalidate_count(dataset_service.redis, COUNT_CACHE_NAME)  # 테스트 트랜잭션은 커밋되지 않아 직접 무효화
+    assert await dataset_service.get_file_count() >= len(file_names)
@@ -55,16 +55,22 @@ async def test_upload_file(inference_service: InferenceService, temp_directory,
     with open(temp_file_in_directory, "rb") as temp_file_for_upload:
         upload_file = UploadFile(filename=temp_file_name, file=temp_file_for_upload)
 
-        await inference_service.upload_file(upload_file)
-
-    uploaded_file_path = os.path.join(temp_directory, temp_file_name)
-    assert os.path.exists(uploaded_file_path)  # 파일 존재 여부
+        inference_file = await inference_service.upload_file(upload_file)
 
     file_list = await inference_service.get_file_list()
     file_names = [file['original_file_name'] for file in file_list]
 
     assert temp_file_name in file_names, "데이터베이스에 등록 되지않았습니다."
 
+    uploaded_file = await inference_service.get_file_by_id(inference_file['id'])
+    uploaded_file_path = uploaded_file['original_file']['filepath']
+    assert os.path.exists(uploaded_file_path)  # 파일 존재 여부
+
+    # 다운로드 시에는 blob 경로가 아닌 업로드 파일명을 사용
+    file_path, file_name = await inference_service.get_download_file(uploaded_file['original_file']['id'])
+    assert file_path == uploaded_file_path
+    assert file_name == temp_file_name
+
 
 @pytest.mark.asyncio
 async def test_update_generated_file(inference_service: InferenceService, temp_directory, temp_file_in_directory):
@@ -78,8 +84,8 @@ async def test_update_generated_file(inference_service: InferenceService, temp_d
     with open(generated_file_path, "wb") as generated_file:
         generated_file.write(b'test file')
 
-    uploaded_file_path = os.path.join(temp_directory, temp_file_name)
-    assert os.path.exists(uploaded_file_path)  # 파일 존재 여부
+    uploaded_file = await inference_service.get_file_by_id(inference_file['id'])
+    assert os.path.exists(uploaded_file['original_file']['filepath'])  # 파일 존재 여부
     inference_file = await inference_service.update_generated_file(inference_file['id'], generated_file_path)
     inference_file = await inference_service.get_file_by_id(inference_file['id'])
 
@@ -165,3 +171,29 @@ async def test_get_file_status(inference_service: InferenceService, temp_directo
         file_status = next((file for file in file_status_list if file['original_file_name'] == file_name), None)
         assert file_status is not None, f"{file_name}의 상태가 조회되지 않습니다."
         assert file_status["status"] == status, f"{file_name}의 상태가 {status}로 업데이트되지 않았습니다."
+
+
+@pytest.mark.asyncio
+async def test_update_statuses(inference_service: InferenceService, temp_directory):
+    file_names = ["file1.jpg", "file2.jpg"]
+    inference_file_ids = []
+
+    for file_name in file_names:
+        temp_file_path = os.path.join(temp_directory, file_name)
+
+        with open(temp_file_path, "w") as f:
+            f.write("test content")
+
+        with open(temp_file_path, "rb") as temp_file_for_upload:
+            upload_file = UploadFile(filename=file_name, file=temp_file_for_upload)
+            inference_file = await inference_service.upload_file(upload_file)
+            inference_file_ids.append(inference_file['id'])
+
+    count = await inference_service.update_statuses(inference_file_ids, "failed")
+    file_status_list = await inference_service.get_file_status()
+
+    assert count == len(file_names), f"Expected {len(file_names)} updated rows, got {count}."
+    for file_name in file_names:
+        file_status = next((file for file in file_status_list if file['original_file_name'] == file_name), None)
+        assert file_status is not None, f"{file_name}의 상태가 조회되지 않습니다."
+        assert file_status["status"] == "failed", f"{file_name}의 상태가 failed로 업데이트되지 않았습니다."
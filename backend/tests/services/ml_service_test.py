@@ -4,6 +4,8 @@ import pytest_asyncio
 from app.database import get_redis
 from app.services.ml_service import MlService, AiModelDTO
 from app.exceptions import ForbiddenException
+from app.cache import inference_result_key
+from app.dto import InferenceOptions
 from app.database import get_session, async_engine
 import tempfile
 
@@ -260,3 +262,63 @@ async def test_update_status(ml_service: MlService):
 
     assert updated_model is not None, "Updated model is not found in the list."
     assert updated_model["status"] == "running", "Model status was not updated to 'running'."
+
+
+@pytest.mark.asyncio
+async def test_deploy_model(ml_service: MlService, temp_model: str, temp_directory):
+    model_path, model_name = temp_model
+    deploy_path = os.path.join(temp_directory, "model.onnx")
+    with open(deploy_path, "wb") as f:
+        f.write(b"dummy onnx content")
+
+    model_id = await ml_service.register_model(AiModelDTO(
+        model_name=model_name,
+        model_path=model_path
+    ))
+    deployed_model_name = await ml_service.deploy_model(model_id, deploy_path, status='complete')
+    model = await ml_service.get_model_by_id(model_id)
+
+    assert deployed_model_name == model_name
+    assert model["is_deploy"] is True, "Model was not deployed."
+    assert model["deploy_file"]["filepath"] == deploy_path, f"Expected {deploy_path}, got {model['deploy_file']}."
+    assert model["status"] == "complete", "Model status was not updated to 'complete'."
+
+    await ml_service.undeploy_model(model_id, status='complete')
+    model = await ml_service.get_model_by_id(model_id)
+
+    assert model["is_deploy"] is False, "Model was not undeployed."
+    assert model["deploy_file"] is None, "Deploy file was not cleared."
+
+
+@pytest.mark.asyncio
+async def test_retrain_then_deploy_changes_inference_cache_key(ml_service: MlService, temp_model: str, temp_directory):
+    model_path, model_name = temp_model
+    deploy_path = os.path.join(temp_directory, "model.onnx")  # 재배포 시 같은 경로를 덮어씀
+    options = InferenceOptions().to_dict()
+
+    # 테스트 트랜잭션은 커밋되지 않아 캐시가 무효화되지 않으므로, 무효화 후 캐시가 다시 읽을 값을 직접 조회
+    def cache_key(model_meta):
+        deployment = model_meta['deploy_digest'] if model_meta['is_deploy'] else None
+        return inference_result_key("input_digest", model_name, deployment, options) if deployment else None
+
+    with open(deploy_path, "wb") as f:
+        f.write(b"weights v1")
+    model_id = await ml_service.register_model(AiModelDTO(model_name=model_name, model_path=model_path))
+    await ml_service.deploy_model(model_id, deploy_path, status='complete')
+    deployed_key = cache_key(await ml_service._load_model_meta(model_id))
+    assert deployed_key is not None
+
+    # 재학습 등록: DB 버전은 올라가지만 Triton은 아직 이전 가중치를 서빙하므로 캐시하지 않음
+    await ml_service.init_model(model_name)
+    model = await ml_service._load_model_meta(model_id)
+    assert model['version'] == 2
+    assert cache_key(model) is None, "재학습 중인 모델의 추론 결과가 캐싱됩니다."
+
+    # 새 가중치 배포 후에는 이전 배포와 다른 키
+    with open(deploy_path, "wb") as f:
+        f.write(b"weights v2")
+    await ml_service.deploy_model(model_id, deploy_path, status='complete')
+    redeployed_key = cache_key(await ml_service._load_model_meta(model_id))
+
+    assert redeployed_key is not None
+    assert redeployed_key != deployed_key, "다시 배포된 모델이 이전 배포의 추론 결과 캐시를 사용합니다."
@@ -0,0 +1,60 @@
+import os
+import pytest
+from app.tasks.cancel import CancelToken, TaskCancelled, cancel_key, remove_on_cancel, INFERENCE
+
+
+class FlagRedis:
+    def __init__(self):
+        self.keys = set()
+        self.checks = 0
+
+    def exists(self, key):
+        self.checks += 1
+        return int(key in self.keys)
+
+
+def test_cancel_token_throttles_checks():
+    now = [0.0]
+    redis = FlagRedis()
+    token = CancelToken(redis, cancel_key(INFERENCE, 1), interval=1.0, clock=lambda: now[0])
+
+    for _ in range(10):
+        now[0] += 0.25
+        token.check()
+
+    assert redis.checks == 3, "취소 플래그가 주기마다 한 번씩 조회되지 않았습니다."
+
+
+def test_cancel_token_raises_when_flag_is_set():
+    redis = FlagRedis()
+    token = CancelToken(redis, cancel_key(INFERENCE, 1), interval=0)
+
+    token.check()
+    redis.keys.add(cancel_key(INFERENCE, 1))
+
+    with pytest.raises(TaskCancelled):
+        token.check()
+
+
+def test_remove_on_cancel_deletes_partial_output(tmp_path):
+    output_path = str(tmp_path / "detection_sample.mp4")
+
+    with pytest.raises(TaskCancelled):
+        with remove_on_cancel(output_path):
+            with open(output_path, 'wb') as f:
+                f.write(b"partial")
+            raise TaskCancelled(cancel_key(INFERENCE, 1))
+
+    assert not os.path.exists(output_path), "취소된 추론의 부분 결과 파일이 남아 있습니다."
+
+
+def test_remove_on_cancel_keeps_output_on_other_errors(tmp_path):
+    output_path = str(tmp_path / "detection_sample.mp4")
+
+    with pytest.raises(ValueError):
+        with remove_on_cancel(output_path):
+            with open(output_path, 'wb') as f:
+                f.write(b"partial")
+            raise ValueError("decode error")
+
+    assert os.path.exists(output_path)
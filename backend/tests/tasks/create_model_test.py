@@ -0,0 +1,84 @@
+import os
+import zipfile
+import asyncio
+import functools
+import yaml
+import pytest
+from kombu.utils.json import dumps
+from app.tasks import main
+from app.tasks.train.merge_archive import merge_archive_files, load_merged_classes
+
+
+class FakeRedis:
+    async def exists(self, *keys):
+        return 0
+
+
+class FakeSession:
+    async def commit(self):
+        pass
+
+
+class FakeMlService:
+    def __init__(self):
+        self.redis = FakeRedis()
+        self.session = FakeSession()
+        self.statuses = []
+        self.training_runs = []
+
+    async def get_model_by_name(self, model_name):
+        return {"id": 1, "status": "pending", "run_dir": None}
+
+    async def update_status(self, model_id, status):
+        self.statuses.append(status)
+
+    async def update_training_run(self, model_id, **fields):
+        self.training_runs.append(fields)
+
+
+@pytest.fixture
+def dataset_zip(tmp_path):
+    path = str(tmp_path / "dataset.zip")
+    with zipfile.ZipFile(path, 'w') as zipf:
+        zipf.writestr('data.yaml', yaml.dump({'train': 'images/train', 'val': 'images/val', 'test': 'images/test',
+                                              'names': ['truck', 'bus', 'car'], 'nc': 3}))
+        for split, label in (('train', '0'), ('val', '1'), ('test', '2')):
+            zipf.writestr(f'images/{split}/image.jpg', 'image')
+            zipf.writestr(f'labels/{split}/image.txt', f'{label} 0.5 0.5 1 1')
+    return path
+
+
+@pytest.fixture
+def dispatched(monkeypatch, tmp_path):
+    calls = []
+    monkeypatch.setattr(main, "CELERY_ML_RUNS_PATH", str(tmp_path / "runs"))
+    monkeypatch.setattr(main, "TRAIN_IMAGE_CACHE_ENABLED", False)
+    monkeypatch.setattr(main, "merge_archive_files",
+                        functools.partial(merge_archive_files, extract_cache_dir=str(tmp_path / "extract_cache")))
+    monkeypatch.setattr(main.train_model_task, "delay", lambda *args: calls.append(args))
+    return calls
+
+
+def test_create_model_dispatches_json_serializable_args(dataset_zip, dispatched):
+    ml_service = FakeMlService()
+
+    assert asyncio.run(main.create_model(ml_service, "test_model", "pt", 1, [dataset_zip], {"epochs": 1}))
+
+    args, = dispatched
+    dumps(args)  # Celery json 직렬화 (set이면 TypeError)
+    output_dir, total_classes = args[3], args[4]
+    assert total_classes == load_merged_classes(output_dir), "data.yaml과 클래스 순서가 다릅니다."
+    assert ml_service.statuses == ["running"]
+
+
+def test_create_model_marks_failed_when_dispatch_fails(dataset_zip, dispatched, monkeypatch):
+    def fail(*args):
+        raise TypeError("not serializable")
+
+    monkeypatch.setattr(main.train_model_task, "delay", fail)
+    ml_service = FakeMlService()
+
+    assert not asyncio.run(main.create_model(ml_service, "test_model", "pt", 1, [dataset_zip]))
+    assert ml_service.statuses == ["running", "failed"], "실패한 학습이 running 상태로 남았습니다."
+    assert ml_service.training_runs[-1] == {}, "실행 정보가 초기화되지 않았습니다."
+    assert not os.path.exists(main.get_run_dir("test_model", 1))
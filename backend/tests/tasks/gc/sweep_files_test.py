@@ -0,0 +1,52 @@
+import os
+import time
+import pytest
+from app.tasks.gc.sweep_files import unlink_files, iter_file_chunks
+
+
+@pytest.fixture
+def sample_files(tmpdir):
+    file_paths = []
+    for i in range(5):
+        sub_dir = tmpdir.mkdir(f"dir_{i}")
+        file_path = sub_dir.join(f"file_{i}.txt")
+        file_path.write("content")
+        file_paths.append(str(file_path))
+    return file_paths
+
+
+def test_unlink_files(sample_files):
+    missing_file = sample_files[0] + ".missing"
+
+    removed = unlink_files(sample_files + [missing_file], max_workers=4)
+
+    assert removed == len(sample_files)
+    assert not any(os.path.exists(file_path) for file_path in sample_files)
+
+
+def test_unlink_files_empty():
+    assert unlink_files([]) == 0
+
+
+def test_iter_file_chunks(tmpdir, sample_files):
+    chunks = list(iter_file_chunks([str(tmpdir)], chunk_size=2))
+
+    assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+    assert sorted(file_path for chunk in chunks for file_path in chunk) == sorted(sample_files)
+
+
+def test_iter_file_chunks_skips_recent_files(tmpdir, sample_files):
+    old_time = time.time() - 7200
+    os.utime(sample_files[0], (old_time, old_time))
+
+    chunks = list(iter_file_chunks([str(tmpdir), "/not/exists"], chunk_size=10, older_than=3600))
+
+    assert chunks == [[sample_files[0]]], "최근에 수정된 파일이 정리 대상에 포함되었습니다."
+
+
+def test_iter_file_chunks_excludes_directories(tmpdir, sample_files):
+    excluded = os.path.dirname(sample_files[0])
+
+    chunks = list(iter_file_chunks([str(tmpdir)], chunk_size=10, exclude=[excluded]))
+
+    assert sorted(chunks[0]) == sorted(sample_files[1:]), "제외 디렉터리의 파일이 포함되었습니다."
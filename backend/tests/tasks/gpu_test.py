@@ -0,0 +1,121 @@
+from app.tasks.gpu import GpuScheduler, TRAIN_POOL, INFERENCE_POOL, parse_devices, discover_devices, pool_devices
+from app.tasks.deploy.deploy_ml_model import triton_instance_group
+
+
+class LeaseRedis:
+    """GpuScheduler가 사용하는 명령만 구현한 메모리 Redis (TTL은 기록만 함)"""
+
+    def __init__(self):
+        self.values = {}
+        self.ttls = {}
+
+    def set(self, key, value, nx=False, ex=None):
+        if nx and key in self.values:
+            return None
+        self.values[key] = value
+        self.ttls[key] = ex
+        return True
+
+    def mget(self, keys):
+        return [self.values.get(key) for key in keys]
+
+    def delete(self, *keys):
+        for key in keys:
+            self.values.pop(key, None)
+
+    def expire(self, key, ttl):
+        self.ttls[key] = ttl
+
+    def pipeline(self):
+        return self
+
+    def execute(self):
+        return []
+
+
+def make_scheduler(redis, devices, slots=1, host='worker-1'):
+    return GpuScheduler(redis, TRAIN_POOL, devices, slots=slots, ttl=60, host=host)
+
+
+def test_parse_and_discover_devices():
+    assert parse_devices('3, 1,1,') == [1, 3]
+    assert discover_devices('0,1,2,3') == [0, 1, 2, 3]
+
+
+def test_pool_devices_separates_train_from_inference():
+    inventory = [0, 1, 2, 3]
+
+    assert pool_devices(INFERENCE_POOL, inventory, inference_devices='3') == [3]
+    assert pool_devices(TRAIN_POOL, inventory, inference_devices='3') == [0, 1, 2]
+    assert pool_devices(TRAIN_POOL, inventory, train_devices='1,2,7', inference_devices='3') == [1, 2]
+    assert pool_devices(TRAIN_POOL, [0], inference_devices='0') == [0], "장치가 하나뿐이면 추론과 공유해야 합니다."
+    assert pool_devices(TRAIN_POOL, [], inference_devices='') == []
+
+
+def test_acquire_assigns_free_devices():
+    redis = LeaseRedis()
+    scheduler = make_scheduler(redis, [0, 1])
+
+    first = scheduler.acquire('run_a')
+    second = scheduler.acquire('run_b')
+
+    assert (first.device, second.device) == ('0', '1')
+    assert scheduler.acquire('run_c') is None, "모든 GPU가 사용 중인데 임대되었습니다."
+    assert scheduler.occupancy() == {0: ['run_a'], 1: ['run_b']}
+
+    first.release()
+    assert scheduler.acquire('run_c').device == first.device
+
+
+def test_acquire_multiple_devices_is_all_or_nothing():
+    redis = LeaseRedis()
+    scheduler = make_scheduler(redis, [0, 1, 2])
+    single = scheduler.acquire('run_a')
+
+    ddp = scheduler.acquire('run_ddp', count=2)
+    assert (single.device, ddp.device) == ('0', '1,2')
+
+    single.release()
+    assert scheduler.acquire('run_b', count=2) is None
+    assert 'run_b' not in redis.values.values(), "부분 임대가 반환되지 않았습니다."
+    assert scheduler.occupancy() == {0: [], 1: ['run_ddp'], 2: ['run_ddp']}
+
+
+def test_acquire_spreads_jobs_over_slots():
+    redis = LeaseRedis()
+    scheduler = make_scheduler(redis, [0, 1], slots=2)
+
+    devices = [scheduler.acquire(f'run_{i}').device for i in range(4)]
+
+    assert sorted(devices) == ['0', '0', '1', '1']
+    assert scheduler.acquire('run_4') is None
+
+
+def test_leases_are_scoped_by_host():
+    redis = LeaseRedis()
+    make_scheduler(redis, [0], host='worker-1').acquire('run_a')
+
+    assert make_scheduler(redis, [0], host='worker-2').acquire('run_b').device == '0'
+
+
+def test_acquire_without_devices_falls_back_to_cpu():
+    lease = make_scheduler(LeaseRedis(), []).acquire('run_a', count=2)
+    assert lease.device == 'cpu' and lease.keys == []
+    lease.extend()
+    lease.release()
+
+
+def test_lease_extend_refreshes_ttl():
+    redis = LeaseRedis()
+    lease = make_scheduler(redis, [0]).acquire('run_a')
+    redis.ttls[lease.keys[0]] = 1
+
+    lease.extend()
+
+    assert redis.ttls[lease.keys[0]] == 60
+
+
+def test_triton_instance_group():
+    assert triton_instance_group([]) == ""
+    group = triton_instance_group([2, 3], count=2)
+    assert "kind: KIND_GPU" in group and "gpus: [ 2, 3 ]" in group and "count: 2" in group
@@ -0,0 +1,31 @@
+import time
+import threading
+from app.tasks.heartbeat import Heartbeat
+
+
+def test_heartbeat_runs_periodically_until_stopped():
+    beats = threading.Semaphore(0)
+
+    with Heartbeat(0.01, beats.release) as heartbeat:
+        assert beats.acquire(timeout=1) and beats.acquire(timeout=1)
+
+    assert not heartbeat.thread.is_alive()
+
+
+def test_heartbeat_survives_failing_beat():
+    calls = []
+
+    def beat():
+        calls.append(time.monotonic())
+        raise ConnectionError()
+
+    with Heartbeat(0.01, beat):
+        deadline = time.monotonic() + 1
+        while len(calls) < 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+    assert len(calls) >= 2, "예외 후 다음 주기에 다시 실행되어야 합니다."
+
+
+def test_heartbeat_stop_without_start():
+    Heartbeat(10, lambda: None).stop()
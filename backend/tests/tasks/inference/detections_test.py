@@ -0,0 +1,60 @@
+import os
+import pytest
+from app.tasks.inference.detections import DetectionWriter, load_detections
+
+
+CLASSES = ["person", "car"]
+
+
+@pytest.fixture
+def detections_file(tmpdir):
+    writer = DetectionWriter()
+    writer.add(0, [([10, 20, 30, 40], 0.9, 0)])
+    writer.add(1, [])
+    writer.add(30, [([1, 2, 3, 4], 0.5, 1), ([5, 6, 7, 8], 0.7, 0)])
+    return writer.save(os.path.join(str(tmpdir), "detection_video.npz"), CLASSES, fps=30.0, width=640, height=480)
+
+
+def test_load_detections(detections_file):
+    result = load_detections(detections_file)
+
+    assert result["fps"] == 30.0
+    assert (result["width"], result["height"]) == (640, 480)
+    assert result["classes"] == CLASSES
+    assert [detection["frame"] for detection in result["detections"]] == [0, 30, 30]
+    assert result["detections"][0] == {
+        "frame": 0, "time": 0.0, "class_id": 0, "class_name": "person", "score": 0.9, "box": [10.0, 20.0, 30.0, 40.0],
+        "inferred": True, "track_id": None
+    }
+
+
+def test_load_detections_by_time_range(detections_file):
+    result = load_detections(detections_file, start=0.5, end=1.0)
+
+    assert [detection["time"] for detection in result["detections"]] == [1.0, 1.0]
+
+
+def test_load_detections_by_class(detections_file):
+    by_name = load_detections(detections_file, classes=["car"])
+    by_id = load_detections(detections_file, classes=["0"])
+
+    assert [detection["class_name"] for detection in by_name["detections"]] == ["car"]
+    assert [detection["class_name"] for detection in by_id["detections"]] == ["person", "person"]
+
+
+def test_save_empty_detections(tmpdir):
+    path = DetectionWriter().save(os.path.join(str(tmpdir), "detection_photo.npz"), CLASSES, width=10, height=10)
+
+    result = load_detections(path)
+
+    assert result["detections"] == []
+    assert result["fps"] == 0.0
+
+
+def test_save_track_ids(tmpdir):
+    writer = DetectionWriter()
+    writer.add(0, [([0, 0, 1, 1], 0.9, 0), ([5, 5, 1, 1], 0.8, 1)], track_ids=[3, 4])
+
+    path = writer.save(os.path.join(str(tmpdir), "detection_tracked.npz"), CLASSES, fps=30.0)
+
+    assert [detection["track_id"] for detection in load_detections(path)["detections"]] == [3, 4]
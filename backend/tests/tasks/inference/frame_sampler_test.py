@@ -0,0 +1,40 @@
+import numpy as np
+from app.tasks.inference.frame_sampler import FrameSampler, interpolate_detections, iou
+
+
+def _frame(value: int):
+    return np.full((32, 32, 3), value, dtype=np.uint8)
+
+
+def test_stride():
+    sampler = FrameSampler(stride=3)
+
+    inferred = [index for index in range(10) if sampler.should_infer(index, _frame(0))]
+
+    assert inferred == [0, 3, 6, 9]
+
+
+def test_motion_threshold_skips_static_frames():
+    sampler = FrameSampler(stride=1, motion_threshold=0.1, max_stride=5)
+    frames = [_frame(0)] * 4 + [_frame(200)] + [_frame(200)] * 7
+
+    inferred = [index for index, frame in enumerate(frames) if sampler.should_infer(index, frame)]
+
+    # 0: 첫 프레임, 4: 큰 움직임, 9: max_stride 도달
+    assert inferred == [0, 4, 9]
+
+
+def test_interpolate_detections():
+    previous = [([0, 0, 10, 10], 0.8, 0), ([100, 100, 10, 10], 0.6, 1)]
+    following = [([4, 2, 10, 10], 0.4, 0)]
+
+    detections = interpolate_detections(previous, following, 0.5)
+
+    assert detections[0][0] == [2, 1, 10, 10]
+    assert abs(detections[0][1] - 0.6) < 1e-6
+    assert detections[1] == previous[1], "짝이 없는 박스가 유지되지 않았습니다."
+
+
+def test_iou():
+    assert iou([0, 0, 10, 10], [0, 0, 10, 10]) == 1.0
+    assert iou([0, 0, 10, 10], [20, 20, 10, 10]) == 0.0
@@ -0,0 +1,59 @@
+from app.tasks.inference.progress import ProgressReporter, summarize_progress
+
+
+class RecordingPipeline:
+    def __init__(self, calls):
+        self.calls = calls
+
+    def hincrby(self, key, field, amount):
+        self.calls.append(('hincrby', field, amount))
+
+    def hset(self, key, *args, **kwargs):
+        self.calls.append(('hset',))
+
+    def expire(self, key, ttl):
+        pass
+
+    def execute(self):
+        pass
+
+
+class RecordingRedis:
+    def __init__(self):
+        self.calls = []
+
+    def pipeline(self):
+        return RecordingPipeline(self.calls)
+
+
+def test_progress_reporter_throttles_updates():
+    now = [0.0]
+    redis = RecordingRedis()
+    reporter = ProgressReporter(redis, "inference:progress:1", interval=1.0, clock=lambda: now[0])
+
+    reporter.start(100)
+    for _ in range(10):
+        now[0] += 0.25
+        reporter.advance()
+    reporter.flush()
+
+    increments = [call[2] for call in redis.calls if call[0] == 'hincrby']
+    assert increments == [4, 4, 2], "진행률이 주기마다 한 번씩 기록되지 않았습니다."
+
+
+def test_progress_reporter_without_ownership_keeps_total():
+    redis = RecordingRedis()
+    reporter = ProgressReporter(redis, "inference:progress:1", owner=False)
+
+    reporter.start(100)
+
+    assert redis.calls == [], "구간 task가 전체 진행률을 초기화했습니다."
+
+
+def test_summarize_progress():
+    values = {b'done': b'50', b'total': b'200', b'started_at': b'100.0', b'updated_at': b'109.0'}
+
+    progress = summarize_progress(values, now=110.0)
+
+    assert progress == {"done": 50, "total": 200, "percent": 25.0, "fps": 5.0, "eta": 30.0, "updated_at": 109.0}
+    assert summarize_progress({}) is None
@@ -0,0 +1,51 @@
+import os
+from app.tasks.inference.publish import publish_files
+
+
+def write(path, content):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w') as f:
+        f.write(content)
+
+
+def read(path):
+    with open(path) as f:
+        return f.read()
+
+
+def test_publish_files_moves_results(tmp_path):
+    work_dir, result_dir = tmp_path / "staging" / "job", tmp_path / "results" / "key"
+    paths = [str(work_dir / "detection_a.mp4"), str(work_dir / "detection_a.npz")]
+    for path in paths:
+        write(path, os.path.basename(path))
+
+    published = publish_files(paths, str(result_dir))
+
+    assert published == [str(result_dir / "detection_a.mp4"), str(result_dir / "detection_a.npz")]
+    assert [read(path) for path in published] == ["detection_a.mp4", "detection_a.npz"]
+    assert not any(os.path.exists(path) for path in paths), "작업 파일이 남아 있습니다."
+    assert sorted(os.listdir(result_dir)) == ["detection_a.mp4", "detection_a.npz"], "임시 파일이 남아 있습니다."
+
+
+def test_publish_files_replaces_existing_result(tmp_path):
+    result_dir = tmp_path / "results"
+    write(str(result_dir / "detection_a.mp4"), "old")
+    with open(result_dir / "detection_a.mp4") as reader:  # 이미 열려 있는 결과 파일은 계속 읽을 수 있어야 함
+        write(str(tmp_path / "job" / "detection_a.mp4"), "new")
+        publish_files([str(tmp_path / "job" / "detection_a.mp4")], str(result_dir))
+
+        assert reader.read() == "old"
+    assert read(str(result_dir / "detection_a.mp4")) == "new"
+
+
+def test_cancelled_job_leaves_published_results(tmp_path):
+    # 같은 캐시 키의 다른 작업이 취소되어 작업 디렉터리를 지워도 게시된 결과는 남아 있어야 함
+    result_dir = tmp_path / "results"
+    first_job, second_job = tmp_path / "staging" / "1", tmp_path / "staging" / "2"
+    write(str(first_job / "detection_a.mp4"), "done")
+    published, = publish_files([str(first_job / "detection_a.mp4")], str(result_dir))
+
+    write(str(second_job / "detection_a.mp4"), "partial")
+    os.remove(str(second_job / "detection_a.mp4"))  # remove_on_cancel
+
+    assert read(published) == "done"
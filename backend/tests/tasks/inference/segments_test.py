@@ -0,0 +1,51 @@
+import os
+import shutil
+import pytest
+from app.tasks.inference.detections import DetectionWriter, load_detections
+from app.tasks.inference.segments import merge_detections, split_video, concat_videos, get_duration
+
+
+CLASSES = ["person", "car"]
+
+
+def _save_segment(path, detections, track_ids, frame_count):
+    writer = DetectionWriter()
+    for (frame_index, detection), track_id in zip(detections, track_ids):
+        writer.add(frame_index, [detection], track_ids=[track_id] if track_id is not None else None)
+    return writer.save(path, CLASSES, fps=10.0, width=64, height=48, frame_count=frame_count)
+
+
+def test_merge_detections(tmpdir):
+    first = _save_segment(os.path.join(str(tmpdir), "first.npz"), [(0, ([0, 0, 1, 1], 0.9, 0)), (9, ([1, 1, 1, 1], 0.8, 1))], [1, 2], 10)
+    second = _save_segment(os.path.join(str(tmpdir), "second.npz"), [(0, ([2, 2, 1, 1], 0.7, 0))], [1], 5)
+
+    merged = merge_detections([first, second], os.path.join(str(tmpdir), "merged.npz"))
+    result = load_detections(merged)
+
+    assert result["frame_count"] == 15
+    assert [detection["frame"] for detection in result["detections"]] == [0, 9, 10]
+    assert [detection["track_id"] for detection in result["detections"]] == [1, 2, 3], "트랙 ID가 구간 간에 겹칩니다."
+    assert result["detections"][2]["time"] == 1.0
+
+
+@pytest.mark.skipif(shutil.which("ffmpeg") is None, reason="ffmpeg is not installed")
+def test_split_and_concat(tmpdir):
+    av = pytest.importorskip("av")
+    import numpy as np
+
+    source = os.path.join(str(tmpdir), "source.mp4")
+    with av.open(source, mode='w') as container:
+        stream = container.add_stream('libx264', rate=10, options={'g': '10'})  # 1초마다 키프레임
+        stream.width, stream.height, stream.pix_fmt = 64, 48, 'yuv420p'
+        for i in range(40):
+            frame = av.VideoFrame.from_ndarray(np.full((48, 64, 3), i, dtype=np.uint8), format='bgr24')
+            for packet in stream.encode(frame):
+                container.mux(packet)
+        for packet in stream.encode():
+            container.mux(packet)
+
+    segments = split_video(source, os.path.join(str(tmpdir), "segments"), segment_seconds=1)
+    assert len(segments) >= 2
+
+    output = concat_videos(segments, os.path.join(str(tmpdir), "output.mp4"))
+    assert abs(get_duration(output) - get_duration(source)) < 0.2
@@ -0,0 +1,36 @@
+from app.tasks.inference.tracker import Tracker
+
+
+def test_tracker_keeps_track_id_for_moving_box():
+    tracker = Tracker(iou_threshold=0.3, max_age=5)
+
+    _, first_ids = tracker.update([([0, 0, 20, 20], 0.9, 0)])
+    _, second_ids = tracker.update([([2, 0, 20, 20], 0.9, 0)])
+
+    assert first_ids == second_ids == [1]
+
+
+def test_tracker_predicts_between_keyframes():
+    tracker = Tracker(iou_threshold=0.3, max_age=10)
+    for x in range(0, 20, 4):
+        tracker.update([([x, 0, 20, 20], 0.9, 0)])
+
+    detections, track_ids = tracker.predict()
+
+    assert track_ids == [1]
+    assert detections[0][0][0] > 16, "등속 모델로 박스가 이동하지 않았습니다."
+    assert detections[0][2] == 0
+
+
+def test_tracker_separates_classes_and_drops_stale_tracks():
+    tracker = Tracker(iou_threshold=0.3, max_age=2)
+
+    _, track_ids = tracker.update([([0, 0, 20, 20], 0.9, 0), ([0, 0, 20, 20], 0.8, 1)])
+    assert track_ids == [1, 2], "다른 클래스의 검출이 같은 트랙으로 매칭되었습니다."
+
+    tracker.update([])
+    detections, _ = tracker.predict()
+    assert detections == [], "매칭되지 않은 트랙이 표시되었습니다."
+
+    tracker.predict()
+    assert tracker.tracks == [], "오래된 트랙이 제거되지 않았습니다."
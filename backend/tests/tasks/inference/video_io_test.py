@@ -0,0 +1,73 @@
+import os
+import pytest
+import numpy as np
+from app.tasks.inference.video_io import VideoInfo, open_video_reader, open_video_writer, output_extension, resolve_backend
+
+av = pytest.importorskip("av")
+
+
+@pytest.fixture
+def source_video(tmpdir):
+    """오디오 트랙이 있는 테스트용 mp4 (64x48, 10프레임)"""
+    path = os.path.join(str(tmpdir), "source.mp4")
+    container = av.open(path, mode='w')
+    video = container.add_stream('libx264', rate=10)
+    video.width, video.height, video.pix_fmt = 64, 48, 'yuv420p'
+    audio = container.add_stream('aac', rate=44100)
+
+    for i in range(10):
+        frame = np.full((48, 64, 3), i * 20, dtype=np.uint8)
+        for packet in video.encode(av.VideoFrame.from_ndarray(frame, format='bgr24')):
+            container.mux(packet)
+    for packet in video.encode():
+        container.mux(packet)
+
+    samples = np.zeros((1, 44100), dtype=np.float32)
+    audio_frame = av.AudioFrame.from_ndarray(samples, format='fltp', layout='mono')
+    audio_frame.sample_rate = 44100
+    for packet in audio.encode(audio_frame):
+        container.mux(packet)
+    for packet in audio.encode():
+        container.mux(packet)
+
+    container.close()
+    return path
+
+
+def test_resolve_backend():
+    assert resolve_backend('pyav') == 'pyav'
+    assert output_extension('pyav', '.avi') == '.mp4'
+    assert output_extension('opencv', '.avi') == '.avi'
+    with pytest.raises(ValueError):
+        resolve_backend('unknown')
+
+
+def test_pyav_round_trip_with_audio(tmpdir, source_video):
+    output_path = os.path.join(str(tmpdir), "output.mp4")
+
+    with open_video_reader(source_video, 'pyav') as reader:
+        assert (reader.info.width, reader.info.height) == (64, 48)
+        assert reader.info.fps == 10
+
+        with open_video_writer(output_path, reader.info, 'pyav', audio_source=source_video, crf=30, preset='ultrafast') as writer:
+            frames = 0
+            for frame in reader:
+                assert frame.shape == (48, 64, 3)
+                writer.write(frame)
+                frames += 1
+
+    assert frames == 10
+    with av.open(output_path) as container:
+        assert container.streams.video[0].codec_context.name == 'h264'
+        assert len(container.streams.audio) == 1, "오디오 트랙이 복사되지 않았습니다."
+        assert sum(1 for _ in container.decode(video=0)) == 10
+
+
+def test_pyav_writer_crops_odd_size(tmpdir):
+    output_path = os.path.join(str(tmpdir), "odd.mp4")
+
+    with open_video_writer(output_path, VideoInfo(fps=5, width=33, height=21), 'pyav') as writer:
+        writer.write(np.zeros((21, 33, 3), dtype=np.uint8))
+
+    with open_video_reader(output_path, 'pyav') as reader:
+        assert (reader.info.width, reader.info.height) == (32, 20)
@@ -0,0 +1,30 @@
+import pytest
+from app.tasks.main import app
+from app.config import (CELERY_TRAIN_QUEUE, CELERY_INFERENCE_QUEUE, CELERY_IO_QUEUE, CELERY_DEPLOY_QUEUE,
+                        INFERENCE_PHOTO_PRIORITY, INFERENCE_VIDEO_PRIORITY)
+
+
+def route(task_name: str) -> dict:
+    name = f"app.tasks.main.{task_name}"
+    return app.amqp.router.route({}, name, task_type=app.tasks[name])
+
+
+@pytest.mark.parametrize("task_name, queue", [
+    ("train_model_task", CELERY_TRAIN_QUEUE),
+    ("generate_inference_task", CELERY_INFERENCE_QUEUE),
+    ("generate_segment_task", CELERY_INFERENCE_QUEUE),
+    ("create_model_task", CELERY_IO_QUEUE),
+    ("valid_archive_task", CELERY_IO_QUEUE),
+    ("merge_segments_task", CELERY_IO_QUEUE),
+    ("collect_garbage_task", CELERY_IO_QUEUE),
+    ("deploy_model_task", CELERY_DEPLOY_QUEUE),
+    ("undeploy_model_task", CELERY_DEPLOY_QUEUE),
+])
+def test_task_routes(task_name, queue):
+    assert route(task_name)['queue'].name == queue
+
+
+def test_segment_priority_is_lower_than_single_inference():
+    # Redis broker는 값이 작을수록 먼저 처리
+    assert route("generate_segment_task")['priority'] > max(INFERENCE_PHOTO_PRIORITY, INFERENCE_VIDEO_PRIORITY), \
+        "분할 추론 구간이 단건 추론보다 먼저 처리됩니다."
@@ -0,0 +1,21 @@
+import os
+from app.tasks.train.create_ml_model import resolve_device, get_checkpoint_path
+
+
+def test_resolve_device_falls_back_to_cpu():
+    assert resolve_device('cuda:0', cuda_available=False) == 'cpu'
+    assert resolve_device('0,1', cuda_available=False) == 'cpu'
+
+
+def test_resolve_device_keeps_requested_device():
+    assert resolve_device('cuda:0', cuda_available=True) == 'cuda:0'
+    assert resolve_device('cpu', cuda_available=True) == 'cpu'
+
+
+def test_get_checkpoint_path():
+    assert get_checkpoint_path('/src/runs/example_v1') == os.path.join('/src/runs/example_v1', 'train', 'weights', 'last.pt')
+
+
+def test_resolve_device_auto():
+    assert resolve_device('auto', cuda_available=True) == '0'
+    assert resolve_device('auto', cuda_available=False) == 'cpu'
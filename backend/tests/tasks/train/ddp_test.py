@@ -0,0 +1,45 @@
+import os
+from app.tasks.train.ddp import is_ddp, read_last_epoch, find_ddp_processes
+
+
+def test_is_ddp():
+    assert is_ddp("0,1")
+    assert not is_ddp("0")
+    assert not is_ddp("cpu")
+    assert not is_ddp("0,")
+
+
+def test_read_last_epoch(tmp_path):
+    assert read_last_epoch(str(tmp_path)) is None
+
+    results = tmp_path / "results.csv"
+    results.write_text("epoch,train/box_loss\n")
+    assert read_last_epoch(str(tmp_path)) is None
+
+    results.write_text("epoch,train/box_loss\n1,0.5\n2,0.4\n")
+    assert read_last_epoch(str(tmp_path)) == 1
+
+
+def add_process(proc_dir, pid, ppid, args):
+    os.makedirs(proc_dir / str(pid))
+    (proc_dir / str(pid) / "stat").write_text(f"{pid} (python (x)) S {ppid} 1 1 0")
+    (proc_dir / str(pid) / "cmdline").write_bytes(b"\0".join(arg.encode() for arg in args) + b"\0")
+
+
+def test_find_ddp_processes(tmp_path):
+    proc_dir = tmp_path / "proc"
+    proc_dir.mkdir()
+    (proc_dir / "self").mkdir()
+
+    def ddp_script(name, project):
+        path = tmp_path / name
+        path.write_text(f"overrides = {{'project': {project!r}, 'name': 'train'}}")
+        return ["python", "-m", "torch.distributed.run", "--nproc_per_node", "2", str(path)]
+
+    add_process(proc_dir, 11, 10, ddp_script("a.py", "/runs/model_v1"))
+    add_process(proc_dir, 12, 10, ddp_script("b.py", "/runs/model_v10"))  # 같은 워커의 다른 학습
+    add_process(proc_dir, 13, 99, ddp_script("c.py", "/runs/model_v1"))  # 다른 워커
+    add_process(proc_dir, 14, 10, ["python", "other.py"])
+    add_process(proc_dir, 15, 10, ["python", "-m", "torch.distributed.run", str(tmp_path / "deleted.py")])
+
+    assert find_ddp_processes(repr("/runs/model_v1"), parent=10, proc_dir=str(proc_dir)) == [11]
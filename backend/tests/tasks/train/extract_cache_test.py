@@ -0,0 +1,54 @@
+import os
+import zipfile
+from app.tasks.train.extract_cache import extract_to_cache, prune_extract_cache, archive_cache_key, COMPLETE_MARKER
+
+
+def make_zip(path, content='image'):
+    with zipfile.ZipFile(path, 'w') as zipf:
+        zipf.writestr('images/train/image.jpg', content)
+    return str(path)
+
+
+def test_extract_to_cache_reuses_extracted_directory(tmp_path):
+    zip_file = make_zip(tmp_path / 'dataset.zip')
+    cache_dir = str(tmp_path / 'cache')
+
+    extract_dir = extract_to_cache(zip_file, cache_dir)
+    assert os.path.isfile(os.path.join(extract_dir, 'images', 'train', 'image.jpg'))
+    assert os.path.isfile(os.path.join(extract_dir, COMPLETE_MARKER))
+
+    os.remove(os.path.join(extract_dir, 'images', 'train', 'image.jpg'))
+    assert extract_to_cache(zip_file, cache_dir) == extract_dir
+    assert not os.path.exists(os.path.join(extract_dir, 'images', 'train', 'image.jpg')), "캐시를 재사용하지 않고 다시 압축 해제했습니다."
+    assert os.listdir(cache_dir) == [os.path.basename(extract_dir)]
+
+
+def test_extract_to_cache_replaces_incomplete_directory(tmp_path):
+    zip_file = make_zip(tmp_path / 'dataset.zip')
+    cache_dir = tmp_path / 'cache'
+    (cache_dir / archive_cache_key(zip_file)).mkdir(parents=True)  # 중단된 압축 해제 잔여물
+
+    extract_dir = extract_to_cache(zip_file, str(cache_dir))
+
+    assert os.path.isfile(os.path.join(extract_dir, 'images', 'train', 'image.jpg'))
+
+
+def test_archive_cache_key_changes_with_archive(tmp_path):
+    zip_file = make_zip(tmp_path / 'dataset.zip')
+    key = archive_cache_key(zip_file)
+
+    make_zip(tmp_path / 'dataset.zip', content='changed image')
+
+    assert archive_cache_key(zip_file) != key
+
+
+def test_prune_extract_cache(tmp_path):
+    cache_dir = str(tmp_path / 'cache')
+    old_dir = extract_to_cache(make_zip(tmp_path / 'old.zip'), cache_dir)
+    recent_dir = extract_to_cache(make_zip(tmp_path / 'recent.zip', content='recent'), cache_dir)
+    now = os.stat(os.path.join(old_dir, COMPLETE_MARKER)).st_mtime + 100
+    os.utime(os.path.join(recent_dir, COMPLETE_MARKER), (now, now))
+
+    assert prune_extract_cache(cache_dir, max_age=50, now=now) == 1
+    assert not os.path.exists(old_dir) and os.path.exists(recent_dir)
+    assert prune_extract_cache(str(tmp_path / 'missing'), max_age=50) == 0
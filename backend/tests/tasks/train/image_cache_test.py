@@ -0,0 +1,52 @@
+import os
+import pytest
+from app.tasks.train.image_cache import get_cache_path, resized_shape, link_file, prune_image_cache, resize_to_cache
+
+
+def test_get_cache_path():
+    assert get_cache_path('/cache', 'abcdef', 640, '.jpg') == os.path.join('/cache', '640', 'ab', 'abcdef.jpg')
+
+
+def test_resized_shape_keeps_aspect_ratio():
+    assert resized_shape(1080, 1920, 640) == (360, 640)
+    assert resized_shape(1920, 1080, 640) == (640, 360)
+    assert resized_shape(1000, 1000, 640) == (640, 640)
+
+
+def test_link_file_replaces_dest(tmp_path):
+    source, dest = tmp_path / 'source.jpg', tmp_path / 'dest.jpg'
+    source.write_bytes(b'resized')
+    dest.write_bytes(b'original')
+
+    link_file(str(source), str(dest))
+
+    assert dest.read_bytes() == b'resized'
+    assert os.stat(source).st_nlink == 2
+
+
+def test_prune_image_cache_removes_only_unlinked_old_files(tmp_path):
+    cache_dir = tmp_path / 'cache'
+    cache_dir.mkdir()
+    old, recent, linked = cache_dir / 'old.jpg', cache_dir / 'recent.jpg', cache_dir / 'linked.jpg'
+    for path in (old, recent, linked):
+        path.write_bytes(b'image')
+    os.link(linked, tmp_path / 'dataset.jpg')
+    now = os.stat(old).st_mtime + 100
+    os.utime(recent, (now, now))
+
+    assert prune_image_cache(str(cache_dir), max_age=50, now=now) == 1
+    assert not old.exists() and recent.exists() and linked.exists()
+    assert prune_image_cache(str(tmp_path / 'missing'), max_age=50) == 0
+
+
+def test_resize_to_cache(tmp_path):
+    cv2 = pytest.importorskip('cv2')
+    np = pytest.importorskip('numpy')
+    image_path = str(tmp_path / 'image.jpg')
+    cv2.imwrite(image_path, np.zeros((1080, 1920, 3), dtype=np.uint8))
+    cache_dir = str(tmp_path / 'cache')
+
+    cache_path, hit = resize_to_cache(image_path, 640, cache_dir)
+    assert not hit and cv2.imread(cache_path).shape[:2] == (360, 640)
+    assert resize_to_cache(image_path, 640, cache_dir) == (cache_path, True)
+    assert resize_to_cache(cache_path, 640, cache_dir) == (None, False)  # 이미 imgsz 이하
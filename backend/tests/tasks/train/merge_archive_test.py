@@ -5,7 +5,7 @@ import tempfile
 import yaml
 from app.tasks.train.merge_archive import (extract_zip_to_temp, get_label_dirs, copy_files, 
                          split_train_to_test, get_classes_from_yaml, update_label, merge_archive_files, find_yaml_path, load_data_yaml,
-                         create_output_dirs)
+                         create_output_dirs, load_merged_classes, link_files)
 
 @pytest.fixture
 def sample_zip_file():
@@ -31,6 +31,11 @@ def sample_zip_file():
     os.remove(temp_zip.name)
 
 
+@pytest.fixture
+def extract_cache_dir(tmp_path_factory):
+    return str(tmp_path_factory.mktemp('extract_cache'))
+
+
 def test_extract_zip_to_temp(sample_zip_file):
     temp_dir = extract_zip_to_temp(sample_zip_file)
     assert os.path.exists(temp_dir.name)
@@ -63,6 +68,11 @@ def test_copy_files(sample_zip_file, tmpdir):
     temp_dir.cleanup()
 
 
+def read_manifest(manifest_path):
+    with open(manifest_path, 'r', encoding='utf-8') as f:
+        return [os.path.basename(line) for line in f.read().split()]
+
+
 def test_split_train_to_test(tmpdir):
     merged_dirs = create_output_dirs(tmpdir)
 
@@ -70,10 +80,28 @@ def test_split_train_to_test(tmpdir):
         with open(os.path.join(merged_dirs['images']['train'], f'image_{i}.jpg'), 'w') as f:
             f.write('fake image content')
 
-    split_train_to_test(merged_dirs)
+    train_manifest, test_manifest = split_train_to_test(merged_dirs, tmpdir, seed=0)
 
-    assert len(os.listdir(merged_dirs['images']['test'])) == 1
-    assert len(os.listdir(merged_dirs['images']['train'])) == 9
+    assert len(read_manifest(test_manifest)) == 1
+    assert len(read_manifest(train_manifest)) == 9
+    assert set(read_manifest(train_manifest)) | set(read_manifest(test_manifest)) == set(os.listdir(merged_dirs['images']['train']))
+    assert len(os.listdir(merged_dirs['images']['train'])) == 10, "분할 시 이미지 파일을 옮기면 안 됩니다."
+    assert len(os.listdir(merged_dirs['images']['test'])) == 0
+
+    _, same_test_manifest = split_train_to_test(merged_dirs, tmpdir, seed=0)
+    assert read_manifest(same_test_manifest) == read_manifest(test_manifest), "같은 seed에서 분할 결과가 달라졌습니다."
+
+
+def test_split_train_to_test_keeps_rare_class_in_test(tmpdir):
+    merged_dirs = create_output_dirs(tmpdir)
+    label_classes = {}
+    for i in range(20):
+        open(os.path.join(merged_dirs['images']['train'], f'image_{i}.jpg'), 'w').close()
+        label_classes[f'image_{i}'] = {'common', 'rare'} if i < 3 else {'common'}
+
+    _, test_manifest = split_train_to_test(merged_dirs, tmpdir, label_classes=label_classes, stratify=True)
+
+    assert any(label_classes[os.path.splitext(image)[0]] == {'common', 'rare'} for image in read_manifest(test_manifest))
 
 
 def test_update_label(sample_zip_file, tmpdir):
@@ -98,14 +126,75 @@ def test_update_label(sample_zip_file, tmpdir):
     temp_dir.cleanup()
 
 
-def test_merge_archive_files(sample_zip_file, tmpdir):
-    merge_archive_files([sample_zip_file], tmpdir)
+def test_merge_archive_files_splits_with_manifest(tmpdir, extract_cache_dir):
+    temp_zip = os.path.join(tmpdir, 'no_test.zip')
+    with zipfile.ZipFile(temp_zip, 'w') as zipf:
+        zipf.writestr('data.yaml', yaml.dump({'train': 'images/train', 'val': 'images/val', 'names': ['class1'], 'nc': 1}))
+        for i in range(10):
+            zipf.writestr(f'images/train/image_{i}.jpg', f'image {i}')
+            zipf.writestr(f'labels/train/image_{i}.txt', '0 0.5 0.5 1 1')
+        zipf.writestr('images/val/image_val.jpg', 'image val')
+        zipf.writestr('labels/val/image_val.txt', '0 0.5 0.5 1 1')
+
+    output_dir = os.path.join(tmpdir, 'merged')
+    result, _ = merge_archive_files([temp_zip], output_dir, extract_cache_dir=extract_cache_dir)
+
+    assert result
+    data = load_data_yaml(os.path.join(output_dir, 'data.yaml'))
+    assert data['train'] == 'train.txt' and data['test'] == 'test.txt'
+    assert len(read_manifest(os.path.join(output_dir, 'test.txt'))) == 1
+
+
+def test_merge_archive_files(sample_zip_file, tmpdir, extract_cache_dir):
+    merge_archive_files([sample_zip_file], tmpdir, extract_cache_dir=extract_cache_dir)
 
     assert os.path.exists(os.path.join(tmpdir, 'data.yaml'))
     for split in ['train', 'val', 'test']:
         assert os.path.exists(os.path.join(tmpdir, 'labels', split, 'classes.txt'))
 
 
+def test_link_files(sample_zip_file, tmpdir):
+    temp_dir = extract_zip_to_temp(sample_zip_file)
+    merged_dirs = create_output_dirs(tmpdir)
+
+    link_files(os.path.join(temp_dir.name, 'images', 'train'), merged_dirs['images']['train'], "test_prefix")
+
+    linked_image_path = os.path.join(merged_dirs['images']['train'], "test_prefix_sample_image_1.jpg")
+    assert os.path.islink(linked_image_path)
+    assert os.path.realpath(linked_image_path) == os.path.realpath(os.path.join(temp_dir.name, 'images', 'train', 'sample_image_1.jpg'))
+
+    temp_dir.cleanup()
+
+
+@pytest.mark.parametrize('merge_mode', ['link', 'copy'])
+def test_merge_archive_files_writes_manifests(sample_zip_file, tmpdir, extract_cache_dir, merge_mode):
+    result, _ = merge_archive_files([sample_zip_file, sample_zip_file], tmpdir, merge_mode=merge_mode, extract_cache_dir=extract_cache_dir)
+
+    assert result
+    data = load_data_yaml(os.path.join(tmpdir, 'data.yaml'))
+    for split in ['train', 'val', 'test']:
+        assert data[split] == f'{split}.txt'
+        with open(os.path.join(tmpdir, data[split]), 'r', encoding='utf-8') as f:
+            images = f.read().split()
+        assert len(images) == 2, "중복된 아카이브의 이미지가 모두 포함되어야 합니다."
+        for image in images:
+            image_path = os.path.join(tmpdir, image)
+            assert os.path.isfile(image_path)
+            assert os.path.islink(image_path) == (merge_mode == 'link')
+            label_path = os.path.splitext(image_path.replace(os.sep + 'images' + os.sep, os.sep + 'labels' + os.sep))[0] + '.txt'
+            assert os.path.isfile(label_path) and not os.path.islink(label_path)
+
+    assert len(os.listdir(extract_cache_dir)) == (1 if merge_mode == 'link' else 0)
+
+
+def test_load_merged_classes(sample_zip_file, tmpdir, extract_cache_dir):
+    assert load_merged_classes(tmpdir) is None, "병합 전 디렉터리에서 클래스 목록을 반환했습니다."
+
+    _, total_classes = merge_archive_files([sample_zip_file], tmpdir, extract_cache_dir=extract_cache_dir)
+
+    assert load_merged_classes(tmpdir) == list(total_classes)
+
+
 
 if __name__ == '__main__':
     current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -117,6 +206,6 @@ if __name__ == '__main__':
     if not os.path.exists(output_dir):
         os.makedirs(output_dir)
 
-    merge_archive_files(zip_files, output_dir)
+    merge_archive_files(zip_files, output_dir, merge_mode='copy')
 
     print(f"Files merged into {output_dir}")
@@ -0,0 +1,48 @@
+from app.tasks.train.split_dataset import select_test_images, split_images, stratum_of
+from collections import Counter
+
+
+IMAGES = [f'image_{i}.jpg' for i in range(100)]
+
+
+def test_select_test_images_is_deterministic_per_seed():
+    first = select_test_images(IMAGES, seed=1, ratio=0.1, stratify=False)
+
+    assert len(first) == 10
+    assert select_test_images(list(reversed(IMAGES)), seed=1, ratio=0.1, stratify=False) == first
+    assert select_test_images(IMAGES, seed=2, ratio=0.1, stratify=False) != first
+
+
+def test_select_test_images_uses_content_key():
+    """파일명이 달라도 내용이 같으면 같은 분할"""
+    keys = {image: f'content_{i}' for i, image in enumerate(IMAGES)}
+    renamed = [f'prefix_{image}' for image in IMAGES]
+    renamed_keys = {f'prefix_{image}': key for image, key in keys.items()}
+
+    selected = select_test_images(IMAGES, image_keys=keys, seed=0, ratio=0.1, stratify=False)
+    renamed_selected = select_test_images(renamed, image_keys=renamed_keys, seed=0, ratio=0.1, stratify=False)
+
+    assert {f'prefix_{image}' for image in selected} == renamed_selected
+
+
+def test_select_test_images_stratified():
+    image_classes = {image: {'rare'} if i < 5 else {'common'} for i, image in enumerate(IMAGES)}
+    image_classes['single.jpg'] = {'single'}
+
+    selected = select_test_images(IMAGES + ['single.jpg'], image_classes=image_classes, seed=0, ratio=0.1, stratify=True)
+
+    assert sum(image_classes[image] == {'rare'} for image in selected) == 1
+    assert sum(image_classes[image] == {'common'} for image in selected) == 10
+    assert 'single.jpg' not in selected, "이미지가 하나뿐인 클래스는 train에 남아야 합니다."
+
+
+def test_stratum_of_uses_rarest_class():
+    counts = Counter({'common': 10, 'rare': 2})
+    assert stratum_of({'common', 'rare'}, counts) == 'rare'
+    assert stratum_of(set(), counts) == ''
+
+
+def test_split_images_preserves_order():
+    train, test = split_images(IMAGES, seed=0, ratio=0.1, stratify=False)
+    assert len(train) + len(test) == len(IMAGES)
+    assert train == [image for image in IMAGES if image not in test]
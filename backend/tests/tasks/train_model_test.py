@@ -0,0 +1,182 @@
+import os
+import time
+import asyncio
+import pytest
+from types import SimpleNamespace
+from app.tasks import main
+from app.tasks.cancel import TaskCancelled
+from app.tasks.train.create_ml_model import TrainingFailed, get_checkpoint_path
+
+
+class FakeSyncRedis:
+    def __init__(self):
+        self.expired = []
+
+    def set(self, key, value):
+        pass
+
+    def expire(self, key, ttl):
+        self.expired.append(key)
+
+    def scan(self, cursor, match=None, count=None):
+        return 0, []
+
+    def delete(self, *keys):
+        pass
+
+
+class FakeRedis:
+    def __init__(self):
+        self.keys = set()
+
+    async def set(self, key, value, nx=False, ex=None):
+        if nx and key in self.keys:
+            return False
+        self.keys.add(key)
+        return True
+
+    async def exists(self, *keys):
+        return sum(key in self.keys for key in keys)
+
+    async def delete(self, *keys):
+        self.keys.difference_update(keys)
+
+
+class FakeSession:
+    async def commit(self):
+        pass
+
+
+class FakeMlService:
+    def __init__(self, run_dir):
+        self.redis = FakeRedis()
+        self.session = FakeSession()
+        self.run_dir = run_dir
+        self.statuses = []
+        self.updated = []
+
+    async def get_model_by_name(self, model_name):
+        return {"id": 1, "status": "running", "run_dir": self.run_dir,
+                "base_model": {"model_file": {"filepath": "yolov10s.pt"}}}
+
+    async def update_status(self, model_id, status):
+        self.statuses.append(status)
+
+    async def update_training_run(self, model_id, **fields):
+        pass
+
+    async def update_model(self, ai_model_dto, status):
+        self.updated.append(ai_model_dto)
+        self.statuses.append(status)
+
+
+@pytest.fixture
+def sync_redis(monkeypatch):
+    redis = FakeSyncRedis()
+    monkeypatch.setattr(main, "get_worker_context", lambda: SimpleNamespace(sync_redis=redis))
+    return redis
+
+
+@pytest.fixture
+def run_dir(tmp_path, sync_redis):
+    return str(tmp_path / "test_model_v1")
+
+
+def fake_training(result):
+    # 체크포인트를 남긴 뒤 결과 반환 (또는 예외)
+    def create_yolo_model(output_dir, **kwargs):
+        os.makedirs(os.path.dirname(get_checkpoint_path(output_dir)), exist_ok=True)
+        open(get_checkpoint_path(output_dir), "wb").close()
+        if isinstance(result, Exception):
+            raise result
+        return result
+    return create_yolo_model
+
+
+def train(ml_service, run_dir, retry):
+    return asyncio.run(main.train_model(ml_service, "test_model", "pt", 1, run_dir, ["truck"], {"device": "cpu"}, retry=retry))
+
+
+def test_train_model_keeps_run_dir_when_retried(run_dir, monkeypatch):
+    monkeypatch.setattr(main, "create_yolo_model", fake_training((False, None)))
+    ml_service = FakeMlService(run_dir)
+
+    with pytest.raises(TrainingFailed):
+        train(ml_service, run_dir, retry=True)
+
+    assert os.path.exists(get_checkpoint_path(run_dir)), "재시도할 학습의 체크포인트가 삭제되었습니다."
+    assert ml_service.statuses == []
+    assert not ml_service.redis.keys, "학습 잠금이 해제되지 않았습니다."
+
+
+def test_train_model_marks_failed_without_retry(run_dir, monkeypatch):
+    monkeypatch.setattr(main, "create_yolo_model", fake_training((False, None)))
+    ml_service = FakeMlService(run_dir)
+
+    assert train(ml_service, run_dir, retry=False) is False
+    assert ml_service.statuses == ["failed"]
+    assert os.path.exists(run_dir)
+
+
+def test_train_model_removes_run_dir_on_success(run_dir, monkeypatch):
+    model_info = {"model_name": "test_model", "version": 1, "model_path": "best.pt"}
+    monkeypatch.setattr(main, "create_yolo_model", fake_training((True, model_info)))
+    ml_service = FakeMlService(run_dir)
+
+    assert train(ml_service, run_dir, retry=True) is True
+    assert ml_service.statuses == ["complete"]
+    assert not os.path.exists(run_dir)
+
+
+def test_train_model_removes_run_dir_on_cancel(run_dir, monkeypatch):
+    monkeypatch.setattr(main, "create_yolo_model", fake_training(TaskCancelled("cancel:train:1")))
+    ml_service = FakeMlService(run_dir)
+    monkeypatch.setattr(main, "clear_cancel", lambda redis, key: asyncio.sleep(0))
+
+    assert train(ml_service, run_dir, retry=True) is False
+    assert ml_service.statuses == ["cancelled"]
+    assert not os.path.exists(run_dir)
+
+
+def test_train_model_extends_lock_without_epoch_callbacks(run_dir, sync_redis, monkeypatch):
+    # DDP 학습은 epoch 콜백이 부모 프로세스에서 호출되지 않으므로 heartbeat로 잠금을 연장
+    model_info = {"model_name": "test_model", "version": 1, "model_path": "best.pt"}
+
+    def create_yolo_model(**kwargs):
+        time.sleep(0.2)
+        return True, model_info
+
+    monkeypatch.setattr(main, "TRAIN_HEARTBEAT_SECONDS", 0.01)
+    monkeypatch.setattr(main, "create_yolo_model", create_yolo_model)
+
+    assert train(FakeMlService(run_dir), run_dir, retry=True) is True
+    assert f"{main.TRAIN_LOCK_PREFIX}test_model" in sync_redis.expired
+
+
+def test_train_model_task_counts_training_retries(monkeypatch):
+    calls, retries = [], []
+    monkeypatch.setattr(main, "with_service", lambda service_class, func, **kwargs: kwargs)
+
+    def run(kwargs):
+        calls.append(kwargs)
+        raise TrainingFailed()
+
+    def retry(**kwargs):
+        retries.append(kwargs)
+        return RuntimeError()
+
+    monkeypatch.setattr(main, "run_in_worker_loop", run)
+    monkeypatch.setattr(main.train_model_task, "retry", retry)
+    args = ("test_model", "pt", 1, "/tmp/run", ["truck"])
+
+    main.train_model_task.push_request(kwargs={})
+    try:
+        with pytest.raises(RuntimeError):
+            main.train_model_task.run(*args)
+        with pytest.raises(RuntimeError):
+            main.train_model_task.run(*args, attempt=main.TRAIN_MAX_RETRIES)
+    finally:
+        main.train_model_task.pop_request()
+
+    assert [call['retry'] for call in calls] == [True, False]
+    assert retries[0]['kwargs'] == {'attempt': 1}
@@ -0,0 +1,41 @@
+import asyncio
+import threading
+import pytest
+from app.tasks.worker import get_worker_context, close_worker_context, run_in_worker_loop
+
+
+@pytest.fixture
+def worker_context():
+    context = get_worker_context()
+    yield context
+    close_worker_context()
+
+
+def test_get_worker_context_is_shared(worker_context):
+    assert get_worker_context() is worker_context
+
+
+def test_run_in_worker_loop_uses_single_loop(worker_context):
+    async def current_loop():
+        return asyncio.get_running_loop()
+
+    loops = []
+
+    def run():
+        loops.append(run_in_worker_loop(current_loop()))
+
+    threads = [threading.Thread(target=run) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(loops) == 4
+    assert all(loop is worker_context.loop for loop in loops), "task마다 다른 이벤트 루프가 사용되었습니다."
+
+
+def test_close_worker_context(worker_context):
+    close_worker_context()
+
+    assert worker_context.loop.is_closed()
+    assert get_worker_context() is not worker_context